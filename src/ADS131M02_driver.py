@@ -6,9 +6,62 @@ Minimal implementation for register read/write, sampling rate, continuous sampli
 
 import spidev
 import time
+import threading
+import binascii
+import ctypes
+import fcntl
+import struct
 import RPi.GPIO as GPIO
 import argparse
-from typing import List, Optional
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+
+
+class _SpiIocTransfer(ctypes.Structure):
+    """struct spi_ioc_transfer from linux/spi/spidev.h"""
+    _fields_ = [
+        ('tx_buf', ctypes.c_uint64),
+        ('rx_buf', ctypes.c_uint64),
+        ('len', ctypes.c_uint32),
+        ('speed_hz', ctypes.c_uint32),
+        ('delay_usecs', ctypes.c_uint16),
+        ('bits_per_word', ctypes.c_uint8),
+        ('cs_change', ctypes.c_uint8),
+        ('tx_nbits', ctypes.c_uint8),
+        ('rx_nbits', ctypes.c_uint8),
+        ('word_delay_usecs', ctypes.c_uint8),
+        ('pad', ctypes.c_uint8),
+    ]
+
+
+# Big-endian 32-bit read; the top 24 bits hold one channel sample
+_UNPACK_U32_BE = struct.Struct('>I').unpack_from
+
+
+def _decode_channels(frame) -> Tuple[int, int]:
+    """
+    Decode signed 24-bit channel 0/1 data from a 12-byte data frame
+    (bytes 4-6 and 7-9)
+    """
+    ch0 = _UNPACK_U32_BE(frame, 4)[0] >> 8
+    ch1 = _UNPACK_U32_BE(frame, 7)[0] >> 8
+    # Branchless sign extension from 24 bits
+    return ch0 - ((ch0 & 0x800000) << 1), ch1 - ((ch1 & 0x800000) << 1)
+
+
+def _crc16_ccitt(data: bytes) -> int:
+    """
+    CRC-16-CCITT (poly 0x1021, seed 0xFFFF) as used by the ADS131M02 SPI CRC
+    (table-driven C implementation from binascii)
+    """
+    return binascii.crc_hqx(data, 0xFFFF)
+
+
+def _spi_ioc_message(n: int) -> int:
+    """Return the SPI_IOC_MESSAGE(n) ioctl request number"""
+    # _IOW(SPI_IOC_MAGIC, 0, char[n * sizeof(struct spi_ioc_transfer)])
+    return (1 << 30) | ((n * ctypes.sizeof(_SpiIocTransfer)) << 16) | (ord('k') << 8)
+
 
 class ADS131M02:
     # Command definitions
@@ -42,6 +95,9 @@ class ADS131M02:
     REG_CH1_GCAL_LSB = 0x12
     REG_REGMAP_CRC = 0x3E
     
+    # MODE register bits
+    MODE_RX_CRC_EN = 0x1000  # Input (command) CRC check enable
+    
     # Gain values
     GAIN_1 = 0b000
     GAIN_2 = 0b001
@@ -62,7 +118,37 @@ class ADS131M02:
     OSR_8192 = 0b110  # 1 kSPS
     OSR_16384 = 0b111 # 0.5 kSPS (highest resolution)
     
-    def __init__(self, spi_bus=0, spi_device=0, cs_pin=None, drdy_pin=None, reset_pin=None, vref=1.2):
+    # Delay after a CLOCK register (OSR) change, in microseconds
+    CLOCK_SETTLING_US = 1000
+    
+    # Static command frames (built once at class load)
+    _NULL_FRAME_6 = bytes(6)
+    _NULL_FRAME_12 = bytes(12)
+    
+    # Max bytes per SPI_IOC_MESSAGE batch (spidev default bufsiz)
+    _SPI_BATCH_MAX_BYTES = 4096
+    
+    # RREG command frame for every known register (plain and with input CRC)
+    _RREG_FRAMES = {}
+    _RREG_FRAMES_CRC = {}
+    for _reg in (REG_ID, REG_STATUS, REG_MODE, REG_CLOCK, REG_GAIN, REG_CFG,
+                 REG_THRSH_MSB, REG_THRSH_LSB,
+                 REG_CH0_CFG, REG_CH0_OCAL_MSB, REG_CH0_OCAL_LSB, REG_CH0_GCAL_MSB, REG_CH0_GCAL_LSB,
+                 REG_CH1_CFG, REG_CH1_OCAL_MSB, REG_CH1_OCAL_LSB, REG_CH1_GCAL_MSB, REG_CH1_GCAL_LSB,
+                 REG_REGMAP_CRC):
+        _cmd = CMD_RREG | ((_reg & 0x1F) << 7) | 0x01  # Read 1 register
+        _RREG_FRAMES[_reg] = bytes(((_cmd >> 8) & 0xFF, _cmd & 0xFF, 0, 0, 0, 0))
+        _crc = _crc16_ccitt(_RREG_FRAMES[_reg][:2])
+        _RREG_FRAMES_CRC[_reg] = bytes(((_cmd >> 8) & 0xFF, _cmd & 0xFF, (_crc >> 8) & 0xFF, _crc & 0xFF, 0, 0))
+    # NULL frames with input CRC: once MODE.RX_CRC_EN is set the device checks
+    # the CRC word of every frame, not just RREG/WREG
+    _crc = _crc16_ccitt(bytes(2))
+    _NULL_FRAME_6_CRC = bytes((0, 0, (_crc >> 8) & 0xFF, _crc & 0xFF, 0, 0))
+    _NULL_FRAME_12_CRC = _NULL_FRAME_6_CRC + bytes(6)
+    del _reg, _cmd, _crc
+    
+    def __init__(self, spi_bus=0, spi_device=0, cs_pin=None, drdy_pin=None, reset_pin=None, vref=1.2,
+                 drdy_timeout=0.01, spi_speed_hz=20000000):
         """
         Initialize ADS131M02
         
@@ -73,84 +159,251 @@ class ADS131M02:
             drdy_pin: Data ready pin (optional)
             reset_pin: Reset pin (optional)
             vref: Reference voltage in volts (default 2.5V)
+            drdy_timeout: Max time in seconds to wait for a DRDY edge (default 10ms)
+            spi_speed_hz: SCLK frequency in Hz (default 20 MHz, device max is 25 MHz)
         """
         self.spi = spidev.SpiDev()
         self.spi.open(spi_bus, spi_device)
         
         # SPI configuration for ADS131M02
-        self.spi.max_speed_hz = 8000000  # 1 MHz
+        self.spi_speed_hz = spi_speed_hz
+        self.spi.max_speed_hz = spi_speed_hz
         self.spi.mode = 0b01  # CPOL=0, CPHA=1
         self.spi.bits_per_word = 8
+        self.spi.lsbfirst = False
+        
+        # Preallocated single-frame transfer for per-sample reads; the kernel
+        # writes the response straight into _frame_rx (no list of ints)
+        self._frame_tx = (ctypes.c_uint8 * 12)()  # NULL command, see _set_input_crc
+        self._frame_rx = (ctypes.c_uint8 * 12)()
+        self._frame_rx_view = memoryview(self._frame_rx).cast('B')
+        self._frame_xfer = _SpiIocTransfer(tx_buf=ctypes.addressof(self._frame_tx),
+                                           rx_buf=ctypes.addressof(self._frame_rx),
+                                           len=12, speed_hz=spi_speed_hz, bits_per_word=8)
+        self._frame_request = _spi_ioc_message(1)
+        
+        # Reusable buffers and transfer descriptors for _spi_batch
+        self._batch_tx = ctypes.create_string_buffer(self._SPI_BATCH_MAX_BYTES)
+        self._batch_rx = ctypes.create_string_buffer(self._SPI_BATCH_MAX_BYTES)
+        self._batch_xfers = (_SpiIocTransfer * (self._SPI_BATCH_MAX_BYTES // 6))()
+        for xfer in self._batch_xfers:
+            xfer.speed_hz = spi_speed_hz
+            xfer.bits_per_word = 8
+        
+        # RX buffer for read_data_raw_block, grown on demand and then reused
+        self._block_rx = bytearray()
         
         self.cs_pin = cs_pin
         self.drdy_pin = drdy_pin
         self.reset_pin = reset_pin
         self.vref = vref
-        self.channel_gains = [1, 1]  # Track gain for each channel for voltage conversion
-        self.dc_block_enabled = [False, False]  # Track DC blocking filter state for each channel
+        # Per-channel state kept in separate attributes (fixed 2 channels)
+        self.gain0 = 1  # Track gain for each channel for voltage conversion
+        self.gain1 = 1
+        self._scale0 = vref / 8388608.0  # Volts per ADC code: VREF / (8388608 * gain)
+        self._scale1 = vref / 8388608.0
+        self.dc_block0 = False  # Track DC blocking filter state for each channel
+        self.dc_block1 = False
+        self.drdy_timeout = drdy_timeout
+        self._reg_cache = {}  # Shadow copy of register values written/read since reset
+        self._drdy_event = threading.Event()  # Set by the DRDY falling-edge callback
         
         # Setup GPIO pins if provided
-        if any([cs_pin, drdy_pin, reset_pin]):
+        self._uses_gpio = bool(cs_pin or drdy_pin or reset_pin)
+        if self._uses_gpio:
             GPIO.setmode(GPIO.BCM)
             
         if cs_pin:
             GPIO.setup(cs_pin, GPIO.OUT)
             GPIO.output(cs_pin, GPIO.HIGH)
+            # Boards that route CS to a plain GPIO need it toggled around every transfer
+            self._spi_transfer = self._spi_transfer_manual_cs
+            self._spi_write = self._spi_write_manual_cs
+        else:
+            # Hardware CS (CE0/CE1) is asserted by the SPI controller itself
+            self.spi.no_cs = False
+            self.spi.cshigh = False
             
         if drdy_pin:
             GPIO.setup(drdy_pin, GPIO.IN)
+            # DRDY is active LOW: a falling edge means a new conversion is ready
+            GPIO.add_event_detect(drdy_pin, GPIO.FALLING, callback=self._on_drdy)
             
         if reset_pin:
             GPIO.setup(reset_pin, GPIO.OUT)
             GPIO.output(reset_pin, GPIO.HIGH)
             
         self.continuous_mode = False
+        self._set_input_crc(False)
+        
+    @property
+    def channel_gains(self) -> Tuple[int, int]:
+        """Gain of (channel0, channel1)"""
+        return self.gain0, self.gain1
+        
+    @property
+    def dc_block_enabled(self) -> Tuple[bool, bool]:
+        """DC blocking filter state of (channel0, channel1)"""
+        return self.dc_block0, self.dc_block1
+        
+    def _set_input_crc(self, enabled: bool):
+        """
+        Record the MODE.RX_CRC_EN state and switch the preallocated NULL frame
+        (_frame_tx, used by every data read) to match
+        """
+        self.input_crc_enabled = enabled  # Append CRC to command frames (MODE.RX_CRC_EN)
+        ctypes.memmove(self._frame_tx, self._NULL_FRAME_12_CRC if enabled else self._NULL_FRAME_12, 12)
+        
+    def _on_drdy(self, channel):
+        """DRDY falling-edge callback (runs in the RPi.GPIO event thread)"""
+        self._drdy_event.set()
+        
+    def _wait_drdy(self) -> bool:
+        """
+        Block until the next DRDY edge, or return immediately if no DRDY pin
+        
+        Returns:
+            True if data is ready, False if drdy_timeout elapsed first
+        """
+        if not self.drdy_pin:
+            return True
+        if not self._drdy_event.wait(self.drdy_timeout):
+            return False
+        self._drdy_event.clear()
+        return True
+        
+    def _spi_transfer(self, data: bytes) -> List[int]:
+        """
+        Perform SPI transfer using the controller's hardware CS
+        """
+        # Explicit speed, zero inter-transfer delay and 8-bit words
+        return self.spi.xfer2(data, self.spi_speed_hz, 0, 8)
+        
+    def _spi_transfer_manual_cs(self, data: bytes) -> List[int]:
+        """
+        Perform SPI transfer with manual CS control on cs_pin
+        """
+        GPIO.output(self.cs_pin, GPIO.LOW)
+        result = self.spi.xfer2(data, self.spi_speed_hz, 0, 8)
+        GPIO.output(self.cs_pin, GPIO.HIGH)
+        return result
+        
+    def _spi_read_frame(self) -> memoryview:
+        """
+        Clock one 12-byte NULL frame through the preallocated transfer
+        
+        Returns:
+            memoryview of the receive buffer (overwritten by the next read)
+        """
+        if self.cs_pin:
+            GPIO.output(self.cs_pin, GPIO.LOW)
+        fcntl.ioctl(self.spi.fileno(), self._frame_request, self._frame_xfer)
+        if self.cs_pin:
+            GPIO.output(self.cs_pin, GPIO.HIGH)
+        return self._frame_rx_view
         
-    def _spi_transfer(self, data: List[int]) -> List[int]:
+    def _spi_batch(self, frames: Sequence[bytes]) -> bytes:
         """
-        Perform SPI transfer with optional manual CS control
+        Submit several SPI frames in a single SPI_IOC_MESSAGE ioctl
+        
+        With hardware CS, CS is released between frames (cs_change); with
+        manual CS the whole batch runs inside one CS-low window.
+        
+        Args:
+            frames: Frames to transmit, in order (at most _SPI_BATCH_MAX_BYTES
+                in total, each at least 6 bytes)
+            
+        Returns:
+            Received bytes of all frames, concatenated
         """
+        tx_data = b''.join(frames)
+        total = len(tx_data)
+        if total > self._SPI_BATCH_MAX_BYTES:
+            raise ValueError(f"SPI batch of {total} bytes exceeds {self._SPI_BATCH_MAX_BYTES}")
+        ctypes.memmove(self._batch_tx, tx_data, total)
+        tx_addr = ctypes.addressof(self._batch_tx)
+        rx_addr = ctypes.addressof(self._batch_rx)
+        
+        xfers = self._batch_xfers
+        offset = 0
+        for xfer, frame in zip(xfers, frames):
+            xfer.tx_buf = tx_addr + offset
+            xfer.rx_buf = rx_addr + offset
+            xfer.len = len(frame)
+            xfer.cs_change = 1
+            offset += len(frame)
+        xfers[len(frames) - 1].cs_change = 0  # Don't leave CS asserted after the last frame
+        
         if self.cs_pin:
             GPIO.output(self.cs_pin, GPIO.LOW)
             
-        result = self.spi.xfer2(data)
+        fcntl.ioctl(self.spi.fileno(), _spi_ioc_message(len(frames)), xfers)
         
         if self.cs_pin:
             GPIO.output(self.cs_pin, GPIO.HIGH)
             
-        return result
+        return ctypes.string_at(rx_addr, total)
         
-    def _create_command_frame(self, command: int, data: List[int] = None) -> List[int]:
+    def _spi_write(self, data: bytes):
+        """
+        Perform a write-only SPI transfer using the controller's hardware CS
+        (no RX buffer is allocated or copied back to Python)
+        """
+        self.spi.writebytes2(data)
+        
+    def _spi_write_manual_cs(self, data: bytes):
+        """
+        Perform a write-only SPI transfer with manual CS control on cs_pin
+        """
+        GPIO.output(self.cs_pin, GPIO.LOW)
+        self.spi.writebytes2(data)
+        GPIO.output(self.cs_pin, GPIO.HIGH)
+        
+    def _create_command_frame(self, command: int, data: bytes = None) -> bytearray:
         """
         Create a command frame for SPI transmission
         Frame format: [CMD_MSB, CMD_LSB, DATA0, DATA1, ...]
         """
-        frame = [
+        frame = bytearray((
             (command >> 8) & 0xFF,  # Command MSB
             command & 0xFF          # Command LSB
-        ]
+        ))
         
         if data:
             frame.extend(data)
             
+        if self.input_crc_enabled:
+            self._append_crc(frame)
+            
         # Pad frame to minimum length (6 bytes for ADS131M02)
-        while len(frame) < 6:
-            frame.append(0x00)
+        if len(frame) < 6:
+            frame.extend(bytes(6 - len(frame)))
             
         return frame
         
+    @staticmethod
+    def _append_crc(frame: bytearray) -> bytearray:
+        """
+        Append the CRC-16-CCITT word of the frame contents so far (MSB first)
+        """
+        crc = _crc16_ccitt(frame)
+        frame.extend(((crc >> 8) & 0xFF, crc & 0xFF))
+        return frame
+        
     def reset(self):
         """Reset the device"""
+        self._reg_cache.clear()
         if self.reset_pin:
             GPIO.output(self.reset_pin, GPIO.LOW)
             time.sleep(0.001)  # 1ms pulse
             GPIO.output(self.reset_pin, GPIO.HIGH)
             time.sleep(0.01)   # Wait for reset
         else:
-            # Software reset
+            # Software reset, framed with the CRC word if RX_CRC_EN is still set
             frame = self._create_command_frame(self.CMD_RESET)
-            self._spi_transfer(frame)
+            self._spi_write(frame)
             time.sleep(0.01)
+        self._set_input_crc(False)  # RX_CRC_EN is cleared by reset
             
     def read_register(self, reg_addr: int) -> int:
         """
@@ -162,16 +415,15 @@ class ADS131M02:
         Returns:
             Register value (16-bit)
         """
-        # Create read register command
-        cmd = self.CMD_RREG | ((reg_addr & 0x1F) << 7) | 0x01  # Read 1 register
-        frame = self._create_command_frame(cmd)
+        # Read register command followed by a NULL frame, submitted as one
+        # ioctl so the RREG response arrives in the second frame
+        frame = (self._RREG_FRAMES_CRC if self.input_crc_enabled else self._RREG_FRAMES).get(reg_addr)
+        if frame is None:
+            cmd = self.CMD_RREG | ((reg_addr & 0x1F) << 7) | 0x01  # Read 1 register
+            frame = self._create_command_frame(cmd)
         
-        # Send command
-        self._spi_transfer(frame)
-        
-        # Read response in next frame
-        response_frame = self._create_command_frame(self.CMD_NULL)
-        response = self._spi_transfer(response_frame)
+        null_frame = self._NULL_FRAME_6_CRC if self.input_crc_enabled else self._NULL_FRAME_6
+        response = self._spi_batch((frame, null_frame))[len(frame):]
         
         # Extract register data from response (bytes 3-4 for ADS131M02)
         # Response format: [Status_MSB, Status_LSB, Register_MSB, Register_LSB, CRC]
@@ -181,21 +433,66 @@ class ADS131M02:
         else:
             return 0
             
-    def write_register(self, reg_addr: int, value: int):
+    def write_register(self, reg_addr: int, value: int, settling_us: int = 0):
         """
         Write a single register
         
         Args:
             reg_addr: Register address to write
             value: 16-bit value to write
+            settling_us: Time in microseconds to wait after the write (default 0,
+                the register takes effect on the next frame)
         """
-        # Create write register command
-        cmd = self.CMD_WREG | ((reg_addr & 0x1F) << 7) | 0x01  # Write 1 register
-        data = [(value >> 8) & 0xFF, value & 0xFF]
+        self.write_registers(reg_addr, (value,), settling_us)
+        
+    def write_registers(self, start_addr: int, values: Sequence[int], settling_us: int = 0):
+        """
+        Write consecutive registers with a single WREG command
+        
+        Framing follows the single-register reads and writes this driver has
+        always used on the hardware: the count field holds the number of
+        registers (0x01 for one, as in _RREG_FRAMES), data goes out as 2-byte
+        words and the frame is padded to at least 6 bytes.
+        
+        Args:
+            start_addr: Address of the first register to write
+            values: 16-bit values for start_addr, start_addr + 1, ...
+            settling_us: Time in microseconds to wait after the write (default 0)
+        """
+        if not values:
+            return
+            
+        cmd = self.CMD_WREG | ((start_addr & 0x1F) << 7) | (len(values) & 0x7F)
+        data = bytearray()
+        for value in values:
+            data.extend(((value >> 8) & 0xFF, value & 0xFF))
         frame = self._create_command_frame(cmd, data)
         
-        self._spi_transfer(frame)
-        time.sleep(0.001)  # Small delay after write
+        self._spi_write(frame)
+        for offset, value in enumerate(values):
+            self._reg_cache[start_addr + offset] = value & 0xFFFF
+        if settling_us:
+            # Busy-wait: time.sleep() oversleeps by milliseconds on the Pi
+            deadline = time.perf_counter() + settling_us * 1e-6
+            while time.perf_counter() < deadline:
+                pass
+                
+    def _read_register_cached(self, reg_addr: int) -> int:
+        """
+        Return a register value from the shadow cache, reading the device only
+        on the first access since reset
+        
+        Args:
+            reg_addr: Register address to read
+            
+        Returns:
+            Register value (16-bit)
+        """
+        value = self._reg_cache.get(reg_addr)
+        if value is None:
+            value = self.read_register(reg_addr)
+            self._reg_cache[reg_addr] = value
+        return value
         
     def set_sampling_rate(self, osr: int):
         """
@@ -204,14 +501,15 @@ class ADS131M02:
         Args:
             osr: Over-sampling ratio (use OSR_* constants)
         """
-        # Read current CLOCK register
-        clock_reg = self.read_register(self.REG_CLOCK)
+        # Current CLOCK register (shadow copy)
+        clock_reg = self._read_register_cached(self.REG_CLOCK)
         
         # Clear OSR bits (bits 2:0) and set new value
         clock_reg = (clock_reg & 0xFFF8) | (osr & 0x07)
         
         # Write back to register
-        self.write_register(self.REG_CLOCK, clock_reg)
+        # Let the digital filter restart at the new OSR before the next access
+        self.write_register(self.REG_CLOCK, clock_reg, settling_us=self.CLOCK_SETTLING_US)
         
     def set_gain(self, channel: int, gain: int):
         """
@@ -224,8 +522,8 @@ class ADS131M02:
         if channel not in [0, 1]:
             raise ValueError("Channel must be 0 or 1")
             
-        # Read current GAIN register
-        gain_reg = self.read_register(self.REG_GAIN)
+        # Current GAIN register (shadow copy)
+        gain_reg = self._read_register_cached(self.REG_GAIN)
         
         # Set gain for the channel
         # Channel 0: bits 2:0, Channel 1: bits 6:4
@@ -236,9 +534,13 @@ class ADS131M02:
             
         self.write_register(self.REG_GAIN, gain_reg)
         
-        # Update stored gain value for voltage conversion
-        gain_values = [1, 2, 4, 8, 16, 32, 64, 128]
-        self.channel_gains[channel] = gain_values[gain]
+        # Update stored gain value and volts-per-code for voltage conversion
+        gain_value = 1 << (gain & 0x07)
+        scale = self.vref / (8388608.0 * gain_value)
+        if channel == 0:
+            self.gain0, self._scale0 = gain_value, scale
+        else:
+            self.gain1, self._scale1 = gain_value, scale
         
     def set_dc_blocking_filter(self, channel: int, enable: bool):
         """
@@ -257,8 +559,8 @@ class ADS131M02:
         else:
             reg_addr = self.REG_CH1_CFG
             
-        # Read current channel configuration register
-        ch_cfg = self.read_register(reg_addr)
+        # Current channel configuration register (shadow copy)
+        ch_cfg = self._read_register_cached(reg_addr)
         
         # DC blocking filter is typically controlled by bit 8 (DCBLOCK)
         if enable:
@@ -270,7 +572,10 @@ class ADS131M02:
         self.write_register(reg_addr, ch_cfg)
         
         # Update stored state
-        self.dc_block_enabled[channel] = enable
+        if channel == 0:
+            self.dc_block0 = enable
+        else:
+            self.dc_block1 = enable
         
     def get_dc_blocking_filter_status(self, channel: int) -> bool:
         """
@@ -285,7 +590,26 @@ class ADS131M02:
         if channel not in [0, 1]:
             raise ValueError("Channel must be 0 or 1")
             
-        return self.dc_block_enabled[channel]
+        return self.dc_block1 if channel else self.dc_block0
+        
+    def enable_input_crc(self, enable: bool = True):
+        """
+        Enable or disable CRC checking of command frames sent to the device
+        
+        Args:
+            enable: True to append a CRC word to every command frame
+        """
+        # Current MODE register (shadow copy)
+        mode_reg = self._read_register_cached(self.REG_MODE)
+        
+        if enable:
+            mode_reg |= self.MODE_RX_CRC_EN
+        else:
+            mode_reg &= ~self.MODE_RX_CRC_EN & 0xFFFF
+            
+        # This write is still framed according to the previous setting
+        self.write_register(self.REG_MODE, mode_reg)
+        self._set_input_crc(enable)
         
     def enable_continuous_sampling(self, enable: bool = True):
         """
@@ -294,8 +618,8 @@ class ADS131M02:
         Args:
             enable: True to enable continuous mode, False for single-shot
         """
-        # Read current MODE register
-        mode_reg = self.read_register(self.REG_MODE)
+        # Current MODE register (shadow copy)
+        mode_reg = self._read_register_cached(self.REG_MODE)
         
         if enable:
             # Set continuous conversion mode (clear CONVST bit)
@@ -307,63 +631,182 @@ class ADS131M02:
         self.write_register(self.REG_MODE, mode_reg)
         self.continuous_mode = enable
         
-    def read_data_raw(self) -> Optional[List[int]]:
+    def configure(self, osr: int = OSR_1024, gain0: int = GAIN_1, gain1: int = GAIN_1,
+                  dc_block0: bool = False, dc_block1: bool = False, continuous: bool = True):
         """
-        Read raw conversion data from both channels
+        Apply sampling rate, gains, DC blocking and conversion mode in one go
         
-        Returns:
-            List of [channel0_data, channel1_data] or None if no data ready
+        Each register goes out as its own single-register write; multi-register
+        WREG framing has not been verified on the hardware yet.
+        
+        Args:
+            osr: Over-sampling ratio (use OSR_* constants)
+            gain0: Channel 0 gain (use GAIN_* constants)
+            gain1: Channel 1 gain (use GAIN_* constants)
+            dc_block0: Enable DC blocking filter on channel 0
+            dc_block1: Enable DC blocking filter on channel 1
+            continuous: True for continuous mode, False for single-shot
         """
-        # Check if data is ready (DRDY is active HIGH)
-        if self.drdy_pin and GPIO.input(self.drdy_pin) == GPIO.HIGH:
-            return None  # Data not ready
+        mode_reg = self._read_register_cached(self.REG_MODE)
+        if continuous:
+            mode_reg &= 0xFFFE  # Clear CONVST bit
+        else:
+            mode_reg |= 0x0001  # Set CONVST bit
             
-        # Send NULL command to read data
-        frame = self._create_command_frame(self.CMD_NULL)
-        # Try reading more bytes to see if data is elsewhere
-        while len(frame) < 12:
-            frame.append(0x00)
+        clock_reg = (self._read_register_cached(self.REG_CLOCK) & 0xFFF8) | (osr & 0x07)
+        gain_reg = (self._read_register_cached(self.REG_GAIN) & 0xFF88) | (gain0 & 0x07) | ((gain1 & 0x07) << 4)
+        
+        self.write_register(self.REG_MODE, mode_reg)
+        self.write_register(self.REG_GAIN, gain_reg)
+        # Let the digital filter restart at the new OSR before the next access
+        self.write_register(self.REG_CLOCK, clock_reg, settling_us=self.CLOCK_SETTLING_US)
+        
+        for reg_addr, enable in ((self.REG_CH0_CFG, dc_block0), (self.REG_CH1_CFG, dc_block1)):
+            ch_cfg = self._read_register_cached(reg_addr)
+            # DC blocking filter is typically controlled by bit 8 (DCBLOCK)
+            self.write_register(reg_addr, (ch_cfg | 0x0100) if enable else (ch_cfg & 0xFEFF))
             
-        response = self._spi_transfer(frame)
+        # Update stored state
+        self.continuous_mode = continuous
+        self.gain0 = 1 << (gain0 & 0x07)
+        self.gain1 = 1 << (gain1 & 0x07)
+        self._scale0 = self.vref / (8388608.0 * self.gain0)
+        self._scale1 = self.vref / (8388608.0 * self.gain1)
+        self.dc_block0 = dc_block0
+        self.dc_block1 = dc_block1
         
-        if len(response) >= 12:
-            # Try reading from the middle of the response (bytes 4-6 and 7-9)
-            ch0_data = (response[4] << 16) | (response[5] << 8) | response[6]
-            ch1_data = (response[7] << 16) | (response[8] << 8) | response[9]
+    def read_data_raw(self) -> Optional[Tuple[int, int]]:
+        """
+        Read raw conversion data from both channels
+        
+        Returns:
+            Tuple of (channel0_data, channel1_data) or None if no data ready
+        """
+        # Wait for the DRDY edge signalling a new conversion
+        if not self._wait_drdy():
+            return None  # Data not ready
             
-            # Convert from unsigned to signed 24-bit
-            if ch0_data & 0x800000:
-                ch0_data -= 0x1000000
-            if ch1_data & 0x800000:
-                ch1_data -= 0x1000000
-                
-            return [ch0_data, ch1_data]
-        else:
-            return None
+        # Send NULL command to read data (12 bytes to cover the full data frame)
+        # Try reading from the middle of the response (bytes 4-6 and 7-9)
+        return _decode_channels(self._spi_read_frame())
             
-    def read_data(self) -> Optional[List[float]]:
+    def read_data(self) -> Optional[Tuple[float, float]]:
         """
         Read conversion data from both channels and convert to voltage
         
         Returns:
-            List of [channel0_voltage, channel1_voltage] in volts, or None if no data ready
+            Tuple of (channel0_voltage, channel1_voltage) in volts, or None if no data ready
         """
         raw_data = self.read_data_raw()
         if raw_data is None:
             return None
+        r0, r1 = raw_data
             
-        voltages = []
-        for i, raw_value in enumerate(raw_data):
-            # Convert 24-bit ADC code to voltage
-            # ADS131M02: 24-bit ADC with ±VREF/Gain full-scale range
-            # ADC range: -8388608 to +8388607 (24-bit signed)
-            # Voltage = (ADC_Code / 8388608) * (VREF / Gain)
-            full_scale_voltage = self.vref / self.channel_gains[i]
-            voltage = (raw_value / 8388608.0) * self.vref * self.channel_gains[i]
-            #voltage = (raw_value / 8388608.0) * full_scale_voltage
-            voltages.append(voltage)
+        # Convert 24-bit ADC code to voltage
+        # ADS131M02: 24-bit ADC with ±VREF/Gain full-scale range
+        # ADC range: -8388608 to +8388607 (24-bit signed)
+        # Voltage = ADC_Code * VREF / (8388608 * Gain), scale precomputed in set_gain
+        return r0 * self._scale0, r1 * self._scale1
+            
+    def read_data_raw_block(self, n: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Read a block of raw conversion data from both channels
+        
+        The whole wait-DRDY -> transfer loop writes straight into one
+        preallocated RX buffer through the spidev ioctl (which runs with the
+        GIL released), and the frames are decoded in a single vectorized pass.
+        
+        With a DRDY pin the read stops at the first DRDY timeout (ADC
+        unpowered, held in reset or without a clock), so fewer than n rows
+        may be returned.
+        
+        Args:
+            n: Number of samples to read
+            out: Optional preallocated int32 array of shape (n, 2) to fill
+            
+        Returns:
+            int32 array of shape (count, 2) with [channel0_data, channel1_data]
+            rows, count <= n (a view of out when out is given)
+        """
+        if len(self._block_rx) < n * 12:
+            self._block_rx = bytearray(n * 12)
+        buf = self._block_rx
+        if self.drdy_pin:
+            # One reusable transfer descriptor whose RX pointer walks the buffer
+            rx = (ctypes.c_char * (n * 12)).from_buffer(buf)
+            rx_addr = ctypes.addressof(rx)
+            xfer = _SpiIocTransfer(tx_buf=ctypes.addressof(self._frame_tx), len=12,
+                                   speed_hz=self.spi_speed_hz, bits_per_word=8)
+            request = _spi_ioc_message(1)
+            fd = self.spi.fileno()
+            i = 0
+            while i < n:
+                # Wait for the DRDY edge signalling a new conversion
+                if not self._wait_drdy():
+                    break  # No data ready: return the samples read so far
+                xfer.rx_buf = rx_addr + i * 12
+                if self.cs_pin:
+                    GPIO.output(self.cs_pin, GPIO.LOW)
+                fcntl.ioctl(fd, request, xfer)
+                if self.cs_pin:
+                    GPIO.output(self.cs_pin, GPIO.HIGH)
+                i += 1
+            n = i
+        else:
+            # No DRDY to pace reads: pipeline frames, many per ioctl
+            frames_per_batch = self._SPI_BATCH_MAX_BYTES // 12
+            null_frame = self._NULL_FRAME_12_CRC if self.input_crc_enabled else self._NULL_FRAME_12
+            for start in range(0, n, frames_per_batch):
+                count = min(frames_per_batch, n - start)
+                buf[start * 12:(start + count) * 12] = self._spi_batch((null_frame,) * count)
+            
+        if out is None:
+            out = np.empty((n, 2), dtype=np.int32)
+        else:
+            out = out[:n]
+            
+        # Same byte layout as read_data_raw (bytes 4-6 and 7-9 of each frame)
+        raw = np.frombuffer(buf, dtype=np.uint8, count=n * 12).reshape(n, 12).astype(np.int32)
+        out[:, 0] = (raw[:, 4] << 16) | (raw[:, 5] << 8) | raw[:, 6]
+        out[:, 1] = (raw[:, 7] << 16) | (raw[:, 8] << 8) | raw[:, 9]
+        
+        # Convert from unsigned to signed 24-bit
+        out -= (out & 0x800000) << 1
+        return out
+        
+    def read_into(self, buffer) -> int:
+        """
+        Read conversions straight into a caller-owned buffer (no copy)
+        
+        Args:
+            buffer: Writable buffer, e.g. a memoryview of an int32 NumPy array,
+                receiving interleaved [channel0, channel1] raw codes. Its size
+                sets the number of samples read.
+                
+        Returns:
+            Number of samples read; fewer than the buffer holds if DRDY
+            timed out, in which case the rest of the buffer is untouched
+        """
+        out = np.frombuffer(buffer, dtype=np.int32).reshape(-1, 2)
+        if not out.shape[0]:
+            return 0
+        return self.read_data_raw_block(out.shape[0], out=out).shape[0]
+        
+    def read_data_block(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read a block of conversions from both channels and convert to voltage
+        
+        Args:
+            n: Number of samples to read
             
-        return voltages
+        Returns:
+            Tuple of (channel0_voltages, channel1_voltages) arrays in volts,
+            shorter than n if DRDY timed out
+        """
+        raw = self.read_data_raw_block(n)
+        
+        # Voltage = ADC_Code * VREF / (8388608 * Gain)
+        return raw[:, 0] * self._scale0, raw[:, 1] * self._scale1
             
     def get_device_id(self) -> int:
         """Get device ID"""
@@ -372,7 +815,9 @@ class ADS131M02:
     def cleanup(self):
         """Cleanup resources"""
         self.spi.close()
-        if any([self.cs_pin, self.drdy_pin, self.reset_pin]):
+        if self.drdy_pin:
+            GPIO.remove_event_detect(self.drdy_pin)
+        if self._uses_gpio:
             GPIO.cleanup()
 
     def check_drdy_status(self) -> bool:
@@ -387,64 +832,73 @@ class ADS131M02:
         else:
             return True  # If no DRDY pin, assume data is always ready
             
-    def read_data_debug(self) -> Optional[dict]:
+    def read_data_raw_bytes(self) -> Optional[memoryview]:
         """
-        Read conversion data with debug information
+        Read one raw 12-byte data frame without decoding it
         
         Returns:
-            Dictionary with raw ADC values, voltages, and conversion details
+            memoryview of the response (overwritten by the next read),
+            or None if no data ready
         """
-        # Check if data is ready (DRDY is active HIGH)
-        if self.drdy_pin and GPIO.input(self.drdy_pin) == GPIO.HIGH:
+        # Wait for the DRDY edge signalling a new conversion
+        if not self._wait_drdy():
             return None  # Data not ready
             
-        # Send NULL command to read data
-        frame = self._create_command_frame(self.CMD_NULL)
-        # Try reading more bytes to see if data is elsewhere
-        while len(frame) < 12:
-            frame.append(0x00)
+        # Send NULL command to read data (12 bytes to cover the full data frame)
+        return self._spi_read_frame()
+        
+    def format_debug(self, frame) -> dict:
+        """
+        Build debug information for a raw data frame
+        
+        Args:
+            frame: 12-byte response from read_data_raw_bytes
             
-        response = self._spi_transfer(frame)
+        Returns:
+            Dictionary with raw ADC values, voltages, and conversion details
+        """
+        # Show raw response bytes for debugging
+        raw_bytes = bytes(frame[:12]).hex(' ').upper()
         
-        if len(response) >= 12:
-            # Show raw response bytes for debugging
-            raw_bytes = ' '.join([f'{b:02X}' for b in response[:12]])
+        # Try reading from the middle of the response (bytes 4-6 and 7-9)
+        ch0_data, ch1_data = _decode_channels(frame)
             
-            # Try reading from the middle of the response (bytes 4-6 and 7-9)
-            ch0_data = (response[4] << 16) | (response[5] << 8) | response[6]
-            ch1_data = (response[7] << 16) | (response[8] << 8) | response[9]
+        debug_info = {
+            'raw_bytes': raw_bytes,
+            'raw_adc': [ch0_data, ch1_data],
+            'voltages': [],
+            'conversion_details': []
+        }
+        
+        for i, raw_value in enumerate([ch0_data, ch1_data]):
+            # Convert 24-bit ADC code to voltage
+            gain = self.channel_gains[i]
+            full_scale_voltage = self.vref / gain
+            voltage = (raw_value / 8388608.0) * full_scale_voltage
             
-            # Convert from unsigned to signed 24-bit
-            if ch0_data & 0x800000:
-                ch0_data -= 0x1000000
-            if ch1_data & 0x800000:
-                ch1_data -= 0x1000000
-                
-            debug_info = {
-                'raw_bytes': raw_bytes,
-                'raw_adc': [ch0_data, ch1_data],
-                'voltages': [],
-                'conversion_details': []
-            }
-            
-            for i, raw_value in enumerate([ch0_data, ch1_data]):
-                # Convert 24-bit ADC code to voltage
-                full_scale_voltage = self.vref / self.channel_gains[i]
-                voltage = (raw_value / 8388608.0) * full_scale_voltage
-                
-                debug_info['voltages'].append(voltage)
-                debug_info['conversion_details'].append({
-                    'channel': i,
-                    'raw_adc': raw_value,
-                    'vref': self.vref,
-                    'gain': self.channel_gains[i],
-                    'full_scale_voltage': full_scale_voltage,
-                    'voltage': voltage
-                })
-                
-            return debug_info
-        else:
+            debug_info['voltages'].append(voltage)
+            debug_info['conversion_details'].append({
+                'channel': i,
+                'raw_adc': raw_value,
+                'vref': self.vref,
+                'gain': gain,
+                'full_scale_voltage': full_scale_voltage,
+                'voltage': voltage
+            })
+            
+        return debug_info
+        
+    def read_data_debug(self) -> Optional[dict]:
+        """
+        Read conversion data with debug information
+        
+        Returns:
+            Dictionary with raw ADC values, voltages, and conversion details
+        """
+        frame = self.read_data_raw_bytes()
+        if frame is None:
             return None
+        return self.format_debug(frame)
 
 
 # Example usage
@@ -457,19 +911,8 @@ if __name__ == "__main__":
                        help='Number of samples to read for performance test (default: 10000)')
     args = parser.parse_args()
     
-    # Map OSR values to constants
-    osr_map = {
-        128: ADS131M02.OSR_128,
-        256: ADS131M02.OSR_256,
-        512: ADS131M02.OSR_512,
-        1024: ADS131M02.OSR_1024,
-        2048: ADS131M02.OSR_2048,
-        4096: ADS131M02.OSR_4096,
-        8192: ADS131M02.OSR_8192,
-        16384: ADS131M02.OSR_16384
-    }
-    
-    selected_osr = osr_map[args.osr]
+    # OSR values are powers of two from 128 (OSR_128 = 0) up to 16384 (OSR_16384 = 7)
+    selected_osr = args.osr.bit_length() - 8
     
     print(f"Starting ADS131M02 test with OSR={args.osr}")
     print(f"Expected sampling rate: {8000000/args.osr:.1f} SPS")
@@ -504,27 +947,17 @@ if __name__ == "__main__":
         print(f"Channel 0 Config: 0x{adc.read_register(adc.REG_CH0_CFG):04X}")
         print(f"Channel 1 Config: 0x{adc.read_register(adc.REG_CH1_CFG):04X}")
         
-        # Configure sampling rate (use user-specified OSR)
-        print(f"\nSetting sampling rate to OSR={args.osr}...")
-        adc.set_sampling_rate(selected_osr)
-        
-        # Set gain for both channels (gain of 4)
-        print("Setting gain...")
-        adc.set_gain(0, adc.GAIN_2)  # Channel 0
-        adc.set_gain(1, adc.GAIN_2)  # Channel 1
-        
-        # Configure DC blocking filter
-        print("Configuring DC blocking filter...")
-        adc.set_dc_blocking_filter(0, False)   # Enable DC blocking on Channel 0
-        adc.set_dc_blocking_filter(1, False)  # Disable DC blocking on Channel 1
+        # Configure sampling rate (user-specified OSR), gain of 2 on both
+        # channels, DC blocking off and continuous sampling in one pass
+        print(f"\nConfiguring OSR={args.osr}, gain=2, continuous sampling...")
+        adc.configure(osr=selected_osr,
+                      gain0=adc.GAIN_2, gain1=adc.GAIN_2,
+                      dc_block0=False, dc_block1=False,
+                      continuous=True)
         
         print(f"DC blocking CH0: {'Enabled' if adc.get_dc_blocking_filter_status(0) else 'Disabled'}")
         print(f"DC blocking CH1: {'Enabled' if adc.get_dc_blocking_filter_status(1) else 'Disabled'}")
         
-        # Enable continuous sampling
-        print("Enabling continuous sampling...")
-        adc.enable_continuous_sampling(True)
-        
         # Print register values after configuration
         print("\n=== REGISTER VALUES AFTER CONFIGURATION ===")
         print(f"ID Register: 0x{adc.read_register(adc.REG_ID):04X}")
@@ -561,16 +994,8 @@ if __name__ == "__main__":
         print(f"\nReading {args.samples} samples to measure performance...")
         start_time = time.time()
         
-        samples_read = 0
-        ch0_data = []
-        ch1_data = []
-        for i in range(args.samples):
-            voltages = adc.read_data()
-            if voltages:
-                samples_read += 1
-                ch0_data.append(voltages[0])
-                ch1_data.append(voltages[1])
-            # No printing to avoid slowing down the measurement
+        ch0_data, ch1_data = adc.read_data_block(args.samples)
+        samples_read = len(ch0_data)
         
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -580,25 +1005,22 @@ if __name__ == "__main__":
         print(f"Effective sampling rate: {samples_read/elapsed_time:.1f} samples/second")
         
         # Calculate statistics for the collected data
-        if ch0_data and ch1_data:
-            import statistics
-            
+        if samples_read > 0:
+            # Float samples are practically all unique, so no mode is reported
             print("\n=== STATISTICAL ANALYSIS ===")
             print("Channel 0 Statistics:")
-            print(f"  Mean: {statistics.mean(ch0_data):.6f} V")
-            print(f"  Median: {statistics.median(ch0_data):.6f} V")
-            print(f"  Mode: {statistics.mode(ch0_data):.6f} V")
-            print(f"  Min: {min(ch0_data):.6f} V")
-            print(f"  Max: {max(ch0_data):.6f} V")
-            print(f"  Standard Deviation: {statistics.stdev(ch0_data):.6f} V")
+            print(f"  Mean: {np.mean(ch0_data):.6f} V")
+            print(f"  Median: {np.median(ch0_data):.6f} V")
+            print(f"  Min: {np.min(ch0_data):.6f} V")
+            print(f"  Max: {np.max(ch0_data):.6f} V")
+            print(f"  Standard Deviation: {np.std(ch0_data, ddof=1):.6f} V")
             
             print("\nChannel 1 Statistics:")
-            print(f"  Mean: {statistics.mean(ch1_data):.6f} V")
-            print(f"  Median: {statistics.median(ch1_data):.6f} V")
-            print(f"  Mode: {statistics.mode(ch1_data):.6f} V")
-            print(f"  Min: {min(ch1_data):.6f} V")
-            print(f"  Max: {max(ch1_data):.6f} V")
-            print(f"  Standard Deviation: {statistics.stdev(ch1_data):.6f} V")
+            print(f"  Mean: {np.mean(ch1_data):.6f} V")
+            print(f"  Median: {np.median(ch1_data):.6f} V")
+            print(f"  Min: {np.min(ch1_data):.6f} V")
+            print(f"  Max: {np.max(ch1_data):.6f} V")
+            print(f"  Standard Deviation: {np.std(ch1_data, ddof=1):.6f} V")
             
     except KeyboardInterrupt:
         print("\nStopping...")
@@ -9,13 +9,23 @@ This driver provides full functionality for configuration and data acquisition.
 
 import time
 import struct
-from typing import Optional, List, Tuple, Dict, Any
+import asyncio
+import threading
+import os
+import ctypes
+import fcntl
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Sequence, Tuple, Dict, Any, Union
 import logging
+from collections import namedtuple
+import numpy as np
 
 try:
     import smbus2 as smbus
+    from smbus2 import i2c_msg
     SMBUS_AVAILABLE = True
 except ImportError:
+    i2c_msg = None  # Plain smbus has no combined (repeated-start) transfers
     try:
         import smbus
         SMBUS_AVAILABLE = True
@@ -23,6 +33,82 @@ except ImportError:
         SMBUS_AVAILABLE = False
         print("Warning: smbus not available. Install smbus2 or smbus for I2C support.")
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Linux i2c-dev combined-transfer ioctl (linux/i2c-dev.h, linux/i2c.h)
+I2C_RDWR = 0x0707
+I2C_M_RD = 0x0001
+
+
+class _I2cMsg(ctypes.Structure):
+    """struct i2c_msg from linux/i2c.h"""
+    _fields_ = [
+        ('addr', ctypes.c_uint16),
+        ('flags', ctypes.c_uint16),
+        ('len', ctypes.c_uint16),
+        ('buf', ctypes.c_void_p),
+    ]
+
+
+class _I2cRdwrIoctlData(ctypes.Structure):
+    """struct i2c_rdwr_ioctl_data from linux/i2c-dev.h"""
+    _fields_ = [
+        ('msgs', ctypes.POINTER(_I2cMsg)),
+        ('nmsgs', ctypes.c_uint32),
+    ]
+
+
+def _decode_fifo_numpy(buf: np.ndarray, scale: float, offset: float,
+                       channels: np.ndarray, voltages: np.ndarray):
+    """
+    Decode FIFO sample pairs with NumPy array ops into preallocated
+    channels (uint8) and voltages (float32) arrays
+    """
+    raw = buf.reshape(-1, 2)
+    np.bitwise_and(raw[:, 0], 0x07, out=channels)
+    values = ((raw[:, 0].astype(np.uint16) & 0xF0) >> 4) | (raw[:, 1].astype(np.uint16) << 4)
+    np.multiply(values, scale, out=voltages, casting='unsafe')
+    np.add(voltages, offset, out=voltages, casting='unsafe')
+
+
+def _accumulate_numpy(channels: np.ndarray, raws: np.ndarray, sums: np.ndarray, counts: np.ndarray):
+    """Add per-channel sums and sample counts of raw codes into sums/counts (uint64[8])"""
+    sums += np.bincount(channels, weights=raws, minlength=8).astype(np.uint64)
+    counts += np.bincount(channels, minlength=8).astype(np.uint64)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _decode_fifo_numba(buf, scale, offset, channels, voltages):
+        """
+        Decode FIFO sample pairs in one compiled loop into preallocated
+        channels (uint8) and voltages (float32) arrays
+        """
+        for i in range(buf.shape[0] // 2):
+            b0 = np.int32(buf[2 * i])
+            b1 = np.int32(buf[2 * i + 1])
+            channels[i] = b0 & 0x07
+            voltages[i] = (((b0 & 0xF0) >> 4) | (b1 << 4)) * scale + offset
+    
+    @njit(cache=True, fastmath=True)
+    def _accumulate_numba(channels, raws, sums, counts):
+        """Add per-channel sums and sample counts of raw codes into sums/counts (uint64[8])"""
+        for i in range(channels.size):
+            c = channels[i]
+            sums[c] += raws[i]
+            counts[c] += 1
+    
+    decode_fifo = _decode_fifo_numba
+    accumulate = _accumulate_numba
+else:
+    decode_fifo = _decode_fifo_numpy
+    accumulate = _accumulate_numpy
+
 # ADS7142 Register Addresses
 class ADS7142Registers:
     # Configuration registers
@@ -70,6 +156,16 @@ class ADS7142Registers:
     DEVICE_ID = 0x40
     REVISION_ID = 0x41
 
+# Hot-path register addresses bound at module level (no class attribute lookup)
+_REG_STATUS = ADS7142Registers.STATUS
+_REG_DATA_CH0 = ADS7142Registers.DATA_CH0
+_REG_FIFO_COUNT = ADS7142Registers.FIFO_COUNT
+_REG_FIFO_DATA = ADS7142Registers.FIFO_DATA
+
+# Decoded STATUS register, one field per bit from bit 0 to bit 7
+StatusFlags = namedtuple("StatusFlags", "conversion_ready fifo_full fifo_empty interrupt_active "
+                                        "power_good overrange underrange data_ready")
+
 # ADS7142 Configuration Values
 class ADS7142Config:
     # Operating modes
@@ -120,6 +216,29 @@ class ADS7142:
     - Interrupt support
     """
     
+    # Input range -> (volts per code, offset in volts)
+    _RANGE_TABLE = {
+        ADS7142Config.RANGE_0_TO_2_5V: (2.5 / 4095.0, 0.0),
+        ADS7142Config.RANGE_0_TO_5V: (5.0 / 4095.0, 0.0),
+        ADS7142Config.RANGE_0_TO_10V: (10.0 / 4095.0, 0.0),
+        ADS7142Config.RANGE_PM_2_5V: (5.0 / 4095.0, -2.5),
+        ADS7142Config.RANGE_PM_5V: (10.0 / 4095.0, -5.0),
+        ADS7142Config.RANGE_PM_10V: (20.0 / 4095.0, -10.0),
+    }
+    
+    # Expected DEVICE_ID value, max time to wait for it after reset and
+    # delay between DEVICE_ID polls (s)
+    EXPECTED_DEVICE_ID = 0x42
+    RESET_TIMEOUT = 0.01
+    RESET_POLL_INTERVAL = 500e-6
+    
+    # Size of the preallocated I2C_RDWR read buffer (bytes)
+    _RS_BUF_SIZE = 4096
+    
+    # Conversion-ready polling: interval between STATUS reads and upper bound
+    CONVERSION_POLL_INTERVAL = 50e-6
+    CONVERSION_TIMEOUT = 0.01
+    
     def __init__(self, 
                  i2c_bus: int = 1, 
                  i2c_address: int = 0x12,
@@ -143,6 +262,8 @@ class ADS7142:
         if debug:
             logging.basicConfig(level=logging.DEBUG)
         self.logger = logging.getLogger(__name__)
+        # Checked once here so the register hot paths skip building log messages
+        self._debug_enabled = debug and self.logger.isEnabledFor(logging.DEBUG)
         
         # Initialize I2C bus
         if not SMBUS_AVAILABLE:
@@ -154,13 +275,44 @@ class ADS7142:
         except Exception as e:
             raise ADS7142Error(f"Failed to initialize I2C bus {i2c_bus}: {e}")
         
+        # Raw i2c-dev handle for hot reads via the I2C_RDWR ioctl, with the
+        # pointer-write/read message pair and buffers built once
+        try:
+            self._i2c_fd = os.open(f"/dev/i2c-{i2c_bus}", os.O_RDWR)
+        except OSError:
+            self._i2c_fd = None  # Fall back to smbus for reads
+        self._rs_reg = (ctypes.c_uint8 * 1)()
+        self._rs_buf = ctypes.create_string_buffer(self._RS_BUF_SIZE)
+        self._rs_msgs = (_I2cMsg * 2)(
+            _I2cMsg(addr=i2c_address, flags=0, len=1, buf=ctypes.addressof(self._rs_reg)),
+            _I2cMsg(addr=i2c_address, flags=I2C_M_RD, len=0, buf=ctypes.addressof(self._rs_buf)))
+        self._rs_ioctl_data = _I2cRdwrIoctlData(msgs=self._rs_msgs, nmsgs=2)
+        
+        # Dedicated fixed 2-byte read for read_channel (indexed in place)
+        self._read2_reg = (ctypes.c_uint8 * 1)()
+        self._read2_buf = (ctypes.c_uint8 * 2)()
+        self._read2_msgs = (_I2cMsg * 2)(
+            _I2cMsg(addr=i2c_address, flags=0, len=1, buf=ctypes.addressof(self._read2_reg)),
+            _I2cMsg(addr=i2c_address, flags=I2C_M_RD, len=2, buf=ctypes.addressof(self._read2_buf)))
+        self._read2_ioctl_data = _I2cRdwrIoctlData(msgs=self._read2_msgs, nmsgs=2)
+        
         # Device configuration
         self.sampling_rate = 1000000  # 1 MSPS default
-        self.active_channels = []
+        self._active_mask = 0  # Bit n set = channel n active (same layout as PIN_CFG)
+        self._shadow = {}  # Last value written to each config register
         self.input_range = ADS7142Config.RANGE_0_TO_2_5V
+        self._v_scale, self._v_offset = self._range_scale_offset(self.input_range)
         self.oversampling_ratio = ADS7142Config.OSR_1
         self.operating_mode = ADS7142Config.MODE_STANDBY
         
+        # FIFO streaming ring buffer (see start_streaming)
+        self._ring = None
+        self._ring_head = 0  # Total samples written (producer only)
+        self._ring_tail = 0  # Total samples consumed (consumer only)
+        self._stream_thread = None
+        self._stream_stop = threading.Event()
+        self.stream_overruns = 0
+        
         # Initialize device
         self._init_device()
     
@@ -173,7 +325,7 @@ class ADS7142:
             
             self.logger.info(f"Device ID: 0x{device_id:02X}, Revision: 0x{revision_id:02X}")
             
-            if device_id != 0x42:  # Expected device ID for ADS7142
+            if device_id != self.EXPECTED_DEVICE_ID:
                 self.logger.warning(f"Unexpected device ID: 0x{device_id:02X}")
             
             # Reset device to known state
@@ -191,45 +343,65 @@ class ADS7142:
         """Configure default device settings"""
         # General configuration
         general_cfg = 0x00  # Default settings
-        self.write_register(ADS7142Registers.GENERAL_CFG, general_cfg)
         
         # Data configuration
         data_cfg = (self.input_range << 4) | 0x00  # Input range + default settings
-        self.write_register(ADS7142Registers.DATA_CFG, data_cfg)
         
         # Oversampling configuration
         osr_cfg = self.oversampling_ratio
-        self.write_register(ADS7142Registers.OSR_CFG, osr_cfg)
-        
-        # Operating mode
-        self.write_register(ADS7142Registers.OPMODE_CFG, self.operating_mode)
         
         # Pin configuration (all pins as analog inputs)
         pin_cfg = 0x00
-        self.write_register(ADS7142Registers.PIN_CFG, pin_cfg)
         
         # GPIO configuration
         gpio_cfg = 0x00
-        self.write_register(ADS7142Registers.GPIO_CFG, gpio_cfg)
+        
+        # GENERAL_CFG..GPIO_CFG (0x00-0x05) are contiguous: one burst write
+        self.write_registers(ADS7142Registers.GENERAL_CFG,
+                             [general_cfg, data_cfg, osr_cfg, self.operating_mode, pin_cfg, gpio_cfg])
         
         # FIFO configuration
         fifo_cfg = 0x00  # Disable FIFO by default
         self.write_register(ADS7142Registers.FIFO_CFG, fifo_cfg)
         
-        # Interrupt configuration
+        # Interrupt configuration (INT_CFG, INT_MASK are contiguous)
         int_cfg = 0x00  # Disable interrupts by default
-        self.write_register(ADS7142Registers.INT_CFG, int_cfg)
-        self.write_register(ADS7142Registers.INT_MASK, 0xFF)  # Mask all interrupts
+        self.write_registers(ADS7142Registers.INT_CFG, [int_cfg, 0xFF])  # Mask all interrupts
     
     def reset(self):
-        """Reset the ADS7142 device"""
+        """
+        Reset the ADS7142 device
+        
+        Returns as soon as DEVICE_ID reads back after the reset, instead of
+        always waiting the worst-case RESET_TIMEOUT. Like a failed reset
+        write, a device that does not answer in time is only logged.
+        """
         try:
             # Write to a reserved register to trigger reset
             self.write_register(0x7F, 0x00)
-            time.sleep(0.01)  # Wait for reset to complete
-            self.logger.debug("Device reset completed")
+            self.invalidate_shadow()  # Registers are back at power-on defaults
         except Exception as e:
             self.logger.warning(f"Reset failed: {e}")
+            return
+        
+        # Poll DEVICE_ID until the device answers again
+        device_id = None
+        deadline = time.monotonic() + self.RESET_TIMEOUT
+        while time.monotonic() < deadline:
+            try:
+                device_id = self.read_register(ADS7142Registers.DEVICE_ID)
+            except ADS7142Error:
+                device_id = None  # Still in reset (NACK)
+            if device_id == self.EXPECTED_DEVICE_ID:
+                break
+            time.sleep(self.RESET_POLL_INTERVAL)
+        
+        if device_id is None:
+            self.logger.warning(f"Device not responding {self.RESET_TIMEOUT * 1000:.0f} ms after reset")
+            return
+        if device_id != self.EXPECTED_DEVICE_ID:
+            self.logger.warning(f"Unexpected device ID after reset: 0x{device_id:02X}")
+        self.logger.debug("Device reset completed")
     
     def write_register(self, register: int, value: int):
         """
@@ -241,11 +413,75 @@ class ADS7142:
         """
         try:
             self.bus.write_byte_data(self.i2c_address, register, value)
-            if self.debug:
-                self.logger.debug(f"Write register 0x{register:02X} = 0x{value:02X}")
+            self._shadow[register] = value
+            if self._debug_enabled:
+                self.logger.debug("Write register 0x%02X = 0x%02X", register, value)
         except Exception as e:
             raise ADS7142Error(f"Failed to write register 0x{register:02X}: {e}")
     
+    def write_registers(self, start_register: int, values: List[int]):
+        """
+        Write multiple consecutive registers in one I2C transaction
+        
+        Args:
+            start_register: Starting register address
+            values: Values to write (register pointer auto-increments)
+        """
+        try:
+            self.bus.write_i2c_block_data(self.i2c_address, start_register, values)
+            for offset, value in enumerate(values):
+                self._shadow[start_register + offset] = value
+            if self._debug_enabled:
+                self.logger.debug("Write registers 0x%02X-0x%02X: %s", start_register, start_register + len(values) - 1,
+                                  [f'0x{v:02X}' for v in values])
+        except Exception as e:
+            raise ADS7142Error(f"Failed to write registers starting at 0x{start_register:02X}: {e}")
+    
+    def _read_shadow(self, register: int) -> int:
+        """
+        Get a config register from the shadow copy, reading the device only
+        if it has not been written since the last reset
+        
+        Args:
+            register: Register address
+            
+        Returns:
+            Register value
+        """
+        value = self._shadow.get(register)
+        if value is None:
+            value = self._shadow[register] = self.read_register(register)
+        return value
+    
+    def invalidate_shadow(self):
+        """Forget all shadowed register values (next access reads the device)"""
+        self._shadow.clear()
+    
+    def _read_block_rs(self, register: int, count: int) -> Sequence[int]:
+        """
+        Set the register pointer and read count bytes in one combined
+        transaction (S-addr-W-reg-Sr-addr-R-data-P, no STOP in between)
+        
+        Args:
+            register: Register address
+            count: Number of bytes to read
+            
+        Returns:
+            Byte values (bytes or list)
+        """
+        if self._i2c_fd is not None and count <= self._RS_BUF_SIZE:
+            # Reuse the prebuilt message pair; only pointer and length change
+            self._rs_reg[0] = register
+            self._rs_msgs[1].len = count
+            fcntl.ioctl(self._i2c_fd, I2C_RDWR, self._rs_ioctl_data)
+            return ctypes.string_at(self._rs_buf, count)
+        if i2c_msg is None:
+            return self.bus.read_i2c_block_data(self.i2c_address, register, count)
+        write = i2c_msg.write(self.i2c_address, [register])
+        read = i2c_msg.read(self.i2c_address, count)
+        self.bus.i2c_rdwr(write, read)
+        return list(read)
+    
     def read_register(self, register: int) -> int:
         """
         Read a value from a register
@@ -257,9 +493,9 @@ class ADS7142:
             Register value
         """
         try:
-            value = self.bus.read_byte_data(self.i2c_address, register)
-            if self.debug:
-                self.logger.debug(f"Read register 0x{register:02X} = 0x{value:02X}")
+            value = self._read_block_rs(register, 1)[0]
+            if self._debug_enabled:
+                self.logger.debug("Read register 0x%02X = 0x%02X", register, value)
             return value
         except Exception as e:
             raise ADS7142Error(f"Failed to read register 0x{register:02X}: {e}")
@@ -276,9 +512,10 @@ class ADS7142:
             List of register values
         """
         try:
-            values = self.bus.read_i2c_block_data(self.i2c_address, start_register, count)
-            if self.debug:
-                self.logger.debug(f"Read registers 0x{start_register:02X}-0x{start_register+count-1:02X}: {[f'0x{v:02X}' for v in values]}")
+            values = list(self._read_block_rs(start_register, count))
+            if self._debug_enabled:
+                self.logger.debug("Read registers 0x%02X-0x%02X: %s", start_register, start_register + count - 1,
+                                  [f'0x{v:02X}' for v in values])
             return values
         except Exception as e:
             raise ADS7142Error(f"Failed to read registers starting at 0x{start_register:02X}: {e}")
@@ -299,7 +536,7 @@ class ADS7142:
             raise ADS7142Error("Differential mode only available for channels 0-3")
         
         # Update pin configuration
-        pin_cfg = self.read_register(ADS7142Registers.PIN_CFG)
+        pin_cfg = self._read_shadow(ADS7142Registers.PIN_CFG)
         
         if enabled:
             if differential:
@@ -311,14 +548,51 @@ class ADS7142:
             
         self.write_register(ADS7142Registers.PIN_CFG, pin_cfg)
         
-        # Update active channels list
-        if enabled and channel not in self.active_channels:
-            self.active_channels.append(channel)
-        elif not enabled and channel in self.active_channels:
-            self.active_channels.remove(channel)
+        # Update active channels mask
+        if enabled:
+            self._active_mask |= (1 << channel)
+        else:
+            self._active_mask &= ~(1 << channel)
         
         self.logger.info(f"Channel {channel} configured: enabled={enabled}, differential={differential}")
     
+    @property
+    def active_channels(self) -> List[int]:
+        """Active channel numbers, ascending"""
+        return [ch for ch in range(8) if self._active_mask & (1 << ch)]
+    
+    @active_channels.setter
+    def active_channels(self, channels: List[int]):
+        self._active_mask = 0
+        for ch in channels:
+            self._active_mask |= (1 << ch)
+    
+    def _configure_channels_bulk(self, channel_set, differential=frozenset()):
+        """
+        Configure all 8 channels with a single PIN_CFG write
+        
+        Same bit semantics as configure_channel: a channel's bit is set when
+        it is disabled or differential, cleared when enabled single-ended.
+        
+        Args:
+            channel_set: Channels to enable
+            differential: Enabled channels to put in differential mode (0-3)
+        """
+        active_mask = 0
+        for ch in channel_set:
+            if 0 <= ch <= 7:
+                active_mask |= (1 << ch)
+        differential_mask = 0
+        for ch in differential:
+            if 0 <= ch <= 7:
+                differential_mask |= (1 << ch)
+        pin_cfg = (~active_mask & 0xFF) | differential_mask
+        
+        self.write_register(ADS7142Registers.PIN_CFG, pin_cfg)
+        self._active_mask = active_mask
+        
+        self.logger.info(f"Channels configured: enabled={self.active_channels}")
+    
     def set_input_range(self, input_range: int):
         """
         Set the input voltage range
@@ -327,7 +601,8 @@ class ADS7142:
             input_range: Input range from ADS7142Config.RANGE_*
         """
         self.input_range = input_range
-        data_cfg = self.read_register(ADS7142Registers.DATA_CFG)
+        self._v_scale, self._v_offset = self._range_scale_offset(input_range)
+        data_cfg = self._read_shadow(ADS7142Registers.DATA_CFG)
         data_cfg = (data_cfg & 0x0F) | (input_range << 4)
         self.write_register(ADS7142Registers.DATA_CFG, data_cfg)
         self.logger.info(f"Input range set to: {input_range}")
@@ -354,46 +629,67 @@ class ADS7142:
         self.write_register(ADS7142Registers.OPMODE_CFG, mode)
         self.logger.info(f"Operating mode set to: {mode}")
     
-    def read_channel(self, channel: int) -> float:
+    def read_channel(self, channel: int, raw: bool = False) -> Union[float, int]:
         """
         Read a single channel and convert to voltage
         
         Args:
             channel: Channel number (0-7)
+            raw: Return the 12-bit ADC code instead of volts
             
         Returns:
-            Voltage in volts
+            Voltage in volts (or raw 12-bit code if raw=True)
         """
         if not 0 <= channel <= 7:
             raise ADS7142Error(f"Invalid channel number: {channel}")
         
         # Read the data register for the channel
-        data_register = ADS7142Registers.DATA_CH0 + channel
-        raw_data = self.read_registers(data_register, 2)
+        data_register = _REG_DATA_CH0 + channel
+        if self._i2c_fd is not None:
+            # Prebuilt 2-byte I2C_RDWR transfer: no per-call allocation
+            self._read2_reg[0] = data_register
+            try:
+                fcntl.ioctl(self._i2c_fd, I2C_RDWR, self._read2_ioctl_data)
+            except OSError as e:
+                raise ADS7142Error(f"Failed to read registers starting at 0x{data_register:02X}: {e}")
+            raw_data = self._read2_buf
+        else:
+            raw_data = self.read_registers(data_register, 2)
         
         # Convert to 12-bit value
         raw_value = (raw_data[0] << 4) | (raw_data[1] >> 4)
+        if raw:
+            return raw_value
         
         # Convert to voltage based on input range
         voltage = self._raw_to_voltage(raw_value)
         
-        if self.debug:
-            self.logger.debug(f"Channel {channel}: raw=0x{raw_value:03X}, voltage={voltage:.6f}V")
+        if self._debug_enabled:
+            self.logger.debug("Channel %d: raw=0x%03X, voltage=%.6fV", channel, raw_value, voltage)
         
         return voltage
     
-    def read_all_channels(self) -> Dict[int, float]:
+    def read_all_channels(self, raw: bool = False) -> Dict[int, Union[float, int]]:
         """
         Read all active channels
         
+        Args:
+            raw: Return 12-bit ADC codes instead of volts
+            
         Returns:
-            Dictionary mapping channel numbers to voltages
+            Dictionary mapping channel numbers to voltages (or raw codes)
         """
         results = {}
         
-        for channel in self.active_channels:
+        read_channel = self.read_channel
+        
+        # Walk the set bits of the active mask, lowest channel first
+        mask = self._active_mask
+        while mask:
+            channel = (mask & -mask).bit_length() - 1
+            mask &= mask - 1
             try:
-                voltage = self.read_channel(channel)
+                voltage = read_channel(channel, raw)
                 results[channel] = voltage
             except Exception as e:
                 self.logger.error(f"Failed to read channel {channel}: {e}")
@@ -412,22 +708,22 @@ class ADS7142:
             Dictionary mapping channel numbers to voltages
         """
         if channels is None:
-            channels = self.active_channels.copy()
+            channels = self.active_channels
         
         # Configure channels
-        for ch in range(8):
-            self.configure_channel(ch, ch in channels)
+        self._configure_channels_bulk(set(channels))
+        
+        if i2c_msg is not None:
+            return self._read_single_shot_fused(channels)
         
         # Set to single-shot mode
         self.set_operating_mode(ADS7142Config.MODE_SINGLE_SHOT)
         
-        # Wait for conversion to complete
-        time.sleep(0.001)  # 1ms should be sufficient
-        
-        # Read results
+        # Read results, each as soon as its conversion completes
         results = {}
         for channel in channels:
             try:
+                self._wait_conversion_ready()
                 voltage = self.read_channel(channel)
                 results[channel] = voltage
             except Exception as e:
@@ -436,6 +732,74 @@ class ADS7142:
         
         return results
     
+    def _read_single_shot_fused(self, channels: List[int]) -> Dict[int, float]:
+        """
+        Single-shot conversion using combined i2c_rdwr transactions
+        
+        The OPMODE write and the first STATUS read go out in one transaction,
+        and once the conversion is ready all channel data registers are read
+        in a second one (pointer write + 2-byte read per channel, repeated
+        starts in between).
+        
+        Args:
+            channels: List of channels to read
+            
+        Returns:
+            Dictionary mapping channel numbers to voltages
+        """
+        addr = self.i2c_address
+        results = {}
+        try:
+            # Set to single-shot mode and check STATUS in the same transaction
+            status = i2c_msg.read(addr, 1)
+            self.bus.i2c_rdwr(i2c_msg.write(addr, [ADS7142Registers.OPMODE_CFG, ADS7142Config.MODE_SINGLE_SHOT]),
+                              i2c_msg.write(addr, [_REG_STATUS]),
+                              status)
+            self.operating_mode = ADS7142Config.MODE_SINGLE_SHOT
+            self._shadow[ADS7142Registers.OPMODE_CFG] = ADS7142Config.MODE_SINGLE_SHOT
+            if not list(status)[0] & 0x01:
+                self._wait_conversion_ready()
+            
+            # Read every valid channel's data register in one transaction
+            msgs = []
+            reads = {}
+            for channel in channels:
+                if not 0 <= channel <= 7:
+                    self.logger.error(f"Failed to read channel {channel}: Invalid channel number: {channel}")
+                    results[channel] = float('nan')
+                    continue
+                reads[channel] = i2c_msg.read(addr, 2)
+                msgs.append(i2c_msg.write(addr, [_REG_DATA_CH0 + channel]))
+                msgs.append(reads[channel])
+            if msgs:
+                self.bus.i2c_rdwr(*msgs)
+            
+            for channel, read in reads.items():
+                raw_data = list(read)
+                # Convert to 12-bit value
+                raw_value = (raw_data[0] << 4) | (raw_data[1] >> 4)
+                results[channel] = self._raw_to_voltage(raw_value)
+        except Exception as e:
+            self.logger.error(f"Failed to read channels {channels}: {e}")
+        
+        return {channel: results.get(channel, float('nan')) for channel in channels}
+    
+    def _wait_conversion_ready(self):
+        """
+        Poll STATUS.conversion_ready until set
+        
+        Raises:
+            ADS7142Error: If no conversion completes within CONVERSION_TIMEOUT
+        """
+        deadline = time.monotonic() + self.CONVERSION_TIMEOUT
+        while True:
+            if self.read_register(_REG_STATUS) & 0x01:
+                return
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(self.CONVERSION_POLL_INTERVAL)
+        raise ADS7142Error(f"Conversion not ready after {self.CONVERSION_TIMEOUT * 1000:.0f} ms")
+    
     def start_continuous_conversion(self, channels: Optional[List[int]] = None):
         """
         Start continuous conversion mode
@@ -444,11 +808,10 @@ class ADS7142:
             channels: List of channels to convert (None for all active channels)
         """
         if channels is None:
-            channels = self.active_channels.copy()
+            channels = self.active_channels
         
         # Configure channels
-        for ch in range(8):
-            self.configure_channel(ch, ch in channels)
+        self._configure_channels_bulk(set(channels))
         
         # Set to continuous mode
         self.set_operating_mode(ADS7142Config.MODE_CONTINUOUS)
@@ -470,41 +833,41 @@ class ADS7142:
         Returns:
             Voltage in volts
         """
-        # Convert 12-bit value to voltage based on input range
-        if self.input_range == ADS7142Config.RANGE_0_TO_2_5V:
-            return (raw_value / 4095.0) * 2.5
-        elif self.input_range == ADS7142Config.RANGE_0_TO_5V:
-            return (raw_value / 4095.0) * 5.0
-        elif self.input_range == ADS7142Config.RANGE_0_TO_10V:
-            return (raw_value / 4095.0) * 10.0
-        elif self.input_range == ADS7142Config.RANGE_PM_2_5V:
-            return ((raw_value / 4095.0) - 0.5) * 5.0
-        elif self.input_range == ADS7142Config.RANGE_PM_5V:
-            return ((raw_value / 4095.0) - 0.5) * 10.0
-        elif self.input_range == ADS7142Config.RANGE_PM_10V:
-            return ((raw_value / 4095.0) - 0.5) * 20.0
-        else:
-            return (raw_value / 4095.0) * self.voltage_reference
+        # Scale and offset for the input range are precomputed in set_input_range
+        return raw_value * self._v_scale + self._v_offset
+    
+    def _range_scale_offset(self, input_range: int) -> Tuple[float, float]:
+        """
+        Look up (volts per code, offset) for an input range
+        
+        Args:
+            input_range: Input range from ADS7142Config.RANGE_*
+            
+        Returns:
+            Tuple of (scale, offset); unknown ranges scale to the reference voltage
+        """
+        return self._RANGE_TABLE.get(input_range, (self.voltage_reference / 4095.0, 0.0))
     
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self) -> StatusFlags:
         """
         Get device status
         
         Returns:
-            Dictionary containing status information
+            StatusFlags with one bool per STATUS bit (use ._asdict() for a dict)
         """
-        status = self.read_register(ADS7142Registers.STATUS)
+        s = self.read_register(_REG_STATUS)
         
-        return {
-            'conversion_ready': bool(status & 0x01),
-            'fifo_full': bool(status & 0x02),
-            'fifo_empty': bool(status & 0x04),
-            'interrupt_active': bool(status & 0x08),
-            'power_good': bool(status & 0x10),
-            'overrange': bool(status & 0x20),
-            'underrange': bool(status & 0x40),
-            'data_ready': bool(status & 0x80)
-        }
+        return StatusFlags((s & 0x01) != 0, (s & 0x02) != 0, (s & 0x04) != 0, (s & 0x08) != 0,
+                           (s & 0x10) != 0, (s & 0x20) != 0, (s & 0x40) != 0, (s & 0x80) != 0)
+    
+    def get_status_byte(self) -> int:
+        """
+        Get the raw STATUS register for callers that test bits directly
+        
+        Returns:
+            STATUS register value
+        """
+        return self.read_register(_REG_STATUS)
     
     def set_threshold(self, channel: int, threshold: float):
         """
@@ -521,10 +884,9 @@ class ADS7142:
         raw_threshold = int((threshold / self.voltage_reference) * 4095.0)
         raw_threshold = max(0, min(4095, raw_threshold))
         
-        # Write threshold register
+        # Write threshold register pair (MSB, LSB) in one block write
         threshold_register = ADS7142Registers.THRESHOLD_CH0 + channel
-        self.write_register(threshold_register, raw_threshold >> 4)
-        self.write_register(threshold_register + 1, (raw_threshold & 0x0F) << 4)
+        self.write_registers(threshold_register, [raw_threshold >> 4, (raw_threshold & 0x0F) << 4])
         
         self.logger.info(f"Channel {channel} threshold set to {threshold:.6f}V (raw: 0x{raw_threshold:03X})")
     
@@ -539,7 +901,7 @@ class ADS7142:
         if not 0 <= channel <= 7:
             raise ADS7142Error(f"Invalid channel number: {channel}")
         
-        int_mask = self.read_register(ADS7142Registers.INT_MASK)
+        int_mask = self._read_shadow(ADS7142Registers.INT_MASK)
         
         if enable:
             int_mask &= ~(1 << channel)
@@ -549,7 +911,7 @@ class ADS7142:
         self.write_register(ADS7142Registers.INT_MASK, int_mask)
         
         # Enable/disable interrupt generation
-        int_cfg = self.read_register(ADS7142Registers.INT_CFG)
+        int_cfg = self._read_shadow(ADS7142Registers.INT_CFG)
         if enable:
             int_cfg |= 0x01
         else:
@@ -559,40 +921,111 @@ class ADS7142:
         
         self.logger.info(f"Channel {channel} interrupt {'enabled' if enable else 'disabled'}")
     
-    def read_fifo(self, count: Optional[int] = None) -> List[Tuple[int, float]]:
+    def read_fifo(self, count: Optional[int] = None, raw: bool = False) -> List[Tuple[int, Union[float, int]]]:
         """
         Read data from FIFO buffer
         
         Args:
             count: Number of samples to read (None for all available)
+            raw: Return 12-bit ADC codes instead of volts
             
         Returns:
-            List of (channel, voltage) tuples
+            List of (channel, voltage) tuples (or (channel, raw code) if raw=True)
+        """
+        try:
+            channels, voltages = self.read_fifo_arrays(count, raw)
+        except Exception as e:
+            self.logger.error(f"Failed to read FIFO data: {e}")
+            return []
+        
+        return list(zip(channels.tolist(), voltages.tolist()))
+    
+    def read_fifo_arrays(self, count: Optional[int] = None, raw: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read data from FIFO buffer in one bulk transfer and decode it vectorized
+        
+        Args:
+            count: Number of samples to read (None for all available)
+            raw: Return 12-bit ADC codes (uint16) instead of volts; convert
+                later with raw_to_voltage_vec
+            
+        Returns:
+            Tuple of (channels, voltages) arrays (uint8, float32 or uint16 if raw=True)
         """
         if count is None:
-            fifo_count = self.read_register(ADS7142Registers.FIFO_COUNT)
-            count = fifo_count
+            count = self.read_register(_REG_FIFO_COUNT)
+        
+        # Read FIFO data (2 bytes per sample); plain smbus block reads are
+        # limited to 32 bytes, combined i2c_rdwr reads are not
+        total = 2 * count
+        chunk = max(total, 1) if i2c_msg is not None else 32
+        data = bytearray()
+        read_block = self._read_block_rs
+        for start in range(0, total, chunk):
+            data += bytes(read_block(_REG_FIFO_DATA, min(chunk, total - start)))
+        
+        # Extract channel and value, convert to voltage (structure of arrays)
+        channels = np.empty(count, dtype=np.uint8)
+        buf = np.frombuffer(data, dtype=np.uint8)
+        if raw:
+            # Unit scale and zero offset leave the 12-bit codes as they are
+            values = np.empty(count, dtype=np.uint16)
+            decode_fifo(buf, 1.0, 0.0, channels, values)
+            return channels, values
+        
+        voltages = np.empty(count, dtype=np.float32)
+        decode_fifo(buf, self._v_scale, self._v_offset, channels, voltages)
+        
+        return channels, voltages
+    
+    def read_into(self, buffer, channel: int = 0) -> int:
+        """
+        Read consecutive conversions of one channel straight into a caller-owned buffer
         
-        results = []
-        for _ in range(count):
-            try:
-                # Read FIFO data (2 bytes per sample)
-                data = self.read_registers(ADS7142Registers.FIFO_DATA, 2)
-                
-                # Extract channel and value
-                channel = data[0] & 0x07
-                raw_value = ((data[0] & 0xF0) >> 4) | (data[1] << 4)
-                
-                # Convert to voltage
-                voltage = self._raw_to_voltage(raw_value)
-                
-                results.append((channel, voltage))
-                
-            except Exception as e:
-                self.logger.error(f"Failed to read FIFO data: {e}")
-                break
+        Args:
+            buffer: Writable buffer, e.g. a memoryview of an int32 NumPy array,
+                receiving raw 12-bit codes; its size sets the number of samples
+            channel: Channel number (0-7)
+            
+        Returns:
+            Number of samples read; convert with raw_to_voltage_vec
+        """
+        out = np.frombuffer(buffer, dtype=np.int32)
+        read_channel = self.read_channel
+        for i in range(out.shape[0]):
+            out[i] = read_channel(channel, True)
+        return out.shape[0]
+    
+    def raw_to_voltage_vec(self, raw_values: np.ndarray) -> np.ndarray:
+        """
+        Convert an array of raw 12-bit ADC codes to volts in one pass
         
-        return results
+        Args:
+            raw_values: Raw codes, e.g. from read_fifo_arrays(raw=True)
+            
+        Returns:
+            Voltages in volts
+        """
+        return raw_values * self._v_scale + self._v_offset
+    
+    def averaged_voltages(self, channels: np.ndarray, raws: np.ndarray) -> Dict[int, float]:
+        """
+        Average a burst of raw samples per channel (software oversampling)
+        
+        Args:
+            channels: Channel of each sample (uint8), e.g. from read_fifo_arrays(raw=True)
+            raws: Raw 12-bit code of each sample (uint16)
+            
+        Returns:
+            Dictionary mapping channel numbers to mean voltages (channels
+            without samples are omitted)
+        """
+        sums = np.zeros(8, dtype=np.uint64)
+        counts = np.zeros(8, dtype=np.uint64)
+        accumulate(channels, raws, sums, counts)
+        
+        return {ch: (float(sums[ch]) / float(counts[ch])) * self._v_scale + self._v_offset
+                for ch in range(8) if counts[ch]}
     
     def get_device_info(self) -> Dict[str, Any]:
         """
@@ -619,8 +1052,111 @@ class ADS7142:
             'operating_mode': self.operating_mode
         }
     
+    def start_streaming(self, buf_samples: int = 65536, poll_interval: float = 0.0005):
+        """
+        Start a background thread that drains the FIFO into a ring buffer
+        
+        The ring holds raw 2-byte FIFO samples and is allocated once; the
+        producer only advances the head and the consumer (get_samples) only
+        advances the tail, so no lock is needed. Other I2C calls must not be
+        made while streaming.
+        
+        Args:
+            buf_samples: Ring buffer capacity in samples
+            poll_interval: Sleep between FIFO_COUNT polls when the FIFO is empty
+        """
+        if self._stream_thread is not None:
+            raise ADS7142Error("Streaming already started")
+        
+        self._ring = np.empty((buf_samples, 2), dtype=np.uint8)
+        self._ring_head = 0
+        self._ring_tail = 0
+        self.stream_overruns = 0
+        self._stream_stop.clear()
+        self._stream_thread = threading.Thread(target=self._stream_loop, args=(poll_interval,),
+                                               name="ads7142-stream", daemon=True)
+        self._stream_thread.start()
+        self.logger.info(f"Started FIFO streaming ({buf_samples} sample ring)")
+    
+    def stop_streaming(self):
+        """Stop the FIFO streaming thread (buffered samples stay readable)"""
+        if self._stream_thread is None:
+            return
+        self._stream_stop.set()
+        self._stream_thread.join()
+        self._stream_thread = None
+        self.logger.info("Stopped FIFO streaming")
+    
+    def _stream_loop(self, poll_interval: float):
+        """Producer: poll FIFO_COUNT and copy FIFO bytes straight into the ring"""
+        ring = self._ring
+        size = len(ring)
+        max_read = size if i2c_msg is not None else 16  # Plain smbus: 32-byte blocks
+        stopped = self._stream_stop.is_set
+        read_register = self.read_register
+        read_block = self._read_block_rs
+        while not stopped():
+            try:
+                count = read_register(_REG_FIFO_COUNT)
+                free = size - (self._ring_head - self._ring_tail)
+                if count == 0 or free == 0:
+                    if count and not free:
+                        self.stream_overruns += 1
+                    time.sleep(poll_interval)
+                    continue
+                
+                slot = self._ring_head % size
+                n = min(count, free, size - slot, max_read)
+                data = read_block(_REG_FIFO_DATA, 2 * n)
+                ring[slot:slot + n] = np.frombuffer(bytes(data), dtype=np.uint8).reshape(n, 2)
+                self._ring_head += n  # Publish only after the slots are filled
+            except Exception as e:
+                self.logger.error(f"FIFO streaming read failed: {e}")
+                time.sleep(poll_interval)
+    
+    def get_samples(self, max_samples: Optional[int] = None, raw: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Consume streamed samples from the ring buffer
+        
+        Args:
+            max_samples: Maximum number of samples to return (None for all available)
+            raw: Return 12-bit ADC codes (uint16) instead of volts
+            
+        Returns:
+            Tuple of (channels, voltages) arrays, decoded directly from the ring
+        """
+        ring = self._ring
+        if ring is None:
+            raise ADS7142Error("Streaming not started")
+        
+        size = len(ring)
+        tail = self._ring_tail
+        n = self._ring_head - tail
+        if max_samples is not None:
+            n = min(n, max_samples)
+        
+        channels = np.empty(n, dtype=np.uint8)
+        values = np.empty(n, dtype=np.uint16 if raw else np.float32)
+        scale, offset = (1.0, 0.0) if raw else (self._v_scale, self._v_offset)
+        
+        # At most two contiguous segments (before and after the wrap point)
+        done = 0
+        while done < n:
+            slot = (tail + done) % size
+            k = min(n - done, size - slot)
+            decode_fifo(ring[slot:slot + k].reshape(-1), scale, offset,
+                        channels[done:done + k], values[done:done + k])
+            done += k
+        
+        self._ring_tail = tail + n
+        return channels, values
+    
     def close(self):
         """Close the I2C bus connection"""
+        self.stop_streaming()
+        if self._i2c_fd is not None:
+            os.close(self._i2c_fd)
+            self._i2c_fd = None
         try:
             self.bus.close()
             self.logger.info("I2C bus closed")
@@ -636,6 +1172,93 @@ class ADS7142:
         self.close()
 
 
+class AsyncADS7142:
+    """
+    asyncio facade for ADS7142
+    
+    Every I2C call runs on a single-worker thread pool, so the event loop is
+    never blocked and bus transactions stay serialized (the bus is not
+    thread-safe).
+    """
+    
+    def __init__(self, adc: Optional[ADS7142] = None, **kwargs):
+        """
+        Initialize the async wrapper
+        
+        Args:
+            adc: Existing ADS7142 instance to wrap (None to create one)
+            **kwargs: Arguments for ADS7142 when adc is None
+        """
+        self._sync = adc if adc is not None else ADS7142(**kwargs)
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ads7142")
+    
+    @property
+    def adc(self) -> ADS7142:
+        """Wrapped synchronous driver"""
+        return self._sync
+    
+    async def _run(self, func, *args):
+        """Run a blocking driver call on the I2C worker thread"""
+        return await asyncio.get_running_loop().run_in_executor(self._pool, func, *args)
+    
+    async def read_register(self, register: int) -> int:
+        """Async read_register(), see ADS7142.read_register"""
+        return await self._run(self._sync.read_register, register)
+    
+    async def read_registers(self, start_register: int, count: int) -> List[int]:
+        """Async read_registers(), see ADS7142.read_registers"""
+        return await self._run(self._sync.read_registers, start_register, count)
+    
+    async def write_register(self, register: int, value: int):
+        """Async write_register(), see ADS7142.write_register"""
+        return await self._run(self._sync.write_register, register, value)
+    
+    async def read_channel(self, channel: int, raw: bool = False) -> Union[float, int]:
+        """Async read_channel(), see ADS7142.read_channel"""
+        return await self._run(self._sync.read_channel, channel, raw)
+    
+    async def read_all_channels(self, raw: bool = False) -> Dict[int, Union[float, int]]:
+        """Async read_all_channels(), see ADS7142.read_all_channels"""
+        return await self._run(self._sync.read_all_channels, raw)
+    
+    async def read_single_shot(self, channels: Optional[List[int]] = None) -> Dict[int, float]:
+        """Async read_single_shot(), see ADS7142.read_single_shot"""
+        return await self._run(self._sync.read_single_shot, channels)
+    
+    async def read_fifo(self, count: Optional[int] = None, raw: bool = False) -> List[Tuple[int, Union[float, int]]]:
+        """Async read_fifo(), see ADS7142.read_fifo"""
+        return await self._run(self._sync.read_fifo, count, raw)
+    
+    async def read_fifo_arrays(self, count: Optional[int] = None, raw: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Async read_fifo_arrays(), see ADS7142.read_fifo_arrays"""
+        return await self._run(self._sync.read_fifo_arrays, count, raw)
+    
+    async def read_into(self, buffer, channel: int = 0) -> int:
+        """Async read_into(), see ADS7142.read_into"""
+        return await self._run(self._sync.read_into, buffer, channel)
+    
+    async def get_status(self) -> StatusFlags:
+        """Async get_status(), see ADS7142.get_status"""
+        return await self._run(self._sync.get_status)
+    
+    async def get_status_byte(self) -> int:
+        """Async get_status_byte(), see ADS7142.get_status_byte"""
+        return await self._run(self._sync.get_status_byte)
+    
+    async def close(self):
+        """Close the I2C bus and shut down the worker thread"""
+        await self._run(self._sync.close)
+        self._pool.shutdown(wait=True)
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+
+
 # Example usage and testing
 if __name__ == "__main__":
     try:
@@ -674,7 +1297,7 @@ if __name__ == "__main__":
         # Get status
         status = adc.get_status()
         print("Device status:")
-        for key, value in status.items():
+        for key, value in status._asdict().items():
             print(f"  {key}: {value}")
         
     except Exception as e:
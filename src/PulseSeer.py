@@ -36,7 +36,13 @@ from PyQt6.QtGui import QPixmap, QIcon, QScreen, QTextCursor
 import pyqtgraph as pg
 import numpy as np
 import csv
+import io
+import math
 import os
+import queue
+import shutil
+import threading
+from collections import deque
 from datetime import datetime
 try:
     from ADS131M02_driver import ADS131M02
@@ -45,6 +51,7 @@ except ImportError:
     ADS131M02_AVAILABLE = False
     print("ADS131M02 driver not available - will try ADS7142")
 from ADS7142_driver_new import ADS7142  # Import the ADS7142 driver
+from _pulse_detect import find_pulses, score_cycles, cycle_stats, warm_up as warm_up_pulse_detect
 import time
 try:
     import gpiod
@@ -55,20 +62,101 @@ except ImportError:
 import spidev
 import RPi.GPIO as GPIO
 
-PARAMETERS = ["700nm", "800nm", "850nm", "900nm", "970nm", "1050nm"]
+PARAMETERS = ("700nm", "800nm", "850nm", "900nm", "970nm", "1050nm")
+# Column header of the data log files
+LOG_HEADER = ("Time", "Current_Time", *PARAMETERS, *(f"Calibrated_{param}" for param in PARAMETERS), "CH0_Gain", "CH1_Gain")
+
+# One row per detected cycle; t is time.monotonic_ns(), interval is in seconds and
+# vstats holds the cycle's pulse voltage [mean, std, vmin, vmax]
+CYCLE_DTYPE = np.dtype([
+    ('t', 'i8'), ('interval', 'f4'), ('score', 'f4'), ('quality', 'f4'), ('npulses', 'i2'),
+    ('vstats', 'f4', (4,)),
+])
+
+# LTC6903 OCT ranges: (f_min, f_max, OCT)
+_LTC6903_OCT_TABLE = [
+    (34050000, 68030000, 15), (17020000, 34010000, 14), (8511000, 17010000, 13), (4256000, 8503000, 12),
+    (2128000, 4252000, 11), (1064000, 2126000, 10), (532000, 1063000, 9), (266000, 531400, 8),
+    (133000, 265700, 7), (66500, 132900, 6), (33200, 66200, 5), (16600, 33220, 4), (8310, 16610, 3),
+    (4150, 8300, 2), (2070, 4140, 1), (1039, 2076, 0),
+]
+
+def ltc6903_config_bytes(frequency_hz):
+    """Return (OCT, DAC, command bytes) programming the LTC6903 to frequency_hz"""
+    oct_val = None
+    for f_min, f_max, oct_candidate in _LTC6903_OCT_TABLE:
+        if frequency_hz >= f_min and frequency_hz < f_max:
+            oct_val = oct_candidate
+            break
+    if oct_val is None:
+        if frequency_hz < _LTC6903_OCT_TABLE[-1][0]:
+            oct_val = _LTC6903_OCT_TABLE[-1][2]
+        else:
+            oct_val = _LTC6903_OCT_TABLE[0][2]
+    dac_float = 2048 - (2078 * (2 ** (10 + oct_val))) / frequency_hz
+    dac = int(round(dac_float))
+    dac = max(0, min(1023, dac))
+    command = ((oct_val & 0xF) << 12) | ((dac & 0x3FF) << 2)
+    cmd_bytes = [(command >> 8) & 0xFF, command & 0xFF]
+    return oct_val, dac, cmd_bytes
+
+# Precomputed settings for the ADC clock frequencies in use
+_LTC6903_LUT = {f: ltc6903_config_bytes(f) for f in (8192000, 4096000, 2048000)}
 
 # Custom stream object to redirect stdout
 class ConsoleStream(QObject):
     new_text = pyqtSignal(str)
+    FLUSH_INTERVAL_MS = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Writes are batched and emitted as one signal per flush interval
+        self._pending = []
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start(self.FLUSH_INTERVAL_MS)
 
     def write(self, text):
         # Filter out pyqtgraph's benign "ignored exception" message
         if "ignored exception" in text:
             return
-        self.new_text.emit(str(text))
+        self._pending.append(str(text))
     
     def flush(self):
-        pass # Required for stream interface
+        if self._pending:
+            # Swap the list first so writes from other threads land in the next batch
+            pending, self._pending = self._pending, []
+            self.new_text.emit(''.join(pending))
+
+# Dialog stylesheets, built once at import instead of per widget
+_CONFIRM_BTN_QSS = """
+    QPushButton {
+        font-size: 24px;
+        font-weight: bold;
+        padding: 20px 40px;
+        background-color: %s;
+        color: white;
+        border: none;
+        border-radius: 10px;
+        min-height: 60px;
+    }
+    QPushButton:hover {
+        background-color: %s;
+    }
+"""
+_YES_BTN_QSS = _CONFIRM_BTN_QSS % ("#4caf50", "#45a049")
+_NO_BTN_QSS = _CONFIRM_BTN_QSS % ("#f44336", "#da190b")
+_SPLASH_TITLE_QSS = "font-size: 36px; font-weight: bold; color: #d32f2f;"
+_SPLASH_TEXT_QSS = "font-size: 20px; line-height: 1.6; color: #333;"
+_KEYPAD_QSS = "QPushButton { font-size: 22px; }"
+
+# Ratio flag styles: NORMAL mode labels and ADVANCED mode fields
+_NORMAL_RATIO_LOW_QSS = "font-size: 16px; background-color: red; color: white;"
+_NORMAL_RATIO_OK_QSS = "font-size: 16px; background-color: green; color: white;"
+_NORMAL_RATIO_NONE_QSS = "font-size: 16px;"
+_ADV_RATIO_LOW_QSS = "background-color: red; color: white;"
+_ADV_RATIO_OK_QSS = "background-color: green; color: white;"
+_ADV_RATIO_NONE_QSS = ""
 
 class SplashScreenDialog(QDialog):
     def __init__(self, parent=None):
@@ -87,7 +175,7 @@ class SplashScreenDialog(QDialog):
         
         # Warning icon and title
         title_label = QLabel("âš ï¸  SAFETY WARNING  âš ï¸")
-        title_label.setStyleSheet("font-size: 36px; font-weight: bold; color: #d32f2f;")
+        title_label.setStyleSheet(_SPLASH_TITLE_QSS)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
@@ -107,7 +195,7 @@ class SplashScreenDialog(QDialog):
         """
         
         warning_label = QLabel(warning_text)
-        warning_label.setStyleSheet("font-size: 20px; line-height: 1.6; color: #333;")
+        warning_label.setStyleSheet(_SPLASH_TEXT_QSS)
         warning_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         warning_label.setWordWrap(True)
         layout.addWidget(warning_label)
@@ -116,39 +204,11 @@ class SplashScreenDialog(QDialog):
         button_layout = QHBoxLayout()
         
         yes_btn = QPushButton("YES - IR LEDs are ON")
-        yes_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 24px;
-                font-weight: bold;
-                padding: 20px 40px;
-                background-color: #4caf50;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                min-height: 60px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        yes_btn.setStyleSheet(_YES_BTN_QSS)
         yes_btn.clicked.connect(self.accept)
         
         no_btn = QPushButton("NO - Exit Application")
-        no_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 24px;
-                font-weight: bold;
-                padding: 20px 40px;
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                min-height: 60px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-        """)
+        no_btn.setStyleSheet(_NO_BTN_QSS)
         no_btn.clicked.connect(self.reject)
         
         button_layout.addWidget(yes_btn)
@@ -164,6 +224,8 @@ class NumberKeypadDialog(QDialog):
         self.setWindowTitle("Enter Engineering Password")
         self.setModal(True)
         self.setFixedSize(340, 420)
+        # Keypad buttons inherit their style from the dialog
+        self.setStyleSheet(_KEYPAD_QSS)
         layout = QVBoxLayout(self)
         self.label = QLabel("Enter Password:")
         self.label.setStyleSheet("font-size: 18px; font-weight: bold;")
@@ -181,7 +243,6 @@ class NumberKeypadDialog(QDialog):
             for key in row:
                 btn = QPushButton(key)
                 btn.setFixedSize(80, 60)
-                btn.setStyleSheet("font-size: 22px;")
                 if key == "OK":
                     btn.clicked.connect(self.accept)
                 elif key == "Clear":
@@ -204,6 +265,9 @@ class MainWindow(QWidget):
         self.setWindowTitle("PulseSeer")
         self.setWindowIcon(QIcon("logo.png"))
         self.setGeometry(100, 100, 1000, 570)
+        # PARAMETERS never changes, so its length and enumeration are built once for the hot paths
+        self._n_params = len(PARAMETERS)
+        self._param_enum = tuple(enumerate(PARAMETERS))
         self.calibrated_values = {param: None for param in PARAMETERS}
         
         # Show splash screen on startup
@@ -216,29 +280,6 @@ class MainWindow(QWidget):
         CS2_PIN = 20
         SPI_BUS = 0
         SPI_DEVICE = 0
-        def ltc6903_config_bytes(frequency_hz):
-            oct_table = [
-                (34050000, 68030000, 15), (17020000, 34010000, 14), (8511000, 17010000, 13), (4256000, 8503000, 12),
-                (2128000, 4252000, 11), (1064000, 2126000, 10), (532000, 1063000, 9), (266000, 531400, 8),
-                (133000, 265700, 7), (66500, 132900, 6), (33200, 66200, 5), (16600, 33220, 4), (8310, 16610, 3),
-                (4150, 8300, 2), (2070, 4140, 1), (1039, 2076, 0),
-            ]
-            oct_val = None
-            for f_min, f_max, oct_candidate in oct_table:
-                if frequency_hz >= f_min and frequency_hz < f_max:
-                    oct_val = oct_candidate
-                    break
-            if oct_val is None:
-                if frequency_hz < oct_table[-1][0]:
-                    oct_val = oct_table[-1][2]
-                else:
-                    oct_val = oct_table[0][2]
-            dac_float = 2048 - (2078 * (2 ** (10 + oct_val))) / frequency_hz
-            dac = int(round(dac_float))
-            dac = max(0, min(1023, dac))
-            command = ((oct_val & 0xF) << 12) | ((dac & 0x3FF) << 2)
-            cmd_bytes = [(command >> 8) & 0xFF, command & 0xFF]
-            return oct_val, dac, cmd_bytes
         try:
             self.ltc6903_spi = spidev.SpiDev()
             self.ltc6903_spi.open(SPI_BUS, SPI_DEVICE)
@@ -248,7 +289,7 @@ class MainWindow(QWidget):
             GPIO.setmode(GPIO.BCM)
             GPIO.setup(CS2_PIN, GPIO.OUT, initial=GPIO.HIGH)
             freq_hz = 8192000
-            oct_val, dac_val, cmd_bytes = ltc6903_config_bytes(freq_hz)
+            oct_val, dac_val, cmd_bytes = _LTC6903_LUT.get(freq_hz) or ltc6903_config_bytes(freq_hz)
             GPIO.output(CS2_PIN, GPIO.LOW)
             self.ltc6903_spi.xfer2(cmd_bytes)
             GPIO.output(CS2_PIN, GPIO.HIGH)
@@ -269,12 +310,10 @@ class MainWindow(QWidget):
                 print("ADS131M02 initialized successfully (preferred)")
                 device_id = self.adc.get_device_id()
                 print(f"Device ID: 0x{device_id:04X}")
-                self.adc.set_sampling_rate(ADS131M02.OSR_8192)
-                self.adc.set_gain(0, self.adc.GAIN_1)  # Channel 0
-                self.adc.set_gain(1, self.adc.GAIN_1)  # Channel 1
-                self.adc.set_dc_blocking_filter(0, False)   # Enable DC blocking on Channel 0
-                self.adc.set_dc_blocking_filter(1, False)  # Disable DC blocking on Channel 1
-                self.adc.enable_continuous_sampling(True)
+                self.adc.configure(osr=ADS131M02.OSR_8192,
+                                   gain0=self.adc.GAIN_1, gain1=self.adc.GAIN_1,
+                                   dc_block0=False, dc_block1=False,  # DC blocking off on both channels
+                                   continuous=True)
                 # Automatically adjust gain for CH0 only
                 self.auto_adjust_gain(channel=0, threshold_low=0.1, threshold_high=1.0)
                 
@@ -332,7 +371,26 @@ class MainWindow(QWidget):
         self.PULSE_WIDTH_MS = 0.24  # milliseconds
         self.CYCLE_PERIOD_MS = 3.9  # milliseconds
         self.MIN_VOLTAGE_THRESHOLD = 0.1  # Minimum voltage to consider as a pulse (100mV threshold)
-        self.raw_buffer = []  # Store raw voltage readings
+        # Preallocated ring buffer for raw voltage readings, quantized to int16
+        # with a 0.1 mV LSB (saturates at +/-3.2767 V); pulse edges are found on
+        # the int16 codes and only the batch view is converted back to float32
+        self.RAW_BUFFER_SIZE = 8192
+        self.RAW_LSB_V = 1e-4
+        self._rb = np.empty(self.RAW_BUFFER_SIZE, dtype=np.int16)
+        self._thresh_i16 = int(round(self.MIN_VOLTAGE_THRESHOLD / self.RAW_LSB_V))
+        # Compile the pulse-detection kernels now rather than on the first scan batch
+        warm_up_pulse_detect()
+        self._rb_head = 0  # Next write position
+        self._rb_count = 0  # Number of valid samples in the ring
+        # Preallocated per-block ADC read buffers, filled by the driver's read_into()
+        # through a memoryview: raw codes (interleaved [ch0, ch1] for the
+        # ADS131M02, CH0 only for the ADS7142) and CH0 volts
+        self.ADC_BLOCK_MAX = 64
+        self._raw_batch = np.empty(2 * self.ADC_BLOCK_MAX, dtype=np.int32)
+        self._raw_view = memoryview(self._raw_batch)
+        self._volts_batch = np.empty(self.ADC_BLOCK_MAX, dtype=np.float32)
+        self._quant_batch = np.empty(self.ADC_BLOCK_MAX, dtype=np.float32)  # _rb_push scratch
+        self._adc_block_size = 1  # Adapted to the measured data rate while reading
         self.last_pulse_time = 0
         self.pulse_count = 0
         self.empty_count = 0
@@ -341,7 +399,7 @@ class MainWindow(QWidget):
         
         # Add timeout parameters for cycle detection
         self.CYCLE_TIMEOUT_SEC = 3.0  # Timeout in seconds
-        self.last_cycle_time = time.time()
+        self.last_cycle_time = time.monotonic_ns()
         self.in_timeout = False
         self.consecutive_cycles = 0
         self.is_locked = False
@@ -350,38 +408,39 @@ class MainWindow(QWidget):
         self.BATCH_TIMER_INTERVAL_MS = 22  # 50 Hz timer
         self.last_sample_batch_time = 0
         
-        # Add timer for 3-second delay before showing "NO PATTERN DETECTED"
-        self.no_pattern_timer = QTimer(self)
-        self.no_pattern_timer.setSingleShot(True)
-        self.no_pattern_timer.timeout.connect(self.show_no_pattern_detected)
-        self.last_pattern_detection_time = time.time()
+        # 3-second delay before showing "NO PATTERN DETECTED", checked on each scan tick
+        self.NO_PATTERN_DELAY_NS = 3_000_000_000
+        self._no_pattern_due = 0
+        self.last_pattern_detection_time = time.monotonic_ns()
         self.pattern_detection_active = False
         
         # Add continuous averaging mechanism
         self.continuous_wavelength_cycle = 0  # Continuous wavelength cycling counter
-        self.continuous_sample_buffer = {param: [] for param in PARAMETERS}  # Continuous averaging buffer
+        self.CONTINUOUS_WINDOW = 100  # Number of recent batch averages in the continuous rolling mean
+        self._reset_continuous_average()
         
         # Graph averaging configuration
         self.graph_averaging_window = 10  # Default number of recent pulses to average for graph display
-        self.last_cycle_count_time = time.time()  # Track when we last counted cycles
+        self.last_cycle_count_time = time.monotonic_ns()  # Track when we last counted cycles
         self.cycles_in_last_second = 0  # Count of cycles in the last second
         
         # Enhanced cycle statistics
-        self.cycle_timestamps = []  # Store timestamps of detected cycles
-        self.cycle_intervals = []   # Store time intervals between cycles
-        self.cycle_scores = []      # Store correlation scores for each cycle
-        self.cycle_qualities = []   # Store quality metrics for each cycle
-        self.cycle_pulse_counts = [] # Store number of pulses detected in each cycle
-        self.cycle_voltage_stats = [] # Store voltage statistics for each cycle
+        self.MAX_CYCLES = 16384  # Capacity of the per-cycle ring buffer
+        self.CYCLE_STATS_WINDOW = 100  # Summary statistics cover the last 100 cycles
+        self._cycles = np.empty(self.MAX_CYCLES, dtype=CYCLE_DTYPE)
+        self._ncycles = 0  # Total cycles recorded; the write index is _ncycles % MAX_CYCLES
+        self.last_pulse_voltages = None  # Pulse voltages of the most recent cycle
         self.last_cycle_detection_time = 0
         self.cycle_detection_count = 0
         self.total_cycles_detected = 0
-        self.cycle_rate_history = [] # Store cycle rates over time
-        self.pattern_quality_history = [] # Store pattern quality over time
+        # Cycle rate (row TREND_RATE) and pattern quality (row TREND_QUALITY) over time,
+        # each a ring of the last TREND_SIZE values with its own total count in _trend_n
+        self.TREND_SIZE = 50
+        self.TREND_RATE, self.TREND_QUALITY = 0, 1
+        self._reset_trends()
         
         # Wavelength cycling and data assignment
         self.wavelength_cycle_count = 0  # Count of cycles to determine wavelength
-        self.wavelength_data = {param: [] for param in PARAMETERS}  # Store data for each wavelength
         self.current_wavelength = PARAMETERS[0]  # Current wavelength being measured
         
         # Calculate samples per pulse and cycle based on sampling rate
@@ -390,7 +449,11 @@ class MainWindow(QWidget):
         self.measure_start_time = None
         self.adc_read_count = 0
         self.cycle_detected_count = 0
-        self.sample_timestamps = []  # Store timestamps of ADC samples
+        # Samples-per-second over the last stats interval from two counters
+        # (adc_read_count is the running total)
+        self._samples_last = 0
+        self._sps_tref = time.monotonic()
+        self.interval_sps = 0.0
 
         self.set_operation_mode('field') # Start in Field Operation Mode by default
 
@@ -433,17 +496,37 @@ class MainWindow(QWidget):
         self.graph_widget.showGrid(x=True, y=True)
         self.graph_widget.setLabel('left', 'Value')
         self.graph_widget.setLabel('bottom', 'Time (s)')
+        # Let pyqtgraph decimate long curves and skip off-screen points
+        self.graph_widget.setDownsampling(auto=True, mode='peak')
+        self.graph_widget.setClipToView(True)
+        self.graph_widget.setAntialiasing(False)
+        # Reusable plot buffers sized for the data points slider maximum
+        self.MAX_PLOT_POINTS = 600
+        self._xbuf = np.zeros(self.MAX_PLOT_POINTS, dtype=np.float32)
+        self._ybuf = {param: np.zeros(self.MAX_PLOT_POINTS, dtype=np.float32) for param in PARAMETERS}
         self.curves = {}
         for i, param in enumerate(PARAMETERS):
             color = pg.intColor(i, hues=len(PARAMETERS))
-            self.curves[param] = self.graph_widget.plot(pen=pg.mkPen(color, width=2), name=param, symbol='o', symbolSize=5, symbolBrush=color)
+            # Lines only; per-point symbols are switched on for short windows in update_graph
+            self.curves[param] = self.graph_widget.plot(pen=pg.mkPen(color, width=2), name=param, symbolSize=5, symbolBrush=color)
+        self.MARKER_MAX_POINTS = 50  # Show point markers only below this many points
+        self._markers_shown = False
         self.graph_stack.addWidget(self.graph_widget)
         # Bar graph (for NORMAL MODE)
         self.bar_widget = pg.PlotWidget()
         self.bar_widget.setBackground('w')
         self.bar_widget.setLabel('left', 'Value')
         self.bar_widget.setLabel('bottom', 'Wavelength')
-        self.bar_item = None
+        # Current (blue) and calibrated (red) bars side by side; update_graph only changes their heights
+        x = np.arange(len(PARAMETERS))
+        self._bar_x_cur = x - 0.15
+        self._bar_x_calib = x + 0.15
+        self.bar_item = pg.BarGraphItem(x=self._bar_x_cur, height=np.zeros(len(PARAMETERS)), width=0.3, brush='b')
+        self.bar_widget.addItem(self.bar_item)
+        self.bar_item_calib = pg.BarGraphItem(x=self._bar_x_calib, height=np.zeros(len(PARAMETERS)), width=0.3, brush='r')
+        self.bar_widget.addItem(self.bar_item_calib)
+        # Set x-axis ticks to wavelength labels
+        self.bar_widget.getAxis('bottom').setTicks([list(enumerate(PARAMETERS))])
         self.graph_stack.addWidget(self.bar_widget)
         left_layout.addWidget(self.graph_stack)
         main_layout.addLayout(left_layout, stretch=3)
@@ -531,10 +614,10 @@ class MainWindow(QWidget):
         checkbox_layout.setSpacing(8)
         self.show_db_checkbox = QCheckBox("Show in dB")
         self.show_db_checkbox.setChecked(True)
-        self.show_db_checkbox.stateChanged.connect(self.update_graph)
+        self.show_db_checkbox.stateChanged.connect(self._schedule_redraw)
         self.show_all_checkbox = QCheckBox("Show all")
         self.show_all_checkbox.setChecked(False)
-        self.show_all_checkbox.stateChanged.connect(self.update_graph)
+        self.show_all_checkbox.stateChanged.connect(self._schedule_redraw)
         self.continuous_checkbox = QCheckBox("Continuous mode")
         self.continuous_checkbox.setChecked(False)
         self.continuous_checkbox.stateChanged.connect(self.on_continuous_mode_changed)
@@ -576,6 +659,10 @@ class MainWindow(QWidget):
         self.datapoints_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.datapoints_slider.setFixedWidth(200)
         self.datapoints_slider.valueChanged.connect(self.update_datapoints_label)
+        # Redraw once the slider has rested for 150 ms rather than on every value it passes
+        self._datapoints_debounce = QTimer(self)
+        self._datapoints_debounce.setSingleShot(True)
+        self._datapoints_debounce.timeout.connect(self._schedule_redraw)
         self.datapoints_layout.addWidget(self.datapoints_label)
         self.datapoints_layout.addWidget(self.datapoints_slider)
         self.datapoints_layout.setContentsMargins(0, 2, 0, 0)
@@ -606,6 +693,17 @@ class MainWindow(QWidget):
         self.normal_db_labels = {}
         self.normal_calib_db_labels = {}
         self.normal_diff_db_labels = {}
+        # Last text and stylesheet set on each label/field by update_graph, so unchanged ones are not set again
+        self._last_text = {}
+        self._last_style = {}
+        self._last_value = {}  # (value, format spec) behind the text set by _set_num
+        self._y_label = None
+        # Redraw requests are coalesced into at most one update_graph per REDRAW_INTERVAL_MS
+        self.REDRAW_INTERVAL_MS = 33
+        self._redraw_pending = False
+        # Current/calibrated values behind the NORMAL mode columns, one per wavelength
+        self._cur_v = np.zeros(len(PARAMETERS))
+        self._calib_v = np.zeros(len(PARAMETERS))
         
         for i, param in enumerate(PARAMETERS):
             # Create wavelength labels with larger font
@@ -627,6 +725,10 @@ class MainWindow(QWidget):
             normal_grid.addWidget(db_label, i+1, 1)
             normal_grid.addWidget(calib_db_label, i+1, 2)
             normal_grid.addWidget(diff_db_label, i+1, 3)
+        # NORMAL mode labels of each wavelength as (current, calibrated, ratio), indexed like PARAMETERS
+        self._normal_labels = tuple(
+            (self.normal_db_labels[p], self.normal_calib_db_labels[p], self.normal_diff_db_labels[p])
+            for p in PARAMETERS)
         normal_layout.addLayout(normal_grid)
         self.tabs.addTab(normal_tab, "NORMAL MODE")
         # ADVANCE tab (existing parameter grid)
@@ -735,6 +837,12 @@ class MainWindow(QWidget):
             minmax_layout.addWidget(min_db_field, 10, j+1)
             minmax_layout.addWidget(max_db_field, 11, j+1)
             minmax_layout.addWidget(diff_db_field, 12, j+1)
+        # Field widgets of each wavelength as one tuple, indexed like PARAMETERS, for update_graph
+        self._adv_fields = tuple(
+            (self.calib_fields[p], self.cur_fields[p], self.min_fields[p], self.max_fields[p],
+             self.diff_pct_fields[p], self.calib_db_fields[p], self.db_fields[p],
+             self.min_db_fields[p], self.max_db_fields[p], self.diff_db_fields[p])
+            for p in PARAMETERS)
         minmax_group.setLayout(minmax_layout)
         advance_layout.addWidget(minmax_group)
         self.tabs.addTab(advance_tab, "ADVANCED MODE")
@@ -744,6 +852,8 @@ class MainWindow(QWidget):
         console_layout = QVBoxLayout(console_tab)
         self.console_output = QTextEdit()
         self.console_output.setReadOnly(True)
+        # Keep only the most recent lines; Qt drops the oldest blocks as new text arrives
+        self.console_output.document().setMaximumBlockCount(2000)
         console_layout.addWidget(self.console_output)
         self.tabs.addTab(console_tab, "CONSOLE")
         
@@ -760,25 +870,26 @@ class MainWindow(QWidget):
 
         # Example: Simulate data update
         self.buffer_size = 600
-        self.t = []
-        self.data = {param: [] for param in PARAMETERS}
-        self.all_data = {param: [] for param in PARAMETERS}  # Not needed, just use self.data
+        # Measurement history: one time value and one row of PARAMETERS values per
+        # graph update, in preallocated arrays that double when full
+        self.HISTORY_INITIAL_SIZE = 4096
+        self._reset_history()
         self.update_graph()
 
-        # Timers for sampling and graph update
-        self.sampling_timer = QTimer(self)
-        self.sampling_timer.timeout.connect(self.sample_data)
-        self.graph_timer = QTimer(self)
-        self.graph_timer.timeout.connect(self.update_graph_from_buffer)
-        # Add timer for cycle statistics display
-        self.stats_timer = QTimer(self)
-        self.stats_timer.timeout.connect(self.print_cycle_statistics)
-        # self.sampling_timer.start(...)  # Will be started by SCAN
-        # self.graph_timer.start(1000)    # Will be started by SCAN
-        # self.stats_timer.start(5000)    # Will be started by SCAN - every 5 seconds
-
-        # Buffer for samples within each second
-        self.sample_buffer = {param: [] for param in PARAMETERS}
+        # Single scan timer: every tick samples a batch, and the graph update
+        # (every second) and cycle statistics (every 5 seconds) run when due
+        self.GRAPH_INTERVAL_NS = 1_000_000_000
+        self.STATS_INTERVAL_NS = 5_000_000_000
+        self._graph_due = 0
+        self._stats_due = 0
+        self.scan_timer = QTimer(self)
+        self.scan_timer.timeout.connect(self._on_scan_tick)
+        # self.scan_timer.start(...)  # Will be started by SCAN
+
+        # Buffer of recent pulse voltages per wavelength, bounded well above the
+        # largest averaging window (30 pulses) so old pulses are dropped in O(1)
+        self.PULSE_BUFFER_SIZE = 1024
+        self._reset_pulse_buffers()
         self.samples_per_second = (self.sampling_slider.value() / 10) * 1000
         self.sampling_slider.valueChanged.connect(self.update_sampling_rate)
 
@@ -791,6 +902,9 @@ class MainWindow(QWidget):
 
         # New attribute for calibrated values
         self.calibrated_values = {param: None for param in PARAMETERS}
+        # Calibration and gain columns of the log rows, rebuilt only when they change
+        self._update_log_calib()
+        self._update_log_gains()
         self.calibrate_btn.clicked.connect(self.calibrate_current_values)
 
         self.sampling_slider.setValue(45)  # Default 45 Hz
@@ -806,29 +920,156 @@ class MainWindow(QWidget):
 
     def init_log_files(self):
         # Create a directory for today's logs
-        today_str = datetime.now().strftime("%Y-%m-%d")
-        log_dir = os.path.join(os.getcwd(), today_str)
+        now = datetime.now()
+        log_dir = os.path.join(os.getcwd(), now.strftime("%Y-%m-%d"))
         os.makedirs(log_dir, exist_ok=True)
         
         # Update file paths to include the new directory
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         self.text_log_file = os.path.join(log_dir, f"data_log_{timestamp}.txt")
         self.csv_log_file = os.path.join(log_dir, f"data_log_{timestamp}.csv")
         
-        # Initialize text log file with header if not exists
-        header = ["Time", "Current_Time"] + PARAMETERS + [f"Calibrated_{param}" for param in PARAMETERS] + ["CH0_Gain", "CH1_Gain"]
-        if not os.path.exists(self.text_log_file):
-            with open(self.text_log_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(header)
-        # Initialize CSV log file with header if not exists
-        if not os.path.exists(self.csv_log_file):
-            with open(self.csv_log_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(header)
+        # Open the freshly timestamped log file once and write the header;
+        # rows are written by the _log_worker thread
+        self._txt_fh = open(self.text_log_file, 'w', newline='')
+        csv.writer(self._txt_fh).writerow(LOG_HEADER)
+        self._txt_fh.flush()
+        # The .csv file has identical content: hard-link it to the .txt file so
+        # each row is written once. Filesystems without hard links get a copy on close.
+        try:
+            os.link(self.text_log_file, self.csv_log_file)
+            self._csv_linked = True
+        except OSError:
+            self._csv_linked = False
+        # (second, formatted timestamp) of the most recent log row
+        self._ts_cache = (0, "")
+        # log_data only queues rows; the worker writes and flushes them off the GUI thread
+        self._log_q = queue.SimpleQueue()
+        self._log_thread = threading.Thread(target=self._log_worker, daemon=True)
+        self._log_thread.start()
+
+    def _log_worker(self):
+        """
+        Format queued log rows into a memory buffer and write it to the file in one
+        call once it holds 32 KB or its oldest row is 50 ms old, until a None row arrives.
+        """
+        buf = io.StringIO()
+        deadline = None  # Write-out time of the buffered rows
+        running = True
+        while running:
+            try:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                row = self._log_q.get(timeout=timeout)
+                if row is None:
+                    running = False
+                else:
+                    # Rows are numbers and a timestamp, so no field needs CSV quoting
+                    buf.write(",".join(map(str, row)))
+                    buf.write("\r\n")
+                    if deadline is None:
+                        deadline = time.monotonic() + 0.05
+            except queue.Empty:
+                pass
+            if buf.tell() and (not running or buf.tell() > 32 * 1024 or time.monotonic() >= deadline):
+                try:
+                    self._txt_fh.write(buf.getvalue())
+                    self._txt_fh.flush()
+                except (OSError, ValueError) as e:
+                    print(f"Error writing log file: {e}")
+                buf.seek(0)
+                buf.truncate()
+                deadline = None
+
+    def _close_logs(self):
+        """Drain the log queue and close the log file, copying it to the .csv path if it could not be linked"""
+        self._log_q.put(None)
+        self._log_thread.join(timeout=2.0)
+        self._txt_fh.close()
+        if not self._csv_linked:
+            try:
+                shutil.copyfile(self.text_log_file, self.csv_log_file)
+            except OSError as e:
+                print(f"Error copying log to {self.csv_log_file}: {e}")
 
     def db_value(self, v):
-        return 20 * np.log10(abs(v)) if v != 0 else 0
+        """Scalar db_value; math.log10 avoids NumPy ufunc dispatch for a single float"""
+        return 20.0 * math.log10(abs(v)) if v else 0.0
+
+    def db_values(self, v):
+        """Vectorized db_value for an array of voltages (0 V maps to 0 dB)"""
+        v = np.asarray(v, dtype=np.float64)
+        nonzero = v != 0
+        return np.where(nonzero, 20 * np.log10(np.abs(np.where(nonzero, v, 1.0))), 0.0)
+
+    def _reset_history(self):
+        """Drop the measurement history"""
+        self._t_hist = np.empty(self.HISTORY_INITIAL_SIZE, dtype=np.float64)
+        self._data_hist = np.empty((len(PARAMETERS), self.HISTORY_INITIAL_SIZE), dtype=np.float64)
+        self._hist_n = 0
+
+    def _history_append(self, t, row):
+        """Append time t and one value per parameter (in PARAMETERS order) to the history"""
+        n = self._hist_n
+        if n == self._t_hist.shape[0]:
+            t_hist = np.empty(2 * n, dtype=np.float64)
+            t_hist[:n] = self._t_hist
+            data_hist = np.empty((len(PARAMETERS), 2 * n), dtype=np.float64)
+            data_hist[:, :n] = self._data_hist
+            self._t_hist, self._data_hist = t_hist, data_hist
+        self._t_hist[n] = t
+        self._data_hist[:, n] = row
+        self._hist_n = n + 1
+
+    def _history_view(self, n=None):
+        """
+        Return (t, values) views of the newest n history points (default: all).
+        values has one row per parameter; both are zero-copy slices.
+        """
+        end = self._hist_n
+        start = 0 if n is None else max(0, end - n)
+        return self._t_hist[start:end], self._data_hist[:, start:end]
+
+    def _schedule_redraw(self):
+        """Request an update_graph; requests arriving before it runs share the same redraw"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            QTimer.singleShot(self.REDRAW_INTERVAL_MS, self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self.update_graph()
+
+    def _calib_ratios(self, cur, db_cur, db_calib, show_db):
+        """
+        Current/calibrated ratio of every wavelength (dB difference in dB mode), NaN
+        where it is undefined: uncalibrated wavelengths have _calib_v == 0.
+        """
+        valid = (cur > 0) & (self._calib_v > 0)
+        if show_db:
+            # dB mode: 20*log10(current/calibrated)
+            return np.where(valid, db_cur - db_calib, np.nan)
+        # Non-dB mode: current/calibrated
+        return np.divide(cur, self._calib_v, out=np.full(self._n_params, np.nan), where=valid)
+
+    def _set_text(self, widget, text):
+        """setText only when text differs from what update_graph last set on widget"""
+        self._last_value.pop(widget, None)
+        if self._last_text.get(widget) != text:
+            widget.setText(text)
+            self._last_text[widget] = text
+
+    def _set_num(self, widget, value, spec):
+        """Show value formatted with spec on widget, skipping the formatting if it is unchanged"""
+        key = (value, spec)
+        if self._last_value.get(widget) != key:
+            self._set_text(widget, format(value, spec))
+            self._last_value[widget] = key
+
+    def _set_style(self, widget, qss):
+        """setStyleSheet only when qss differs from what update_graph last set on widget"""
+        if self._last_style.get(widget) != qss:
+            widget.setStyleSheet(qss)
+            self._last_style[widget] = qss
 
     def update_graph(self):
         tab_idx = self.tabs.currentIndex()
@@ -842,209 +1083,155 @@ class MainWindow(QWidget):
         
         # Ensure correct graph is shown and update Y-axis label
         self.graph_stack.setCurrentIndex(1 if tab_idx == 0 else 0)
-        if show_db:
-            y_label = "Voltage [dB]" + gain_info
-            self.normal_current_header.setText("Current [dB]")
-            self.normal_calibrated_header.setText("Calibrated [dB]")
-            self.normal_diff_header.setText("Ratio[dB] Cur/Calib")
-        else:
-            y_label = "Voltage [V]" + gain_info
-            self.normal_current_header.setText("Current [V]")
-            self.normal_calibrated_header.setText("Calibrated [V]")
-            self.normal_diff_header.setText("Ratio Cur/Calib")
-        self.graph_widget.setLabel('left', y_label)
-        self.bar_widget.setLabel('left', y_label)
-
+        y_label = ("Voltage [dB]" if show_db else "Voltage [V]") + gain_info
+        if y_label != self._y_label:
+            self.graph_widget.setLabel('left', y_label)
+            self.bar_widget.setLabel('left', y_label)
+            self._y_label = y_label
+
+        # Calibrated values of all wavelengths (0 where not calibrated) and their dB, used by both tabs
+        has_calib = np.array([self.calibrated_values.get(param) is not None for param in PARAMETERS])
+        for i, param in self._param_enum:
+            self._calib_v[i] = self.calibrated_values[param] if has_calib[i] else 0.0
+        db_calib = self.db_values(self._calib_v)
+
+        # Only the visible tab's widgets are updated; on_tab_changed refreshes on switch
         if tab_idx == 0:
-            # NORMAL MODE: Bar graph of current values
-            x = list(range(len(PARAMETERS)))
-            if self.t:
-                y = []
-                for param in PARAMETERS:
-                    cur_val = self.data[param][-1] if self.data[param] else 0
-                    y.append(self.db_value(cur_val) if show_db else cur_val)
+            if show_db:
+                self._set_text(self.normal_current_header, "Current [dB]")
+                self._set_text(self.normal_calibrated_header, "Calibrated [dB]")
+                self._set_text(self.normal_diff_header, "Ratio[dB] Cur/Calib")
             else:
-                y = [0] * len(PARAMETERS)
-            # Remove previous bar item
-            self.bar_widget.clear()
-            # Bar for current values (blue)
-            self.bar_item = pg.BarGraphItem(x=[i-0.15 for i in x], height=y, width=0.3, brush='b')
-            self.bar_widget.addItem(self.bar_item)
-            # Bar for calibrated values (red)
-            y_calib = []
-            for param in PARAMETERS:
-                calib_val = self.calibrated_values.get(param)
-                y_calib.append(self.db_value(calib_val) if (show_db and calib_val is not None) else (calib_val if calib_val is not None else 0))
-            self.bar_item_calib = pg.BarGraphItem(x=[i+0.15 for i in x], height=y_calib, width=0.3, brush='r')
-            self.bar_widget.addItem(self.bar_item_calib)
-            # Set x-axis ticks to wavelength labels
-            ax = self.bar_widget.getAxis('bottom')
-            ax.setTicks([[ (i, PARAMETERS[i]) for i in range(len(PARAMETERS)) ]])
+                self._set_text(self.normal_current_header, "Current [V]")
+                self._set_text(self.normal_calibrated_header, "Calibrated [V]")
+                self._set_text(self.normal_diff_header, "Ratio Cur/Calib")
+            # NORMAL MODE: gather current values of all wavelengths so the dB
+            # and ratio columns are computed in one NumPy pass
+            if self._hist_n:
+                self._cur_v[:] = self._data_hist[:, self._hist_n - 1]
+            has_data = np.isfinite(self._cur_v) if self._hist_n else np.zeros(self._n_params, dtype=bool)
+            self._cur_v[~has_data] = 0.0
+            db_cur = self.db_values(self._cur_v)
+            ratios = self._calib_ratios(self._cur_v, db_cur, db_calib, show_db)
+            ratio_ok = ~np.isnan(ratios)
+            ratio_limit = -6 if show_db else 0.5  # Flag red below -6dB in dB mode, below 0.5 otherwise
             
-            # This logic needs to run for both tabs to keep NORMAL mode display consistent
-            for param in PARAMETERS:
-                if self.data[param]:
-                    cur_val = self.data[param][-1]
-                    calib_val = self.calibrated_values.get(param)
-
-                    # Calculate ratio based on show_db mode
-                    ratio = None
-                    if cur_val > 0 and calib_val is not None and calib_val > 0:
-                        try:
-                            if show_db:
-                                # dB mode: 20*log10(current/calibrated)
-                                ratio = 20 * np.log10(cur_val / calib_val)
-                            else:
-                                # Non-dB mode: current/calibrated
-                                ratio = cur_val / calib_val
-                        except Exception:
-                            ratio = None
+            # Bar graph of current and calibrated values; copies, since _cur_v/_calib_v are reused
+            y = (db_cur if show_db else self._cur_v) if self._hist_n else np.zeros(self._n_params)
+            y_calib = db_calib if show_db else self._calib_v
+            self.bar_item.setOpts(height=np.array(y))
+            self.bar_item_calib.setOpts(height=np.array(y_calib))
+            
+            for i, (cur_label, calib_label, diff_label) in enumerate(self._normal_labels):
+                if has_data[i]:
                     # Display values
                     if show_db:
-                        self.normal_db_labels[param].setText(f"{self.db_value(cur_val):.2f}")
-                        if calib_val is not None:
-                            self.normal_calib_db_labels[param].setText(f"{self.db_value(calib_val):.2f}")
-                            if ratio is not None:
-                                self.normal_diff_db_labels[param].setText(f"{ratio:.2f}")
-                                # For dB ratio: flag red if less than -6dB
-                                if ratio < -6:
-                                    self.normal_diff_db_labels[param].setStyleSheet("font-size: 16px; background-color: red; color: white;")
-                                else:
-                                    self.normal_diff_db_labels[param].setStyleSheet("font-size: 16px; background-color: green; color: white;")
-                            else:
-                                self.normal_diff_db_labels[param].setText("-")
-                                self.normal_diff_db_labels[param].setStyleSheet("font-size: 16px;")
+                        self._set_num(cur_label, db_cur[i], ".2f")
+                    else:
+                        self._set_num(cur_label, self._cur_v[i], ".4f")
+                    if has_calib[i]:
+                        if show_db:
+                            self._set_num(calib_label, db_calib[i], ".2f")
                         else:
-                            self.normal_calib_db_labels[param].setText("-")
-                            self.normal_diff_db_labels[param].setText("-")
-                            self.normal_diff_db_labels[param].setStyleSheet("font-size: 16px;")
-                    else: # Not in dB mode
-                        self.normal_db_labels[param].setText(f"{cur_val:.4f}")
-                        if calib_val is not None:
-                            self.normal_calib_db_labels[param].setText(f"{calib_val:.4f}")
-                            if ratio is not None:
-                                self.normal_diff_db_labels[param].setText(f"{ratio:.2f}")
-                                # For ratio: flag red if less than 0.5
-                                if ratio < 0.5:
-                                    self.normal_diff_db_labels[param].setStyleSheet("font-size: 16px; background-color: red; color: white;")
-                                else:
-                                    self.normal_diff_db_labels[param].setStyleSheet("font-size: 16px; background-color: green; color: white;")
+                            self._set_num(calib_label, self._calib_v[i], ".4f")
+                        if ratio_ok[i]:
+                            self._set_num(diff_label, ratios[i], ".2f")
+                            if ratios[i] < ratio_limit:
+                                self._set_style(diff_label, _NORMAL_RATIO_LOW_QSS)
                             else:
-                                self.normal_diff_db_labels[param].setText("-")
-                                self.normal_diff_db_labels[param].setStyleSheet("font-size: 16px;")
+                                self._set_style(diff_label, _NORMAL_RATIO_OK_QSS)
                         else:
-                            self.normal_calib_db_labels[param].setText("-")
-                            self.normal_diff_db_labels[param].setText("-")
-                            self.normal_diff_db_labels[param].setStyleSheet("font-size: 16px;")
+                            self._set_text(diff_label, "-")
+                            self._set_style(diff_label, _NORMAL_RATIO_NONE_QSS)
+                    else:
+                        self._set_text(calib_label, "-")
+                        self._set_text(diff_label, "-")
+                        self._set_style(diff_label, _NORMAL_RATIO_NONE_QSS)
                 else:
-                    self.normal_db_labels[param].setText("-")
-                    self.normal_calib_db_labels[param].setText("-")
-                    self.normal_diff_db_labels[param].setText("-")
-                    self.normal_diff_db_labels[param].setStyleSheet("font-size: 16px;")
+                    self._set_text(cur_label, "-")
+                    self._set_text(calib_label, "-")
+                    self._set_text(diff_label, "-")
+                    self._set_style(diff_label, _NORMAL_RATIO_NONE_QSS)
         else:
             # ADVANCED MODE: Time series plot
             if hasattr(self, 'show_all_checkbox') and self.show_all_checkbox.isChecked():
-                t_show = self.t
-                buffer_size = len(self.t)
+                t_show, values_show = self._history_view()
             else:
-                t_show = self.t[-self.buffer_size:]
-                buffer_size = self.buffer_size
-            for param in PARAMETERS:
-                data_show = self.data[param][-buffer_size:]
-                if show_db:
-                    data_plot = [self.db_value(v) for v in data_show]
-                else:
-                    data_plot = data_show
-                
-                # Safeguard against mismatched data lengths to prevent crashes
-                if len(t_show) == len(data_plot):
-                    self.curves[param].setData(t_show, data_plot)
+                t_show, values_show = self._history_view(self.buffer_size)
+            n_show = len(t_show)
+            # Symbols dominate pyqtgraph draw time; only draw them for short windows
+            show_markers = n_show < self.MARKER_MAX_POINTS
+            if show_markers != self._markers_shown:
+                for curve in self.curves.values():
+                    curve.setSymbol('o' if show_markers else None)
+                self._markers_shown = show_markers
+            # Fill the preallocated plot buffers (fresh arrays only if "show all" exceeds them)
+            if n_show <= self.MAX_PLOT_POINTS:
+                x_plot = self._xbuf[:n_show]
+                x_plot[:] = t_show
+            else:
+                x_plot = np.asarray(t_show, dtype=np.float32)
+            # Current, min and max of every parameter as three reductions over the window
+            if n_show:
+                cur_vals = values_show[:, -1]
+                min_vals = values_show.min(axis=1)
+                max_vals = values_show.max(axis=1)
+                # dB of the current, min and max values of every parameter in one call
+                db_cur_vals, db_min_vals, db_max_vals = self.db_values(np.stack((cur_vals, min_vals, max_vals)))
+                ratios = self._calib_ratios(cur_vals, db_cur_vals, db_calib, show_db)
+                ratio_ok = ~np.isnan(ratios)
+                ratio_limit = -6 if show_db else 0.5  # Flag red below -6dB in dB mode, below 0.5 otherwise
+            for j, param in self._param_enum:
+                data_show = values_show[j]
+                # Parameters missing from a loaded CSV file are NaN and not plotted
+                has_data = n_show > 0 and np.isfinite(cur_vals[j])
+                if has_data:
+                    if n_show <= self.MAX_PLOT_POINTS:
+                        data_plot = self._ybuf[param][:n_show]
+                        data_plot[:] = data_show
+                    else:
+                        data_plot = data_show.astype(np.float32)
+                    if show_db:
+                        data_plot[:] = self.db_values(data_plot)
+                    self.curves[param].setData(x_plot, data_plot)
                 else:
-                    self.curves[param].setData([], []) # Clear plot on mismatch
+                    self.curves[param].setData([], [])
 
                 self.curves[param].setVisible(self.param_checkboxes[param].isChecked())
                 # Update all value and dB fields
-                if data_show:
-                    min_val = min(data_show)
-                    max_val = max(data_show)
-                    cur_val = data_show[-1]
-                    calib_val = self.calibrated_values.get(param)
+                (calib_f, cur_f, min_f, max_f, diff_pct_f,
+                 calib_db_f, cur_db_f, min_db_f, max_db_f, diff_db_f) = self._adv_fields[j]
+                if has_data:
                     # Calibrated
-                    if calib_val is not None:
-                        self.calib_fields[param].setText(f"{calib_val:.2f}")
-                        self.calib_db_fields[param].setText(f"{self.db_value(calib_val):.2f}")
+                    if has_calib[j]:
+                        self._set_num(calib_f, self._calib_v[j], ".2f")
+                        self._set_num(calib_db_f, db_calib[j], ".2f")
                     else:
-                        self.calib_fields[param].setText("")
-                        self.calib_db_fields[param].setText("")
+                        self._set_text(calib_f, "")
+                        self._set_text(calib_db_f, "")
                     # Current
-                    self.cur_fields[param].setText(f"{cur_val:.2f}")
-                    self.db_fields[param].setText(f"{self.db_value(cur_val):.2f}")
+                    self._set_num(cur_f, cur_vals[j], ".2f")
+                    self._set_num(cur_db_f, db_cur_vals[j], ".2f")
                     # Min
-                    self.min_fields[param].setText(f"{min_val:.2f}")
-                    self.min_db_fields[param].setText(f"{self.db_value(min_val):.2f}")
+                    self._set_num(min_f, min_vals[j], ".2f")
+                    self._set_num(min_db_f, db_min_vals[j], ".2f")
                     # Max
-                    self.max_fields[param].setText(f"{max_val:.2f}")
-                    self.max_db_fields[param].setText(f"{self.db_value(max_val):.2f}")
-                    # Diff Ratio (based on show_db mode)
-                    ratio = None
-                    if cur_val > 0 and calib_val is not None and calib_val > 0:
-                        try:
-                            if show_db:
-                                # dB mode: 20*log10(current/calibrated)
-                                ratio = 20 * np.log10(cur_val / calib_val)
-                            else:
-                                # Non-dB mode: current/calibrated
-                                ratio = cur_val / calib_val
-                        except Exception:
-                            ratio = None
-                    if ratio is not None:
-                        self.diff_pct_fields[param].setText(f"{ratio:.2f}")
-                        # Flag based on mode
-                        if show_db:
-                            # For dB ratio: flag red if less than -6dB
-                            if ratio < -6:
-                                self.diff_pct_fields[param].setStyleSheet("background-color: red; color: white;")
-                            else:
-                                self.diff_pct_fields[param].setStyleSheet("background-color: green; color: white;")
-                        else:
-                            # For ratio: flag red if less than 0.5
-                            if ratio < 0.5:
-                                self.diff_pct_fields[param].setStyleSheet("background-color: red; color: white;")
-                            else:
-                                self.diff_pct_fields[param].setStyleSheet("background-color: green; color: white;")
+                    self._set_num(max_f, max_vals[j], ".2f")
+                    self._set_num(max_db_f, db_max_vals[j], ".2f")
+                    # Diff Ratio and Ratio Cur/Calib (based on show_db mode)
+                    if ratio_ok[j]:
+                        ratio = float(ratios[j])
+                        flag = _ADV_RATIO_LOW_QSS if ratio < ratio_limit else _ADV_RATIO_OK_QSS
+                        for field in (diff_pct_f, diff_db_f):
+                            self._set_num(field, ratio, ".2f")
+                            self._set_style(field, flag)
                     else:
-                        self.diff_pct_fields[param].setText("")
-                        self.diff_pct_fields[param].setStyleSheet("")
-                    # Ratio Cur/Calib (same logic as above)
-                    if ratio is not None:
-                        self.diff_db_fields[param].setText(f"{ratio:.2f}")
-                        # Flag based on mode
-                        if show_db:
-                            # For dB ratio: flag red if less than -6dB
-                            if ratio < -6:
-                                self.diff_db_fields[param].setStyleSheet("background-color: red; color: white;")
-                            else:
-                                self.diff_db_fields[param].setStyleSheet("background-color: green; color: white;")
-                        else:
-                            # For ratio: flag red if less than 0.5
-                            if ratio < 0.5:
-                                self.diff_db_fields[param].setStyleSheet("background-color: red; color: white;")
-                            else:
-                                self.diff_db_fields[param].setStyleSheet("background-color: green; color: white;")
-                    else:
-                        self.diff_db_fields[param].setText("")
-                        self.diff_db_fields[param].setStyleSheet("")
+                        for field in (diff_pct_f, diff_db_f):
+                            self._set_text(field, "")
+                            self._set_style(field, _ADV_RATIO_NONE_QSS)
                 else:
-                    self.calib_fields[param].setText("")
-                    self.cur_fields[param].setText("")
-                    self.min_fields[param].setText("")
-                    self.max_fields[param].setText("")
-                    self.diff_pct_fields[param].setText("")
-                    self.calib_db_fields[param].setText("")
-                    self.db_fields[param].setText("")
-                    self.min_db_fields[param].setText("")
-                    self.max_db_fields[param].setText("")
-                    self.diff_db_fields[param].setText("")
+                    for field in self._adv_fields[j]:
+                        self._set_text(field, "")
 
     def update_sampling_label(self, value):
         self.sampling_label.setText(f"Batch Timer Frequency: {value} Hz")
@@ -1052,33 +1239,32 @@ class MainWindow(QWidget):
     def update_datapoints_label(self, value):
         self.datapoints_label.setText(f"Data Points: {value}")
         self.buffer_size = value
-        self.update_graph()
+        self._datapoints_debounce.start(150)
 
-    def log_data(self, t, data_row):
-        # Log to text file (CSV)
-        calib_row = [self.calibrated_values[param] if self.calibrated_values[param] is not None else "" for param in PARAMETERS]
-        
-        # Get current gain values for both channels
+    def _update_log_calib(self):
+        """Rebuild the calibrated-value log columns; call whenever calibrated_values changes"""
+        self._calib_row_cache = tuple(self.calibrated_values[param] if self.calibrated_values[param] is not None else "" for param in PARAMETERS)
+
+    def _update_log_gains(self):
+        """Rebuild the CH0/CH1 gain log columns; call whenever an ADC gain changes"""
         ch0_gain = 0
         ch1_gain = 0
         if hasattr(self, 'adc') and self.adc is not None and hasattr(self.adc, 'channel_gains'):
             ch0_gain = self.adc.channel_gains[0] if len(self.adc.channel_gains) > 0 else 0
             ch1_gain = self.adc.channel_gains[1] if len(self.adc.channel_gains) > 1 else 0
+        self._gain_row_cache = (ch0_gain, ch1_gain)
+
+    def log_data(self, t, data_row):
+        # Log to text file (CSV)
+        # Get current timestamp; it has 1 s resolution, so format it once per second
+        now_s = int(time.time())
+        if now_s != self._ts_cache[0]:
+            self._ts_cache = (now_s, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now_s)))
         
-        # Get current timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Add gain information and current time to the row
-        gain_row = [ch0_gain, ch1_gain]
-        row_to_write = [t, current_time] + data_row + calib_row + gain_row
+        # Add the cached calibration and gain columns and current time to the row
+        row_to_write = [t, self._ts_cache[1], *data_row, *self._calib_row_cache, *self._gain_row_cache]
         
-        with open(self.text_log_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(row_to_write)
-        # Log to CSV file
-        with open(self.csv_log_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(row_to_write)
+        self._log_q.put(row_to_write)
 
     def update_sampling_rate(self, value):
         """Update batch timer interval based on slider value (calls per second)"""
@@ -1089,8 +1275,7 @@ class MainWindow(QWidget):
         print(f"Batch timer interval set to {self.BATCH_TIMER_INTERVAL_MS} ms ({freq_hz} Hz)")
         # If scanning, restart the timer with new interval
         if self.scanning:
-            self.sampling_timer.stop()
-            self.sampling_timer.start(self.BATCH_TIMER_INTERVAL_MS)
+            self.scan_timer.start(self.BATCH_TIMER_INTERVAL_MS)
 
     def toggle_scan(self):
         if not self.scanning:
@@ -1098,7 +1283,11 @@ class MainWindow(QWidget):
             self.measure_start_time = time.time()
             self.adc_read_count = 0  # Reset ADC read counter
             self.cycle_detected_count = 0  # Reset cycle counter
-            self.sample_timestamps = []  # Reset sample timestamps
+            self._samples_last = 0  # Reset interval SPS counters
+            self._sps_tref = time.monotonic()
+            self.interval_sps = 0.0
+            self._rb_head = 0  # Reset raw ring buffer
+            self._rb_count = 0
             self.consecutive_cycles = 0
             self.is_locked = False
             self.is_timing_adjusted = False
@@ -1106,27 +1295,20 @@ class MainWindow(QWidget):
             self.last_sample_batch_time = time.time() # Initialize batch time
             
             # Reset cycle statistics
-            self.cycle_timestamps = []
-            self.cycle_intervals = []
-            self.cycle_scores = []
-            self.cycle_qualities = []
-            self.cycle_pulse_counts = []
-            self.cycle_voltage_stats = []
-            self.cycle_rate_history = []
-            self.pattern_quality_history = []
+            self._ncycles = 0
+            self.last_pulse_voltages = None
+            self._reset_trends()
             self.total_cycles_detected = 0
             
             # Reset wavelength cycling
             self.wavelength_cycle_count = 0
             self.current_wavelength = PARAMETERS[0]
-            self.wavelength_data = {param: [] for param in PARAMETERS}
             
             # Reset continuous averaging
             self.continuous_wavelength_cycle = 0
-            self.continuous_sample_buffer = {param: [] for param in PARAMETERS}
+            self._reset_continuous_average()
             
-            # Stop any existing no-pattern timer
-            self.no_pattern_timer.stop()
+            # Clear any pending no-pattern check
             self.pattern_detection_active = False
             
             # Turn on power before starting measurement
@@ -1138,9 +1320,10 @@ class MainWindow(QWidget):
                     print(f"Error setting GPIO HIGH: {e}")
             
             self.update_sampling_rate(self.sampling_slider.value())  # Ensure timer interval matches slider
-            self.sampling_timer.start(self.BATCH_TIMER_INTERVAL_MS)
-            self.graph_timer.start(1000)
-            self.stats_timer.start(5000)  # Display stats every 5 seconds
+            now = time.monotonic_ns()
+            self._graph_due = now + self.GRAPH_INTERVAL_NS
+            self._stats_due = now + self.STATS_INTERVAL_NS
+            self.scan_timer.start(self.BATCH_TIMER_INTERVAL_MS)
             self.scan_btn.setText("STOP")
             self.scanning = True
             if not self.continuous_checkbox.isChecked():
@@ -1149,58 +1332,71 @@ class MainWindow(QWidget):
         else:
             self.stop_scan()
 
+    def _on_scan_tick(self):
+        """Scan timer slot: sample a batch, then run the periodic tasks that are due"""
+        self.sample_data()
+        now = time.monotonic_ns()
+        if self.pattern_detection_active and now >= self._no_pattern_due:
+            self.show_no_pattern_detected()
+        if now >= self._graph_due:
+            self._graph_due = now + self.GRAPH_INTERVAL_NS
+            self.update_graph_from_buffer()
+        if now >= self._stats_due:
+            self._stats_due = now + self.STATS_INTERVAL_NS
+            self.print_cycle_statistics()
+
+    def update_interval_sps(self):
+        """Update interval_sps with the sample rate since the previous call"""
+        now = time.monotonic()
+        dt = now - self._sps_tref
+        if dt > 0:
+            self.interval_sps = (self.adc_read_count - self._samples_last) / dt
+        self._samples_last = self.adc_read_count
+        self._sps_tref = now
+        return self.interval_sps
+
     def print_cycle_statistics(self):
         """Print current cycle statistics to console"""
-        if not self.scanning or len(self.cycle_timestamps) == 0:
+        if not self.scanning:
+            return
+        self.update_interval_sps()
+        if self._ncycles == 0:
             return
             
         print("\n" + "-"*50)
         print("           CURRENT CYCLE STATISTICS")
         print("-"*50)
+        print(f"  Samples / Sec:          {self.interval_sps:.1f}")
         print(f"  Total Cycles Detected:  {self.total_cycles_detected}")
         print(f"  Consecutive Cycles:     {self.consecutive_cycles}")
         print(f"  Pattern Lock Status:    {'LOCKED' if self.is_locked else 'UNLOCKED'}")
         
         # Detection timing
-        if len(self.cycle_timestamps) > 0:
-            time_since_last = time.time() - self.cycle_timestamps[-1]
-            print(f"  Time Since Last Cycle:  {time_since_last:.2f} seconds")
+        recent = self._cycles_view(5)  # Last 5 cycles
+        time_since_last = (time.monotonic_ns() - recent['t'][-1]) * 1e-9
+        print(f"  Time Since Last Cycle:  {time_since_last:.2f} seconds")
         
         # Recent cycle rate
-        if len(self.cycle_rate_history) > 0:
-            recent_rate = np.mean(self.cycle_rate_history[-5:])  # Last 5 cycles
+        if self._trend_n[self.TREND_RATE] > 0:
+            recent_rate = self._trend_recent(self.TREND_RATE, 5).mean()  # Last 5 cycles
             print(f"  Recent Cycle Rate:      {recent_rate:.2f} Hz")
         
-        # Recent pattern quality
-        if len(self.cycle_qualities) > 0:
-            recent_quality = np.mean(self.cycle_qualities[-5:])  # Last 5 cycles
-            print(f"  Recent Pattern Quality: {recent_quality:.3f}")
-        
-        # Recent correlation scores
-        if len(self.cycle_scores) > 0:
-            recent_score = np.mean(self.cycle_scores[-5:])  # Last 5 cycles
-            print(f"  Recent Correlation:     {recent_score:.3f}")
-        
-        # Recent pulse counts
-        if len(self.cycle_pulse_counts) > 0:
-            recent_pulses = np.mean(self.cycle_pulse_counts[-5:])  # Last 5 cycles
-            print(f"  Recent Pulses/Cycle:    {recent_pulses:.1f}")
+        # Recent pattern quality, correlation scores and pulse counts
+        print(f"  Recent Pattern Quality: {recent['quality'].mean():.3f}")
+        print(f"  Recent Correlation:     {recent['score'].mean():.3f}")
+        print(f"  Recent Pulses/Cycle:    {recent['npulses'].mean():.1f}")
         
         # Recent voltage statistics
-        if len(self.cycle_voltage_stats) > 0:
-            recent_stats = self.cycle_voltage_stats[-5:]  # Last 5 cycles
-            avg_mean = np.mean([stats['mean'] for stats in recent_stats])
-            avg_std = np.mean([stats['std'] for stats in recent_stats])
-            print(f"  Recent Pulse Voltage Mean: {avg_mean:.4f} V")
-            print(f"  Recent Pulse Voltage Std:  {avg_std:.4f} V")
-            
-            # Show the most recent pulse voltages
-            if recent_stats and 'pulse_voltages' in recent_stats[-1]:
-                latest_pulses = recent_stats[-1]['pulse_voltages']
-                wavelengths = ["700nm", "800nm", "850nm", "900nm", "970nm", "1050nm"]
-                print(f"  Latest Pulse Voltages:")
-                for wavelength, voltage in zip(wavelengths, latest_pulses):
-                    print(f"    {wavelength}: {voltage:.4f}V")
+        vmean, vstd = recent['vstats'][:, :2].mean(axis=0)
+        print(f"  Recent Pulse Voltage Mean: {vmean:.4f} V")
+        print(f"  Recent Pulse Voltage Std:  {vstd:.4f} V")
+        
+        # Show the most recent pulse voltages
+        if self.last_pulse_voltages is not None:
+            wavelengths = ["700nm", "800nm", "850nm", "900nm", "970nm", "1050nm"]
+            print(f"  Latest Pulse Voltages:")
+            for wavelength, voltage in zip(wavelengths, self.last_pulse_voltages):
+                print(f"    {wavelength}: {voltage:.4f}V")
         
         # Data availability
         total_samples = sum(len(buffer) for buffer in self.sample_buffer.values())
@@ -1212,20 +1408,20 @@ class MainWindow(QWidget):
         
         # Show samples per wavelength
         print("  Samples per Wavelength:")
-        for param in PARAMETERS:
+        # Count positive history values (all readings) of every parameter at once
+        continuous_counts = np.count_nonzero(self._history_view()[1] > 0, axis=1)
+        for j, param in enumerate(PARAMETERS):
             # Count from pattern-based sample buffers (detected cycles)
             pattern_count = len(self.sample_buffer[param])
             # Count from continuous sample buffers (all readings)
-            continuous_count = len([v for v in self.data[param] if v > 0])
+            continuous_count = int(continuous_counts[j])
             print(f"    {param}: {continuous_count} continuous, {pattern_count} pattern-based")
         
         print("-"*50)
 
     def stop_scan(self):
-        self.sampling_timer.stop()
-        self.graph_timer.stop()
-        self.stats_timer.stop()  # Stop stats timer
-        self.no_pattern_timer.stop()  # Stop the no-pattern timer
+        self.scan_timer.stop()
+        self.pattern_detection_active = False  # Drop any pending no-pattern check
         self.scan_btn.setText("MEASURE")
         self.scanning = False
         
@@ -1245,65 +1441,65 @@ class MainWindow(QWidget):
                 print(f"  Total Cycles Detected:  {self.total_cycles_detected}")
                 print(f"  Avg. Cycles / Sec:      {avg_cps:.2f}")
                 
+                # Statistics over the last CYCLE_STATS_WINDOW cycles
+                window = self._cycles_view(self.CYCLE_STATS_WINDOW)
+                intervals = window['interval'][np.isfinite(window['interval'])]
+                
                 # Cycle statistics
-                if len(self.cycle_intervals) > 0:
-                    avg_interval = np.mean(self.cycle_intervals)
-                    std_interval = np.std(self.cycle_intervals)
-                    min_interval = np.min(self.cycle_intervals)
-                    max_interval = np.max(self.cycle_intervals)
+                if len(intervals) > 0:
+                    avg_interval = np.mean(intervals)
+                    std_interval = np.std(intervals)
+                    min_interval = np.min(intervals)
+                    max_interval = np.max(intervals)
                     print(f"  Avg. Cycle Interval:    {avg_interval*1000:.1f} ms")
                     print(f"  Cycle Interval Std:     {std_interval*1000:.1f} ms")
                     print(f"  Min Cycle Interval:     {min_interval*1000:.1f} ms")
                     print(f"  Max Cycle Interval:     {max_interval*1000:.1f} ms")
                 
                 # Pattern quality statistics
-                if len(self.cycle_qualities) > 0:
-                    avg_quality = np.mean(self.cycle_qualities)
-                    std_quality = np.std(self.cycle_qualities)
-                    min_quality = np.min(self.cycle_qualities)
-                    max_quality = np.max(self.cycle_qualities)
+                if len(window) > 0:
+                    avg_quality = np.mean(window['quality'])
+                    std_quality = np.std(window['quality'])
+                    min_quality = np.min(window['quality'])
+                    max_quality = np.max(window['quality'])
                     print(f"  Avg. Pattern Quality:   {avg_quality:.3f}")
                     print(f"  Quality Std Dev:        {std_quality:.3f}")
                     print(f"  Min Quality:            {min_quality:.3f}")
                     print(f"  Max Quality:            {max_quality:.3f}")
                 
                 # Correlation score statistics
-                if len(self.cycle_scores) > 0:
-                    avg_score = np.mean(self.cycle_scores)
-                    std_score = np.std(self.cycle_scores)
-                    min_score = np.min(self.cycle_scores)
-                    max_score = np.max(self.cycle_scores)
+                if len(window) > 0:
+                    avg_score = np.mean(window['score'])
+                    std_score = np.std(window['score'])
+                    min_score = np.min(window['score'])
+                    max_score = np.max(window['score'])
                     print(f"  Avg. Correlation Score: {avg_score:.3f}")
                     print(f"  Score Std Dev:          {std_score:.3f}")
                     print(f"  Min Score:              {min_score:.3f}")
                     print(f"  Max Score:              {max_score:.3f}")
                 
                 # Pulse count statistics
-                if len(self.cycle_pulse_counts) > 0:
-                    avg_pulses = np.mean(self.cycle_pulse_counts)
-                    std_pulses = np.std(self.cycle_pulse_counts)
-                    min_pulses = np.min(self.cycle_pulse_counts)
-                    max_pulses = np.max(self.cycle_pulse_counts)
+                if len(window) > 0:
+                    avg_pulses = np.mean(window['npulses'])
+                    std_pulses = np.std(window['npulses'])
+                    min_pulses = np.min(window['npulses'])
+                    max_pulses = np.max(window['npulses'])
                     print(f"  Avg. Pulses per Cycle:  {avg_pulses:.1f}")
                     print(f"  Pulse Count Std Dev:    {std_pulses:.1f}")
                     print(f"  Min Pulses:             {min_pulses}")
                     print(f"  Max Pulses:             {max_pulses}")
                 
                 # Voltage statistics
-                if len(self.cycle_voltage_stats) > 0:
-                    avg_voltage_mean = np.mean([stats['mean'] for stats in self.cycle_voltage_stats])
-                    avg_voltage_std = np.mean([stats['std'] for stats in self.cycle_voltage_stats])
-                    avg_voltage_min = np.mean([stats['min'] for stats in self.cycle_voltage_stats])
-                    avg_voltage_max = np.mean([stats['max'] for stats in self.cycle_voltage_stats])
+                if len(window) > 0:
+                    avg_voltage_mean, avg_voltage_std, avg_voltage_min, avg_voltage_max = window['vstats'].mean(axis=0)
                     print(f"  Avg. Pulse Voltage Mean: {avg_voltage_mean:.4f} V")
                     print(f"  Avg. Pulse Voltage Std:  {avg_voltage_std:.4f} V")
                     print(f"  Avg. Pulse Voltage Min:  {avg_voltage_min:.4f} V")
                     print(f"  Avg. Pulse Voltage Max:  {avg_voltage_max:.4f} V")
                     
                     # Show recent pulse voltage range
-                    if len(self.cycle_voltage_stats) >= 5:
-                        recent_stats = self.cycle_voltage_stats[-5:]
-                        recent_means = [stats['mean'] for stats in recent_stats]
+                    if len(window) >= 5:
+                        recent_means = window['vstats'][-5:, 0]
                         print(f"  Recent Pulse Voltages:  {[f'{v:.3f}V' for v in recent_means]}")
                 
                 # Lock status
@@ -1317,20 +1513,21 @@ class MainWindow(QWidget):
                 
                 # Samples per wavelength
                 print("  Samples per Wavelength:")
-                for param in PARAMETERS:
+                continuous_counts = np.count_nonzero(self._history_view()[1] > 0, axis=1)
+                for j, param in enumerate(PARAMETERS):
                     # Count from pattern-based sample buffers (detected cycles)
                     pattern_count = len(self.sample_buffer[param])
                     # Count from continuous sample buffers (all readings)
-                    continuous_count = len([v for v in self.data[param] if v > 0])
+                    continuous_count = int(continuous_counts[j])
                     print(f"    {param}: {continuous_count} continuous, {pattern_count} pattern-based")
                 
                 # Recent performance (last 10 cycles)
-                if len(self.cycle_rate_history) > 0:
-                    recent_rate = np.mean(self.cycle_rate_history[-10:])
+                if self._trend_n[self.TREND_RATE] > 0:
+                    recent_rate = self._trend_recent(self.TREND_RATE, 10).mean()
                     print(f"  Recent Cycle Rate:      {recent_rate:.2f} Hz")
                 
-                if len(self.pattern_quality_history) > 0:
-                    recent_quality = np.mean(self.pattern_quality_history[-10:])
+                if self._trend_n[self.TREND_QUALITY] > 0:
+                    recent_quality = self._trend_recent(self.TREND_QUALITY, 10).mean()
                     print(f"  Recent Pattern Quality: {recent_quality:.3f}")
                 
                 print("="*60)
@@ -1352,25 +1549,96 @@ class MainWindow(QWidget):
     def read_adc_batch(self, duration_ms=20):
         """
         Read as many ADC samples as possible in duration_ms milliseconds.
-        Returns a list of (timestamp, voltage) tuples.
+        Samples are read in blocks into preallocated arrays and pushed straight
+        into the raw ring buffer. Returns the number of samples read.
         """
-        start = time.perf_counter()
-        readings = []
-        while (time.perf_counter() - start) * 1000 < duration_ms:
+        now = time.perf_counter()
+        deadline = now + duration_ms / 1000.0
+        total = 0
+        # Work in ADC-referred volts (input x PGA gain) so the pulse and auto-gain
+        # thresholds stay relative to the ADC full-scale range: code * VREF / 2^23
+        scale = self.adc.vref / 8388608.0 if self.adc_type == 'ADS131M02' else 1.0
+        # One clock read per block: it both checks the deadline and times the next block
+        while now < deadline:
             try:
+                want = self._adc_block_size
+                t0 = now
                 if self.adc_type == 'ADS131M02':
-                    voltages = self.adc.read_data()
-                    voltage = voltages[0] if voltages and len(voltages) > 0 else 0.0
+                    # Fewer samples than requested means DRDY timed out
+                    n = self.adc.read_into(self._raw_view[:2 * want])
+                    codes = np.frombuffer(self._raw_view[:2 * n], dtype=np.int32)[0::2]  # CH0
+                    np.multiply(codes, scale, out=self._volts_batch[:n], casting='unsafe')
                 else:
-                    voltage = self.adc.read_voltage(0)
+                    n = self.adc.read_into(self._raw_view[:want], 0)
+                    codes = np.frombuffer(self._raw_view[:n], dtype=np.int32)
+                    self._volts_batch[:n] = self.adc.raw_to_voltage_vec(codes)
+                # Size the next block to about a quarter of the batch window
+                # at the measured data rate, so blocks never overrun the deadline
+                now = time.perf_counter()
+                if n < want:
+                    # The ADC stopped delivering: keep what was read and end the batch
+                    if n:
+                        self._rb_push(self.apply_voltage_scaling(self._volts_batch[:n]))
+                        total += n
+                    break
+                rate = n / max(now - t0, 1e-6)
+                self._adc_block_size = max(1, min(self.ADC_BLOCK_MAX, int(rate * duration_ms / 4000.0)))
                 
                 # Apply voltage scaling correction
-                voltage = self.apply_voltage_scaling(voltage)
-                
-                readings.append((time.perf_counter(), voltage))
+                self._rb_push(self.apply_voltage_scaling(self._volts_batch[:n]))
+                total += n
             except Exception as e:
                 print(f"Error reading from ADC: {e}")
-        return readings
+                now = time.perf_counter()
+        return total
+
+    def _rb_push(self, v):
+        """
+        Write a voltage (or an array of voltages) into the raw ring buffer as
+        int16 codes of RAW_LSB_V. Arrays are copied with at most two slice assignments.
+        """
+        size = self._rb.shape[0]
+        v = np.asarray(v, dtype=np.float32)
+        if 0 < v.ndim and len(v) <= len(self._quant_batch):
+            # ADC blocks: quantize in the preallocated scratch; the int16 cast
+            # happens in the slice assignment into the ring
+            codes = self._quant_batch[:len(v)]
+            np.divide(v, np.float32(self.RAW_LSB_V), out=codes)
+            np.rint(codes, out=codes)
+            np.clip(codes, -32768, 32767, out=codes)
+        else:
+            codes = np.clip(np.rint(v / self.RAW_LSB_V), -32768, 32767).astype(np.int16)
+        if codes.ndim == 0:
+            self._rb[self._rb_head] = codes
+            self._rb_head = (self._rb_head + 1) % size
+            self._rb_count = min(self._rb_count + 1, size)
+            return
+        n = len(codes)
+        if n == 0:
+            return
+        if n >= size:
+            # Only the newest samples fit
+            self._rb[:] = codes[-size:]
+            self._rb_head = 0
+            self._rb_count = size
+            return
+        first = min(n, size - self._rb_head)
+        self._rb[self._rb_head:self._rb_head + first] = codes[:first]
+        if first < n:
+            self._rb[:n - first] = codes[first:]
+        self._rb_head = (self._rb_head + n) % size
+        self._rb_count = min(self._rb_count + n, size)
+
+    def _rb_view(self, n=None):
+        """
+        Return the newest n int16 codes (default: all valid samples) in time order.
+        Zero-copy slice when the window is contiguous; a copy only on wrap-around.
+        """
+        count = self._rb_count if n is None else min(n, self._rb_count)
+        start = self._rb_head - count
+        if start >= 0:
+            return self._rb[start:self._rb_head]
+        return np.concatenate((self._rb[start:], self._rb[:self._rb_head]))
 
     def sample_data(self):
         # If ADC is not available, do nothing.
@@ -1378,34 +1646,37 @@ class MainWindow(QWidget):
             return
         # Ensure sample_buffer is initialized
         if not hasattr(self, 'sample_buffer'):
-            self.sample_buffer = {param: [] for param in PARAMETERS}
+            self._reset_pulse_buffers()
         # Read a batch of samples for 20ms
-        batch = self.read_adc_batch(duration_ms=20)
-        voltages = [v for t, v in batch]
-        if not voltages:
+        batch_count = self.read_adc_batch(duration_ms=20)
+        if batch_count == 0:
             return
+        # Read the verbose checkbox once per batch rather than in every debug branch
+        verbose = self.verbose_checkbox.isChecked()
+        # The batch was pushed into the ring buffer; detect pulses on its int16
+        # codes and convert to float32 volts for statistics and display
+        codes = self._rb_view(batch_count)
+        voltages = codes * np.float32(self.RAW_LSB_V)
         
         # Debug voltage readings (only in verbose mode)
-        if self.verbose_checkbox.isChecked() and len(voltages) > 0:
+        if verbose and len(voltages) > 0:
             min_v = min(voltages)
             max_v = max(voltages)
             mean_v = np.mean(voltages)
             print(f"Voltage batch: min={min_v:.4f}V, max={max_v:.4f}V, mean={mean_v:.4f}V")
         
         # Pattern detection on the batch using new algorithm
-        pattern_result = self.detect_cycle_in_batch(voltages)
+        pattern_result = self.detect_cycle_in_batch(voltages, codes)
         
         # Update ADC read count and timestamps
         self.adc_read_count += len(voltages)
-        now = time.time()
-        self.sample_timestamps.extend([now] * len(voltages))
+        now = time.monotonic_ns()
         
         # Always average the voltage readings and cycle through wavelengths continuously
         avg_val = float(np.mean(voltages))
         self.continuous_wavelength_cycle += 1
-        continuous_wavelength_idx = (self.continuous_wavelength_cycle - 1) % len(PARAMETERS)
-        continuous_wavelength = PARAMETERS[continuous_wavelength_idx]
-        self.continuous_sample_buffer[continuous_wavelength].append(avg_val)
+        continuous_wavelength_idx = (self.continuous_wavelength_cycle - 1) % self._n_params
+        self._continuous_push(continuous_wavelength_idx, avg_val)
         
         # --- Only auto-adjust gain if any value from last detected cycle is < 0.1V ---
         if pattern_result['detected']:
@@ -1413,15 +1684,14 @@ class MainWindow(QWidget):
             self.cycle_detected_count += 1
             self.total_cycles_detected += 1
             
-            # Stop the no-pattern timer since we detected a pattern
-            self.no_pattern_timer.stop()
+            # Cancel the pending no-pattern check since we detected a pattern
             self.pattern_detection_active = False
             
             # Get information about all valid cycles found
             all_valid_cycles = pattern_result.get('all_valid_cycles', [])
             total_valid_cycles = pattern_result.get('total_valid_cycles', 0)
             
-            if self.verbose_checkbox.isChecked():
+            if verbose:
                 print(f"Processing {total_valid_cycles} valid cycles from this batch")
             
             # Process all valid cycles (but limit to avoid overwhelming the system)
@@ -1445,11 +1715,13 @@ class MainWindow(QWidget):
                             # Use the pre-calculated average voltage for this pulse
                             gain = self.adc.channel_gains[0] if hasattr(self.adc, 'channel_gains') and len(self.adc.channel_gains) > 0 else 1
                             self.sample_buffer[wavelength].append(pulse_voltage / gain)
-                            if self.verbose_checkbox.isChecked() and cycle_idx == 0:  # Only show for first cycle
+                            cumsum = self._pulse_cumsum[wavelength]
+                            cumsum.append(cumsum[-1] + pulse_voltage / gain)
+                            if verbose and cycle_idx == 0:  # Only show for first cycle
                                 print(f"  Assigned pulse {i+1} ({pulse_time:.2f}ms) to {wavelength}: {pulse_voltage:.4f}V (raw), {pulse_voltage / gain:.4f}V (normalized)")
                     # Update wavelength cycling counter for each cycle processed
                     self.wavelength_cycle_count += 1
-                    if self.verbose_checkbox.isChecked() and cycle_idx == 0:  # Only show for first cycle
+                    if verbose and cycle_idx == 0:  # Only show for first cycle
                         print(f"  Wavelength assignment: {[f'{wavelengths[i]}:{sorted_pulse_times[i]:.2f}ms' for i in range(6)]}")
                     # --- Check if any value is < 0.1V and trigger gain adjustment ---
                     if any(abs(v) < 0.1 for v in sorted_pulse_voltages):
@@ -1457,56 +1729,35 @@ class MainWindow(QWidget):
             # Update current wavelength based on total cycles processed
             wavelengths = ["700nm", "800nm", "850nm", "900nm", "970nm", "1050nm"]
             self.current_wavelength = wavelengths[self.wavelength_cycle_count % len(wavelengths)]
-            # Store cycle timestamp
-            self.cycle_timestamps.append(now)
-            # Calculate cycle interval
-            if len(self.cycle_timestamps) > 1:
-                interval = self.cycle_timestamps[-1] - self.cycle_timestamps[-2]
-                self.cycle_intervals.append(interval)
-                # Keep only last 100 intervals for statistics
-                if len(self.cycle_intervals) > 100:
-                    self.cycle_intervals.pop(0)
-            # Store cycle statistics
-            self.cycle_scores.append(pattern_result.get('score', 0))
-            self.cycle_qualities.append(pattern_result.get('quality', 0))
-            self.cycle_pulse_counts.append(pattern_result.get('pulse_count', 0))
-            # Calculate voltage statistics from the actual detected pulses, not the entire batch
+            # Store the cycle as one row of the cycle ring buffer
+            last_t = self._last_cycle_time()
+            row = self._cycles[self._ncycles % self.MAX_CYCLES]
+            # Calculate voltage statistics from the actual detected pulses, not the entire batch,
+            # writing them straight into the row's vstats
             if pattern_result.get('sorted_pulse_voltages'):
                 pulse_voltages = pattern_result['sorted_pulse_voltages']
-                self.cycle_voltage_stats.append({
-                    'mean': np.mean(pulse_voltages),
-                    'std': np.std(pulse_voltages),
-                    'min': np.min(pulse_voltages),
-                    'max': np.max(pulse_voltages),
-                    'high_samples': pattern_result.get('high_samples', 0),
-                    'pulse_voltages': pulse_voltages  # Store actual pulse voltages
-                })
+                cycle_stats(np.asarray(pulse_voltages), row['vstats'])
+                self.last_pulse_voltages = pulse_voltages  # Store actual pulse voltages
             else:
-                # Fallback to batch statistics if no pulse voltages available
-                self.cycle_voltage_stats.append({
-                    'mean': np.mean(voltages),
-                    'std': np.std(voltages),
-                    'min': np.min(voltages),
-                    'max': np.max(voltages),
-                    'high_samples': pattern_result.get('high_samples', 0)
-                })
-            # Keep only last 100 entries for each statistic
-            for stat_list in [self.cycle_scores, self.cycle_qualities, self.cycle_pulse_counts, self.cycle_voltage_stats]:
-                if len(stat_list) > 100:
-                    stat_list.pop(0)
+                # Fallback to the batch statistics detect_cycle_in_batch already computed
+                vs = pattern_result['voltage_stats']
+                row['vstats'] = (vs['mean'], vs['std'], vs['min'], vs['max'])
+            row['t'] = now
+            row['interval'] = (now - last_t) * 1e-9 if last_t is not None else np.nan
+            row['score'] = pattern_result.get('score', 0)
+            row['quality'] = pattern_result.get('quality', 0)
+            row['npulses'] = pattern_result.get('pulse_count', 0)
+            self._ncycles += 1
+            window = self._cycles_view(self.CYCLE_STATS_WINDOW)
             # Calculate current cycle rate
-            if len(self.cycle_intervals) > 0:
-                avg_interval = np.mean(self.cycle_intervals)
+            intervals = window['interval'][np.isfinite(window['interval'])]
+            if len(intervals) > 0:
+                avg_interval = np.mean(intervals)
                 current_cycle_rate = 1.0 / avg_interval if avg_interval > 0 else 0
-                self.cycle_rate_history.append(current_cycle_rate)
-                if len(self.cycle_rate_history) > 50:
-                    self.cycle_rate_history.pop(0)
+                self._trend_push(self.TREND_RATE, current_cycle_rate)
             # Calculate pattern quality trend
-            if len(self.cycle_qualities) > 0:
-                avg_quality = np.mean(self.cycle_qualities[-10:])  # Last 10 cycles
-                self.pattern_quality_history.append(avg_quality)
-                if len(self.pattern_quality_history) > 50:
-                    self.pattern_quality_history.pop(0)
+            avg_quality = np.mean(window['quality'][-10:])  # Last 10 cycles
+            self._trend_push(self.TREND_QUALITY, avg_quality)
             # Update consecutive cycles and lock status
             self.consecutive_cycles += 1
             if self.consecutive_cycles >= self.LOCK_THRESHOLD:
@@ -1514,7 +1765,7 @@ class MainWindow(QWidget):
                 # Don't show lock label anymore
             # Hide the status label if it was shown
             self.status_label.hide()
-            if self.verbose_checkbox.isChecked():
+            if verbose:
                 print(f"âœ“ Cycle #{self.total_cycles_detected} detected: score={pattern_result.get('score', 0):.3f}, "
                       f"quality={pattern_result.get('quality', 0):.3f}, pulses={pattern_result.get('pulse_count', 0)}")
                 print(f"  Processed {max_cycles_to_process} cycles from this batch")
@@ -1530,11 +1781,11 @@ class MainWindow(QWidget):
             # No pattern detected - reset consecutive cycles
             self.consecutive_cycles = 0
             self.is_locked = False
-            # Start the 3-second timer to show "NO PATTERN DETECTED" if no patterns are detected
+            # Show "NO PATTERN DETECTED" if no patterns are detected for 3 seconds
             if not self.pattern_detection_active:
-                self.no_pattern_timer.start(3000)  # 3 seconds
+                self._no_pattern_due = time.monotonic_ns() + self.NO_PATTERN_DELAY_NS
                 self.pattern_detection_active = True
-            if self.verbose_checkbox.isChecked():
+            if verbose:
                 print(f"âœ— No pattern detected in batch of {len(voltages)} samples")
                 print(f"  Continuous averaging: {avg_val:.4f}V")
             # DO NOT add to pattern-based sample buffer when no pattern is detected
@@ -1542,14 +1793,17 @@ class MainWindow(QWidget):
             # --- Auto-adjust gain if all voltages are below threshold and no pattern detected ---
             self.auto_adjust_gain(channel=0, voltage_batch=voltages, threshold_low=0.1, threshold_high=1.0)
 
-    def detect_cycle_in_batch(self, voltages):
+    def detect_cycle_in_batch(self, voltages, codes):
         """
         New algorithm to detect pulse patterns in a 20ms batch.
+        codes are the same samples as int16 ring-buffer codes; pulse edges are
+        found on them against the int16 threshold.
         Assumes voltage threshold > 100mV for pulses, < 100mV for no pulse.
         Groups multiple samples of the same pulse together.
         Sorts pulses to correct placement for wavelength assignment.
         """
         import numpy as np
+        verbose = self.verbose_checkbox.isChecked()
         
         # Expected pattern: 6 pulses representing 6 wavelengths (700nm, 800nm, 850nm, 900nm, 970nm, 1050nm)
         # Repeating at 256Hz = 1 cycle every ~3.9ms
@@ -1567,6 +1821,10 @@ class MainWindow(QWidget):
         sps = avg_sps
         samples_per_cycle = int(round(EXPECTED_CYCLE_DURATION_MS * (sps / 1000)))
 
+        # Batch mean, std, min and max in one pass
+        vstats = np.empty(4, dtype=np.float32)
+        cycle_stats(voltages, vstats)
+
         # Initialize result dictionary
         result = {
             'detected': False,
@@ -1577,203 +1835,103 @@ class MainWindow(QWidget):
             'pulse_width_ms': 0.0,
             'actual_sps': sps,
             'voltage_stats': {
-                'mean': np.mean(voltages),
-                'std': np.std(voltages),
-                'min': np.min(voltages),
-                'max': np.max(voltages)
+                'mean': float(vstats[0]),
+                'std': float(vstats[1]),
+                'min': float(vstats[2]),
+                'max': float(vstats[3])
             }
         }
 
         # Debug information
-        if self.verbose_checkbox.isChecked():
+        if verbose:
             print(f"\n--- New Pattern Detection Algorithm ---")
             print(f"Batch size: {len(voltages)} samples")
             print(f"Batch duration: {batch_duration_ms}ms")
             print(f"Calculated SPS from batch: {avg_sps:.1f}")
-            print(f"Voltage range: {min(voltages):.4f}V to {max(voltages):.4f}V")
-            print(f"Voltage mean: {np.mean(voltages):.4f}V, std: {np.std(voltages):.4f}V")
+            print(f"Voltage range: {vstats[2]:.4f}V to {vstats[3]:.4f}V")
+            print(f"Voltage mean: {vstats[0]:.4f}V, std: {vstats[1]:.4f}V")
             print(f"Voltage threshold: {VOLTAGE_THRESHOLD}V")
-            print(f"Samples above threshold: {sum(1 for v in voltages if v > VOLTAGE_THRESHOLD)}")
+            print(f"Samples above threshold: {np.count_nonzero(np.asarray(voltages) > VOLTAGE_THRESHOLD)}")
             print(f"Expected cycle frequency: {EXPECTED_CYCLE_FREQUENCY_HZ}Hz")
             print(f"Expected cycle duration: {EXPECTED_CYCLE_DURATION_MS:.3f}ms")
             print(f"Samples per cycle: {samples_per_cycle}")
 
         # Check if we have enough samples for at least one cycle
         if len(voltages) < samples_per_cycle:
-            if self.verbose_checkbox.isChecked():
+            if verbose:
                 print(f"Buffer too small: {len(voltages)} < {samples_per_cycle}")
             return result
 
         # --- New pulse detection algorithm ---
-        buf = np.array(voltages)
-        
-        # Step 1: Identify pulse and no-pulse regions
-        pulse_mask = buf > VOLTAGE_THRESHOLD
-        no_pulse_mask = buf <= VOLTAGE_THRESHOLD
-        
-        if self.verbose_checkbox.isChecked():
-            print(f"Pulse mask: {sum(pulse_mask)} samples above threshold")
-            print(f"No-pulse mask: {sum(no_pulse_mask)} samples below threshold")
-        
-        # Step 2: Find transitions between pulse and no-pulse regions
-        transitions = []
-        for i in range(1, len(pulse_mask)):
-            if pulse_mask[i] != pulse_mask[i-1]:
-                transitions.append(i)
-        
-        if self.verbose_checkbox.isChecked():
-            print(f"Found {len(transitions)} transitions")
-        
-        # Step 3: Group consecutive pulse samples into pulse clusters
-        pulse_clusters = []
-        current_cluster = []
-        in_pulse = False
-        
-        for i in range(len(buf)):
-            if pulse_mask[i]:  # Above threshold
-                if not in_pulse:
-                    # Start of new pulse
-                    current_cluster = [i]
-                    in_pulse = True
-                else:
-                    # Continue current pulse
-                    current_cluster.append(i)
-            else:  # Below threshold
-                if in_pulse:
-                    # End of pulse
-                    if len(current_cluster) > 0:
-                        pulse_clusters.append(current_cluster)
-                    current_cluster = []
-                    in_pulse = False
-        
-        # Handle case where batch ends with a pulse
-        if in_pulse and len(current_cluster) > 0:
-            pulse_clusters.append(current_cluster)
-        
-        if self.verbose_checkbox.isChecked():
+        buf = np.asarray(voltages)
+        
+        # Steps 1-3: Locate pulses as runs of samples above threshold
+        codes = np.ascontiguousarray(codes)
+        rises, falls, pulse_means = find_pulses(codes, self._thresh_i16)
+        # Every sample above threshold belongs to exactly one pulse
+        high_samples = int((falls - rises).sum())
+        
+        if verbose:
+            pulse_mask = codes > self._thresh_i16
+            print(f"Pulse mask: {high_samples} samples above threshold")
+            print(f"No-pulse mask: {len(buf) - high_samples} samples below threshold")
+            print(f"Found {np.count_nonzero(pulse_mask[1:] ^ pulse_mask[:-1])} transitions")
+        
+        pulse_means = pulse_means * self.RAW_LSB_V  # Mean codes back to volts
+        pulse_clusters = [range(start, end) for start, end in zip(rises.tolist(), falls.tolist())]
+        
+        # Step 4: Calculate pulse characteristics
+        pulse_center_times = ((rises + falls - 1) / 2 / sps * 1000).tolist()  # Convert to ms
+        pulse_widths = ((falls - rises - 1) / sps * 1000).tolist()  # Convert to ms
+        pulse_voltages = pulse_means.tolist()
+        
+        if verbose:
             print(f"Found {len(pulse_clusters)} pulse clusters")
             for i, cluster in enumerate(pulse_clusters):
                 cluster_start = cluster[0] / sps * 1000
                 cluster_end = cluster[-1] / sps * 1000
-                cluster_width = (cluster[-1] - cluster[0]) / sps * 1000
-                cluster_voltage = np.mean([buf[idx] for idx in cluster])
                 print(f"  Pulse {i+1}: {len(cluster)} samples, {cluster_start:.2f}ms-{cluster_end:.2f}ms, "
-                      f"width={cluster_width:.2f}ms, avg_voltage={cluster_voltage:.4f}V")
+                      f"width={pulse_widths[i]:.2f}ms, avg_voltage={pulse_voltages[i]:.4f}V")
         
-        # Step 4: Calculate pulse characteristics
-        pulse_center_times = []
-        pulse_widths = []
-        pulse_voltages = []
-        
-        for cluster in pulse_clusters:
-            center_idx = np.mean(cluster)
-            center_time = center_idx / sps * 1000  # Convert to ms
-            pulse_center_times.append(center_time)
-            
-            width = (cluster[-1] - cluster[0]) / sps * 1000  # Convert to ms
-            pulse_widths.append(width)
-            
-            voltage = np.mean([buf[idx] for idx in cluster])
-            pulse_voltages.append(voltage)
-        
-        if self.verbose_checkbox.isChecked():
+        if verbose:
             print(f"Pulse times: {[f'{t:.2f}ms' for t in pulse_center_times]}")
             print(f"Pulse widths: {[f'{w:.2f}ms' for w in pulse_widths]}")
             print(f"Pulse voltages: {[f'{v:.4f}V' for v in pulse_voltages]}")
         
-        # Step 5: Look for valid 6-pulse cycles
+        # Step 5: Score every window of 6 consecutive pulses (-1 marks a rejected window)
+        qualities = score_cycles(rises, falls, float(sps))
+        if verbose:
+            for start_idx in np.flatnonzero(qualities < 0).tolist():
+                print(f"  Cycle {start_idx}: REJECTED")
+        # Valid windows ordered by quality, best first (stable, so ties keep time order)
+        valid_idx = np.flatnonzero(qualities >= 0)
+        valid_idx = valid_idx[np.argsort(-qualities[valid_idx], kind='stable')]
         valid_cycles = []
         
-        # Try different starting points for 6-pulse sequences
-        for start_idx in range(len(pulse_center_times) - EXPECTED_PULSE_COUNT + 1):
-            # Get 6 consecutive pulses
-            cycle_pulses = pulse_center_times[start_idx:start_idx + EXPECTED_PULSE_COUNT]
-            cycle_widths = pulse_widths[start_idx:start_idx + EXPECTED_PULSE_COUNT]
-            cycle_clusters = pulse_clusters[start_idx:start_idx + EXPECTED_PULSE_COUNT]
-            
-            if len(cycle_pulses) != EXPECTED_PULSE_COUNT:
-                continue
+        for start_idx, quality_score in zip(valid_idx.tolist(), qualities[valid_idx].tolist()):
+            end_idx = start_idx + EXPECTED_PULSE_COUNT
+            cycle_pulses = pulse_center_times[start_idx:end_idx]
+            cycle_widths = pulse_widths[start_idx:end_idx]
+            cycle_clusters = pulse_clusters[start_idx:end_idx]
+            cycle_voltages = pulse_voltages[start_idx:end_idx]
             
-            # Calculate cycle characteristics
-            cycle_duration = cycle_pulses[-1] - cycle_pulses[0] + np.mean(cycle_widths)
-            avg_pulse_width = np.mean(cycle_widths)
+            if verbose:
+                print(f"  Cycle {start_idx}: VALID - Quality: {quality_score:.3f}")
             
-            # Calculate spacings between pulses
-            spacings = []
-            for i in range(1, len(cycle_pulses)):
-                spacing = cycle_pulses[i] - cycle_pulses[i-1]
-                spacings.append(spacing)
-            
-            avg_spacing = np.mean(spacings)
-            spacing_std = np.std(spacings)
-            
-            # Validation criteria
-            # 1. Cycle duration should be reasonable (2-6ms for 256Hz)
-            cycle_duration_ok = 2.0 <= cycle_duration <= 6.0
-            
-            # 2. Pulse widths should be reasonable (0.1-0.5ms)
-            pulse_width_ok = 0.1 <= avg_pulse_width <= 0.5
-            
-            # 3. Spacing should be reasonable (not too large gaps, not too small)
-            min_spacing = min(spacings) if spacings else 0
-            max_spacing = max(spacings) if spacings else 0
-            spacing_ok = 0.1 <= min_spacing <= 2.0 and 0.1 <= max_spacing <= 2.0
-            
-            # 4. Should have exactly 6 pulses
-            pulse_count_ok = len(cycle_pulses) == EXPECTED_PULSE_COUNT
-            
-            if self.verbose_checkbox.isChecked():
-                print(f"  Cycle {start_idx}: duration={cycle_duration:.2f}ms, width={avg_pulse_width:.2f}ms, "
-                      f"avg_spacing={avg_spacing:.2f}ms, spacing_range=[{min_spacing:.2f}-{max_spacing:.2f}]ms")
-                print(f"    Duration OK: {cycle_duration_ok}, Width OK: {pulse_width_ok}, "
-                      f"Spacing OK: {spacing_ok}, Count OK: {pulse_count_ok}")
-            
-            # Check if this cycle meets our criteria
-            if cycle_duration_ok and pulse_width_ok and spacing_ok and pulse_count_ok:
-                # Calculate quality score
-                duration_error = abs(cycle_duration - EXPECTED_CYCLE_DURATION_MS) / EXPECTED_CYCLE_DURATION_MS
-                width_error = abs(avg_pulse_width - 0.24) / 0.24  # Expected 0.24ms
-                
-                # Spacing consistency
-                spacing_consistency = 1.0 - (spacing_std / avg_spacing) if avg_spacing > 0 else 0.0
-                spacing_consistency = max(0, spacing_consistency)  # Clamp to 0-1
-                
-                # Overall quality (0-1, higher is better)
-                quality_score = max(0, 1 - (duration_error + width_error + (1 - spacing_consistency)) / 3)
-                
-                if self.verbose_checkbox.isChecked():
-                    print(f"    VALID - Quality: {quality_score:.3f} (duration_err={duration_error:.3f}, "
-                          f"width_err={width_error:.3f}, spacing_consistency={spacing_consistency:.3f})")
-                
-                # Sort the pulses by time to ensure proper wavelength assignment
-                pulse_data = list(zip(cycle_pulses, cycle_widths, cycle_clusters, pulse_voltages[start_idx:start_idx + EXPECTED_PULSE_COUNT]))
-                pulse_data.sort(key=lambda x: x[0])  # Sort by time
-                
-                # Extract sorted data
-                sorted_pulses = [p[0] for p in pulse_data]
-                sorted_widths = [p[1] for p in pulse_data]
-                sorted_clusters = [p[2] for p in pulse_data]
-                sorted_voltages = [p[3] for p in pulse_data]
-                
-                # Store this valid cycle with sorted data
-                valid_cycles.append({
-                    'start_idx': start_idx,
-                    'quality': quality_score,
-                    'pulses': cycle_pulses,
-                    'widths': cycle_widths,
-                    'clusters': cycle_clusters,
-                    'voltages': pulse_voltages[start_idx:start_idx + EXPECTED_PULSE_COUNT],
-                    'sorted_pulse_times': sorted_pulses,
-                    'sorted_pulse_widths': sorted_widths,
-                    'sorted_pulse_clusters': sorted_clusters,
-                    'sorted_pulse_voltages': sorted_voltages
-                })
-            else:
-                if self.verbose_checkbox.isChecked():
-                    print(f"    REJECTED")
-        
-        # Sort valid cycles by quality (best first)
-        valid_cycles.sort(key=lambda x: x['quality'], reverse=True)
+            # Pulses come out of find_pulses in time order, so they are already
+            # sorted for wavelength assignment
+            valid_cycles.append({
+                'start_idx': start_idx,
+                'quality': quality_score,
+                'pulses': cycle_pulses,
+                'widths': cycle_widths,
+                'clusters': cycle_clusters,
+                'voltages': cycle_voltages,
+                'sorted_pulse_times': cycle_pulses,
+                'sorted_pulse_widths': cycle_widths,
+                'sorted_pulse_clusters': cycle_clusters,
+                'sorted_pulse_voltages': cycle_voltages
+            })
         
         # Check if we found any valid cycles
         if valid_cycles:
@@ -1797,7 +1955,7 @@ class MainWindow(QWidget):
             result['quality'] = best_cycle_quality
             result['score'] = best_cycle_quality
             result['pulse_width_ms'] = np.mean(sorted_widths)
-            result['high_samples'] = sum(1 for v in voltages if v > VOLTAGE_THRESHOLD)
+            result['high_samples'] = high_samples
             
             # Add sorted pulse information for wavelength assignment
             result['sorted_pulse_times'] = sorted_pulses
@@ -1809,7 +1967,7 @@ class MainWindow(QWidget):
             result['total_valid_cycles'] = len(valid_cycles)
             result['all_valid_cycles'] = valid_cycles
             
-            if self.verbose_checkbox.isChecked():
+            if verbose:
                 print(f"âœ“ Found {len(valid_cycles)} valid cycles, using best one (start_idx={best_cycle_start})")
                 print(f"  Original cycle pulses: {[f'{t:.2f}ms' for t in cycle_pulses]}")
                 print(f"  Sorted cycle pulses: {[f'{t:.2f}ms' for t in sorted_pulses]}")
@@ -1819,7 +1977,7 @@ class MainWindow(QWidget):
                 print(f"  Quality score: {best_cycle_quality:.3f}")
                 print(f"  Pulse samples per cluster: {[len(cluster) for cluster in sorted_clusters]}")
             else:
-                if self.verbose_checkbox.isChecked():
+                if verbose:
                     print("âœ— No valid 6-pulse cycle found in batch")
                     print(f"  Total pulses found: {len(pulse_clusters)}")
                     print(f"  Expected: exactly {EXPECTED_PULSE_COUNT} pulses per cycle")
@@ -1829,101 +1987,150 @@ class MainWindow(QWidget):
                         print(f"  First 6 pulses: {[f'{t:.2f}ms' for t in pulse_center_times[:6]]}")
                         print(f"  First 6 spacings: {[f'{pulse_center_times[i] - pulse_center_times[i-1]:.2f}ms' for i in range(1, 6)]}")
             
-        if self.verbose_checkbox.isChecked():
+        if verbose:
             print("--- End New Algorithm ---\n")
         
         return result
 
+    def _cycles_view(self, n=None):
+        """Return the newest n rows (default: all stored) of the cycle ring buffer in time order"""
+        stored = min(self._ncycles, self.MAX_CYCLES)
+        count = stored if n is None else min(n, stored)
+        head = self._ncycles % self.MAX_CYCLES
+        start = head - count
+        if start >= 0:
+            return self._cycles[start:head]
+        return np.concatenate((self._cycles[start:], self._cycles[:head]))
+
+    def _last_cycle_time(self):
+        """Return the monotonic_ns timestamp of the most recent cycle, or None if none were detected"""
+        if self._ncycles == 0:
+            return None
+        return int(self._cycles['t'][(self._ncycles - 1) % self.MAX_CYCLES])
+
+    def _reset_trends(self):
+        """Clear the cycle rate and pattern quality trends"""
+        self._trend = np.empty((2, self.TREND_SIZE), dtype=np.float64)
+        self._trend_n = np.zeros(2, dtype=np.int64)
+
+    def _trend_push(self, k, v):
+        """Append v to trend row k, overwriting its oldest value once full"""
+        self._trend[k, self._trend_n[k] % self.TREND_SIZE] = v
+        self._trend_n[k] += 1
+
+    def _trend_recent(self, k, m):
+        """Return the newest m values (or fewer, if not yet stored) of trend row k"""
+        count = min(m, self._trend_n[k], self.TREND_SIZE)
+        head = self._trend_n[k] % self.TREND_SIZE
+        start = head - count
+        if start >= 0:
+            return self._trend[k, start:head]
+        return np.concatenate((self._trend[k, start:], self._trend[k, :head]))
+
+    def _reset_pulse_buffers(self):
+        """Create empty per-wavelength pulse buffers and their running prefix sums"""
+        self.sample_buffer = {param: deque(maxlen=self.PULSE_BUFFER_SIZE) for param in PARAMETERS}
+        # Running prefix sums of sample_buffer (leading 0.0) for O(1) rolling means;
+        # one longer than sample_buffer so the sum before its oldest pulse is kept
+        self._pulse_cumsum = {param: deque([0.0], maxlen=self.PULSE_BUFFER_SIZE + 1) for param in PARAMETERS}
+
+    def _reset_continuous_average(self):
+        """Clear the per-wavelength running sums used for continuous averaging, indexed like PARAMETERS"""
+        self._sum = np.zeros(len(PARAMETERS), dtype=np.float64)
+        self._n = np.zeros(len(PARAMETERS), dtype=np.int32)
+        self._window = [deque(maxlen=self.CONTINUOUS_WINDOW) for _ in PARAMETERS]
+
+    def _continuous_push(self, idx, v):
+        """Add a batch average to the rolling mean for wavelength index idx in O(1)"""
+        window = self._window[idx]
+        if len(window) == window.maxlen:
+            # Subtract the value the deque is about to evict
+            self._sum[idx] -= window[0]
+        window.append(v)
+        self._sum[idx] += v
+        self._n[idx] = len(window)
+
+    def _continuous_mean(self, idx):
+        """Return the rolling mean for wavelength index idx, or None if no samples yet"""
+        if self._n[idx] == 0:
+            return None
+        return float(self._sum[idx] / self._n[idx])
+
     def update_graph_from_buffer(self):
         # Compute average for each parameter and append to data arrays
         row = []
         
         # Check if we have recent pattern detections (within last 2 seconds)
-        current_time = time.time()
+        current_time = time.monotonic_ns()
         recent_pattern_detection = False
-        if hasattr(self, 'cycle_timestamps') and self.cycle_timestamps:
-            time_since_last_pattern = current_time - self.cycle_timestamps[-1]
+        last_cycle_time = self._last_cycle_time()
+        if last_cycle_time is not None:
+            time_since_last_pattern = (current_time - last_cycle_time) * 1e-9
             recent_pattern_detection = time_since_last_pattern < 2.0  # 2 second threshold
         
         # Clear old pattern data if no recent patterns detected (after 5 seconds)
-        if not recent_pattern_detection and hasattr(self, 'cycle_timestamps') and self.cycle_timestamps:
-            time_since_last_pattern = current_time - self.cycle_timestamps[-1]
+        if not recent_pattern_detection and last_cycle_time is not None:
             if time_since_last_pattern > 5.0:  # 5 second threshold to clear old data
                 for param in PARAMETERS:
                     if self.sample_buffer[param]:
                         old_count = len(self.sample_buffer[param])
-                        self.sample_buffer[param] = []  # Clear old pattern data
+                        self.sample_buffer[param].clear()  # Clear old pattern data
+                        self._pulse_cumsum[param].clear()
+                        self._pulse_cumsum[param].append(0.0)
                         if self.verbose_checkbox.isChecked() and old_count > 0:
                             print(f"  Cleared {old_count} old pattern samples for {param} (no recent patterns)")
         
-        for param in PARAMETERS:
+        for idx, param in enumerate(PARAMETERS):
             # Prioritize continuous data when no recent patterns detected
-            if not recent_pattern_detection and self.continuous_sample_buffer[param]:
+            if not recent_pattern_detection and self._n[idx]:
                 # Use continuous averaging data when no recent patterns
-                avg_val = float(np.mean(self.continuous_sample_buffer[param]))
-                self.data[param].append(avg_val)
+                avg_val = self._continuous_mean(idx)
                 row.append(avg_val)
                 if self.verbose_checkbox.isChecked():
                     print(f"  Using continuous data for {param}: {avg_val:.4f}V (no recent patterns)")
-                # Don't clear the continuous buffer immediately - let it accumulate more data
-                # Only clear if it gets too large (more than 100 samples)
-                if len(self.continuous_sample_buffer[param]) > 100:
-                    self.continuous_sample_buffer[param] = self.continuous_sample_buffer[param][-50:]  # Keep last 50 samples
             elif self.sample_buffer[param]:
                 # Use pattern-based data only when we have recent pattern detections
                 dynamic_window = self.get_dynamic_averaging_window()
-                # Average the recent pulse voltages for this wavelength
-                recent_pulses = self.sample_buffer[param][-dynamic_window:]  # Last N pulse values
-                avg_val = float(np.mean(recent_pulses))
-                self.data[param].append(avg_val)
+                # Average the last N pulse voltages for this wavelength as a
+                # difference of running prefix sums
+                recent_count = min(dynamic_window, len(self.sample_buffer[param]))
+                cumsum = self._pulse_cumsum[param]
+                avg_val = (cumsum[-1] - cumsum[-1 - recent_count]) / recent_count
                 row.append(avg_val)
                 if self.verbose_checkbox.isChecked():
-                    print(f"  Using averaged pulse data for {param}: {avg_val:.4f}V (from {len(recent_pulses)} pulses, window={dynamic_window})")
-            elif self.continuous_sample_buffer[param]:
+                    print(f"  Using averaged pulse data for {param}: {avg_val:.4f}V (from {recent_count} pulses, window={dynamic_window})")
+            elif self._n[idx]:
                 # Fallback to continuous averaging data
-                avg_val = float(np.mean(self.continuous_sample_buffer[param]))
-                self.data[param].append(avg_val)
+                avg_val = self._continuous_mean(idx)
                 row.append(avg_val)
                 if self.verbose_checkbox.isChecked():
-                    print(f"  Processing {len(self.continuous_sample_buffer[param])} continuous samples for {param}: avg={avg_val:.4f}V")
-                # Don't clear the continuous buffer immediately - let it accumulate more data
-                # Only clear if it gets too large (more than 100 samples)
-                if len(self.continuous_sample_buffer[param]) > 100:
-                    self.continuous_sample_buffer[param] = self.continuous_sample_buffer[param][-50:]  # Keep last 50 samples
+                    print(f"  Processing {self._n[idx]} continuous samples for {param}: avg={avg_val:.4f}V")
             else:
                 # No data available - try to get latest continuous data or use last known value
-                latest_continuous_val = None
-                if hasattr(self, 'continuous_sample_buffer') and self.continuous_sample_buffer[param]:
-                    latest_continuous_val = float(np.mean(self.continuous_sample_buffer[param]))
+                latest_continuous_val = self._continuous_mean(idx)
                 
                 if latest_continuous_val is not None:
                     # Use latest continuous data
-                    self.data[param].append(latest_continuous_val)
                     row.append(latest_continuous_val)
                     if self.verbose_checkbox.isChecked():
                         print(f"  Using latest continuous data for {param}: {latest_continuous_val:.4f}V")
-                elif self.data[param]:
+                elif self._hist_n:
                     # Use the last known value
-                    last_val = self.data[param][-1]
-                    self.data[param].append(last_val)
+                    last_val = float(self._data_hist[idx, self._hist_n - 1])
                     row.append(last_val)
                     if self.verbose_checkbox.isChecked():
                         print(f"  Using last known value for {param}: {last_val:.4f}V")
                 else:
                     # No previous data available, use latest avg_val from last batch if available
                     if hasattr(self, 'avg_val'):
-                        self.data[param].append(self.avg_val)
                         row.append(self.avg_val)
                     else:
-                        self.data[param].append(0.0)
                         row.append(0.0)
-        # Append new time point
-        if not self.t:
-            self.t.append(0)
-        else:
-            self.t.append(self.t[-1] + 1)
+        # Append the new time point and its row to the history
+        t = int(self._t_hist[self._hist_n - 1]) + 1 if self._hist_n else 0
+        self._history_append(t, row)
         # Log the new data point
-        self.log_data(self.t[-1], row)
+        self.log_data(t, row)
         # Display real-time cycle information
         if self.scanning and self.verbose_checkbox.isChecked():
             elapsed = time.time() - self.measure_start_time if self.measure_start_time else 0
@@ -1937,7 +2144,7 @@ class MainWindow(QWidget):
                   f"Data: {cycle_status} | Continuous: {self.continuous_wavelength_cycle}")
         
         # Ensure we always have some data to display, even after gain changes
-        if self.scanning and all(len(self.data[param]) == 0 for param in PARAMETERS):
+        if self.scanning and self._hist_n == 0:
             # If no data at all, try to get a fresh reading from ADC
             try:
                 if self.adc and hasattr(self.adc, 'read_data'):
@@ -1945,25 +2152,22 @@ class MainWindow(QWidget):
                     if fresh_data and len(fresh_data) > 0:
                         # Use the first channel data for all parameters temporarily
                         fresh_voltage = fresh_data[0]
-                        for param in PARAMETERS:
-                            self.data[param].append(fresh_voltage)
+                        self._history_append(0, [fresh_voltage] * len(PARAMETERS))
                         if self.verbose_checkbox.isChecked():
                             print(f"  Using fresh ADC reading for all parameters: {fresh_voltage:.4f}V")
             except Exception as e:
                 if self.verbose_checkbox.isChecked():
                     print(f"  Error getting fresh ADC reading: {e}")
         
-        self.update_graph()
+        self._schedule_redraw()
 
     def calibrate_current_values(self):
         # Capture the current value for each parameter
-        for param in PARAMETERS:
-            data_show = self.data[param][-self.buffer_size:]
-            if data_show:
-                self.calibrated_values[param] = data_show[-1]
-            else:
-                self.calibrated_values[param] = None
-        self.update_graph()
+        for j, param in enumerate(PARAMETERS):
+            cur_val = self._data_hist[j, self._hist_n - 1] if self._hist_n else np.nan
+            self.calibrated_values[param] = float(cur_val) if np.isfinite(cur_val) else None
+        self._update_log_calib()
+        self._schedule_redraw()
 
     def open_csv_file(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Open CSV File", "", "CSV Files (*.csv)")
@@ -1976,32 +2180,30 @@ class MainWindow(QWidget):
             # Expect header: Time, 700nm, 800nm, ...
             time_idx = header.index("Time") if "Time" in header else 0
             param_indices = {param: header.index(param) for param in PARAMETERS if param in header}
-            t = []
-            data = {param: [] for param in PARAMETERS}
+            self._reset_history()
             for row in reader:
                 try:
-                    t.append(float(row[time_idx]))
-                    for param in PARAMETERS:
-                        if param in param_indices:
-                            data[param].append(float(row[param_indices[param]]))
+                    t = float(row[time_idx])
+                    # Parameters missing from the file are stored as NaN
+                    values = [float(row[param_indices[param]]) if param in param_indices else np.nan
+                              for param in PARAMETERS]
                 except Exception:
                     continue
-        self.t = t
-        self.data = data
+                self._history_append(t, values)
         # Do not stop timers; allow new data to be appended and graph to scroll
-        self.update_graph()
+        self._schedule_redraw()
 
     def clear_data(self):
-        self.t = []
-        self.data = {param: [] for param in PARAMETERS}
+        self._reset_history()
         self.calibrated_values = {param: None for param in PARAMETERS}
+        self._update_log_calib()
         # Do not stop timers; allow new data to be appended and graph to scroll
-        self.update_graph()
+        self._schedule_redraw()
 
     def on_tab_changed(self, idx):
         # 0: NORMAL MODE, 1: ADVANCED MODE
         self.graph_stack.setCurrentIndex(1 if idx == 0 else 0)
-        self.update_graph()
+        self._schedule_redraw()
 
     def on_continuous_mode_changed(self, state):
         if not self.continuous_checkbox.isChecked() and self.scanning:
@@ -2045,6 +2247,9 @@ class MainWindow(QWidget):
         sys.stdout = sys.__stdout__
         sys.stderr = sys.__stderr__
 
+        # Write out any buffered log rows
+        self._close_logs()
+
         # Clean up GPIO on exit
         if self.gpio_available and self.power_line:
             try:
@@ -2056,15 +2261,7 @@ class MainWindow(QWidget):
             except Exception as e:
                 print(f"Error during GPIO cleanup: {e}")
 
-        # Clean up RPi.GPIO (used by ADS131M02 driver)
-        try:
-            import RPi.GPIO as GPIO
-            GPIO.cleanup()
-            print("RPi.GPIO cleanup completed")
-        except Exception as e:
-            print(f"Error during RPi.GPIO cleanup: {e}")
-
-        # Clean up ADC
+        # Clean up ADC (before RPi.GPIO so the driver can remove its DRDY event detect)
         if self.adc is not None:
             try:
                 if hasattr(self.adc, 'close') and callable(getattr(self.adc, 'close')):
@@ -2073,6 +2270,14 @@ class MainWindow(QWidget):
                     self.adc.cleanup()
             except Exception as e:
                 print(f"Error closing ADC: {e}")
+
+        # Clean up RPi.GPIO (used by ADS131M02 driver)
+        try:
+            import RPi.GPIO as GPIO
+            GPIO.cleanup()
+            print("RPi.GPIO cleanup completed")
+        except Exception as e:
+            print(f"Error during RPi.GPIO cleanup: {e}")
         
         event.accept()
         super().closeEvent(event)
@@ -2101,8 +2306,8 @@ class MainWindow(QWidget):
             # Removed lock_label.hide() since we don't have the lock label anymore
         else:
             # Check if we have recent cycle detections
-            if len(self.cycle_timestamps) > 0:
-                time_since_last_cycle = time.time() - self.cycle_timestamps[-1]
+            if self._ncycles > 0:
+                time_since_last_cycle = (time.monotonic_ns() - self._last_cycle_time()) * 1e-9
                 if time_since_last_cycle > 1.0:  # No cycles detected in last second
                     #self.status_label.setText(f"NO RECENT CYCLES ({time_since_last_cycle:.1f}s)")
                     #self.status_label.setStyleSheet("QLabel { color: orange; font-weight: bold; font-size: 18px; }")
@@ -2132,21 +2337,18 @@ class MainWindow(QWidget):
                 print(f"  Detection Rate:         {detection_rate:.2f} cycles/sec")
         
         # Recent detection status
-        if len(self.cycle_timestamps) > 0:
-            time_since_last = time.time() - self.cycle_timestamps[-1]
+        if self._ncycles > 0:
+            recent = self._cycles_view(10)  # Last 10 cycles
+            time_since_last = (time.monotonic_ns() - recent['t'][-1]) * 1e-9
             print(f"  Time Since Last Cycle:  {time_since_last:.2f} seconds")
             
             # Last 10 cycles timing
-            if len(self.cycle_timestamps) >= 10:
-                recent_times = self.cycle_timestamps[-10:]
-                recent_intervals = [recent_times[i] - recent_times[i-1] for i in range(1, len(recent_times))]
-                avg_recent_interval = np.mean(recent_intervals)
+            if len(recent) >= 10:
+                avg_recent_interval = np.mean(np.diff(recent['t'])) * 1e-9
                 print(f"  Avg Recent Interval:    {avg_recent_interval:.3f} seconds")
-        
-        # Detection quality
-        if len(self.cycle_qualities) > 0:
-            recent_quality = np.mean(self.cycle_qualities[-10:]) if len(self.cycle_qualities) >= 10 else np.mean(self.cycle_qualities)
-            print(f"  Recent Quality:         {recent_quality:.3f}")
+            
+            # Detection quality
+            print(f"  Recent Quality:         {np.mean(recent['quality']):.3f}")
         
         # Lock status
         print(f"  Pattern Lock:           {'LOCKED' if self.is_locked else 'UNLOCKED'}")
@@ -2155,6 +2357,7 @@ class MainWindow(QWidget):
         print("="*50)
 
     def on_new_console_text(self, text):
+        # Insert plain text at the end rather than append(), which adds a paragraph per call
         cursor = self.console_output.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
         cursor.insertText(text)
@@ -2328,12 +2531,11 @@ class MainWindow(QWidget):
 
     def get_dynamic_averaging_window(self):
         """Calculate dynamic averaging window based on recent cycle detection rate"""
-        current_time = time.time()
+        current_time = time.monotonic_ns()
         
         # Count cycles in the last second
-        if len(self.cycle_timestamps) > 0:
-            recent_cycles = [ts for ts in self.cycle_timestamps if current_time - ts <= 1.0]
-            cycles_in_last_second = len(recent_cycles)
+        if self._ncycles > 0:
+            cycles_in_last_second = int(np.count_nonzero(current_time - self._cycles_view()['t'] <= 1_000_000_000))
         else:
             cycles_in_last_second = 0
         
@@ -2354,7 +2556,7 @@ class MainWindow(QWidget):
         return dynamic_window
 
     def show_no_pattern_detected(self):
-        # This method is called when the no_pattern_timer times out
+        # Called from the scan tick once the no-pattern delay has elapsed
         self.status_label.setText("NO PATTERN DETECTED")
         self.status_label.setStyleSheet("QLabel { color: red; font-weight: bold; font-size: 18px; }")
         self.status_label.show()
@@ -2382,7 +2584,7 @@ class MainWindow(QWidget):
             if current_gain == gain_val:
                 current_gain_idx = i
                 break
-        if voltage_batch:
+        if voltage_batch is not None and len(voltage_batch) > 0:
             min_voltage = min(abs(v) for v in voltage_batch)
             max_voltage = max(abs(v) for v in voltage_batch)
             if is_verbose:
@@ -2401,7 +2603,8 @@ class MainWindow(QWidget):
                             print("Auto-gain: Cleared continuous sample buffer for fresh data")
                         else:
                             print(f"Auto-gain: Gain changed to {gain_values[current_gain_idx-1]}x (decreased)")
-                        self.continuous_sample_buffer = {param: [] for param in PARAMETERS}
+                        self._reset_continuous_average()
+                        self._update_log_gains()
                     except Exception as e:
                         if is_verbose:
                             print(f"Auto-gain: Error setting gain: {e}")
@@ -2422,7 +2625,8 @@ class MainWindow(QWidget):
                             print("Auto-gain: Cleared continuous sample buffer for fresh data")
                         else:
                             print(f"Auto-gain: Gain changed to {gain_values[current_gain_idx+1]}x (increased)")
-                        self.continuous_sample_buffer = {param: [] for param in PARAMETERS}
+                        self._reset_continuous_average()
+                        self._update_log_gains()
                     except Exception as e:
                         if is_verbose:
                             print(f"Auto-gain: Error setting gain: {e}")
@@ -0,0 +1,226 @@
+"""
+Pulse-pattern detection kernels for PulseSeer.
+
+The emitter drives 6 wavelength pulses per cycle at 256 Hz. These helpers find
+the runs of samples above the pulse threshold and score every window of 6
+consecutive pulses against the expected cycle timing. When Numba is installed
+the kernels are compiled; otherwise equivalent NumPy versions are used.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Expected pattern: 6 pulses per cycle, one cycle every ~3.9ms (256Hz)
+EXPECTED_PULSE_COUNT = 6
+EXPECTED_CYCLE_DURATION_MS = 1000.0 / 256.0
+EXPECTED_PULSE_WIDTH_MS = 0.24
+
+# Validation windows for a candidate cycle
+CYCLE_DURATION_RANGE_MS = (2.0, 6.0)
+PULSE_WIDTH_RANGE_MS = (0.1, 0.5)
+PULSE_SPACING_RANGE_MS = (0.1, 2.0)
+
+
+def _find_pulses_numpy(arr: np.ndarray, thresh: float):
+    """
+    Locate runs of samples above thresh with vectorized edge detection.
+    Returns (starts, ends, means): start index, exclusive end index and mean
+    voltage of each pulse.
+    """
+    arr = np.asarray(arr)
+    above = arr > thresh
+    # Pad with zeros so pulses touching either end of the batch still pair up
+    edges = np.diff(above.view(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if starts.size == 0:
+        return starts, ends, np.empty(0, dtype=np.float64)
+    # Sum each pulse with one reduceat over interleaved [start, end) bounds; the
+    # odd segments are the gaps between pulses. A pulse running to the end of
+    # the batch has end == len(arr), which reduceat does not accept, but as the
+    # last index its start alone already sums to the end
+    bounds = np.column_stack((starts, ends)).ravel()
+    if bounds[-1] == arr.shape[0]:
+        bounds = bounds[:-1]
+    sums = np.add.reduceat(arr, bounds, dtype=np.float64)[::2]
+    means = sums / (ends - starts)
+    return starts, ends, means
+
+
+def _score_cycles_numpy(starts: np.ndarray, ends: np.ndarray, sps: float) -> np.ndarray:
+    """
+    Score every window of EXPECTED_PULSE_COUNT consecutive pulses.
+    Returns one quality (0-1) per window start, or -1.0 where the window fails validation.
+    """
+    n = len(starts) - EXPECTED_PULSE_COUNT + 1
+    if n <= 0:
+        return np.empty(0, dtype=np.float64)
+    centers = (starts + ends - 1) / 2 / sps * 1000
+    widths = (ends - starts - 1) / sps * 1000
+
+    avg_width = sliding_window_view(widths, EXPECTED_PULSE_COUNT).mean(axis=1)
+    duration = centers[EXPECTED_PULSE_COUNT - 1:] - centers[:n] + avg_width
+    spacings = sliding_window_view(np.diff(centers), EXPECTED_PULSE_COUNT - 1)
+    avg_spacing = spacings.mean(axis=1)
+    spacing_std = spacings.std(axis=1)
+    min_spacing = spacings.min(axis=1)
+    max_spacing = spacings.max(axis=1)
+
+    ok = ((duration >= CYCLE_DURATION_RANGE_MS[0]) & (duration <= CYCLE_DURATION_RANGE_MS[1]) &
+          (avg_width >= PULSE_WIDTH_RANGE_MS[0]) & (avg_width <= PULSE_WIDTH_RANGE_MS[1]) &
+          (min_spacing >= PULSE_SPACING_RANGE_MS[0]) & (max_spacing <= PULSE_SPACING_RANGE_MS[1]))
+
+    duration_error = np.abs(duration - EXPECTED_CYCLE_DURATION_MS) / EXPECTED_CYCLE_DURATION_MS
+    width_error = np.abs(avg_width - EXPECTED_PULSE_WIDTH_MS) / EXPECTED_PULSE_WIDTH_MS
+    with np.errstate(divide='ignore', invalid='ignore'):
+        consistency = np.where(avg_spacing > 0, 1.0 - spacing_std / avg_spacing, 0.0)
+    consistency = np.maximum(consistency, 0.0)
+    quality = np.maximum(0.0, 1 - (duration_error + width_error + (1 - consistency)) / 3)
+    return np.where(ok, quality, -1.0)
+
+
+def _cycle_stats_numpy(values: np.ndarray, out: np.ndarray):
+    """Write [mean, std, vmin, vmax] of a cycle's voltages into out (float32[4])"""
+    values = np.asarray(values)
+    out[0] = values.mean()
+    out[1] = values.std()
+    out[2] = values.min()
+    out[3] = values.max()
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _cycle_stats_numba(values, out):
+        """Write [mean, std, vmin, vmax] of a cycle's voltages into out in a single pass"""
+        total = 0.0
+        total_sq = 0.0
+        vmin = values[0]
+        vmax = values[0]
+        for i in range(values.shape[0]):
+            v = values[i]
+            total += v
+            total_sq += v * v
+            if v < vmin:
+                vmin = v
+            if v > vmax:
+                vmax = v
+        mean = total / values.shape[0]
+        out[0] = mean
+        out[1] = np.sqrt(max(total_sq / values.shape[0] - mean * mean, 0.0))
+        out[2] = vmin
+        out[3] = vmax
+
+    @njit(cache=True)
+    def _find_pulses_numba(arr, thresh):
+        """
+        Locate runs of samples above thresh with a single-pass state machine.
+        Returns (starts, ends, means) like _find_pulses_numpy.
+        """
+        size = arr.shape[0]
+        starts = np.empty(size // 2 + 1, dtype=np.int64)
+        ends = np.empty(size // 2 + 1, dtype=np.int64)
+        means = np.empty(size // 2 + 1, dtype=np.float64)
+        n = 0
+        in_pulse = False
+        acc = 0.0
+        for i in range(size):
+            v = arr[i]
+            if v > thresh:
+                if not in_pulse:
+                    starts[n] = i
+                    acc = 0.0
+                    in_pulse = True
+                acc += v
+            elif in_pulse:
+                ends[n] = i
+                means[n] = acc / (i - starts[n])
+                n += 1
+                in_pulse = False
+        if in_pulse:
+            ends[n] = size
+            means[n] = acc / (size - starts[n])
+            n += 1
+        return starts[:n], ends[:n], means[:n]
+
+    @njit(cache=True)
+    def _score_cycles_numba(starts, ends, sps):
+        """
+        Score every window of EXPECTED_PULSE_COUNT consecutive pulses.
+        Returns one quality (0-1) per window start, or -1.0 where the window fails validation.
+        """
+        count = EXPECTED_PULSE_COUNT
+        n = starts.shape[0] - count + 1
+        if n <= 0:
+            return np.empty(0, dtype=np.float64)
+        qualities = np.empty(n, dtype=np.float64)
+        for k in range(n):
+            width_sum = 0.0
+            for j in range(k, k + count):
+                width_sum += (ends[j] - starts[j] - 1) / sps * 1000
+            avg_width = width_sum / count
+            first = (starts[k] + ends[k] - 1) / 2 / sps * 1000
+            last = (starts[k + count - 1] + ends[k + count - 1] - 1) / 2 / sps * 1000
+            duration = last - first + avg_width
+
+            # Spacing mean/min/max, then population std
+            prev = first
+            sp_sum = 0.0
+            sp_min = np.inf
+            sp_max = -np.inf
+            for j in range(k + 1, k + count):
+                center = (starts[j] + ends[j] - 1) / 2 / sps * 1000
+                sp = center - prev
+                prev = center
+                sp_sum += sp
+                sp_min = min(sp_min, sp)
+                sp_max = max(sp_max, sp)
+            avg_spacing = sp_sum / (count - 1)
+            prev = first
+            sp_var = 0.0
+            for j in range(k + 1, k + count):
+                center = (starts[j] + ends[j] - 1) / 2 / sps * 1000
+                d = center - prev - avg_spacing
+                prev = center
+                sp_var += d * d
+            spacing_std = np.sqrt(sp_var / (count - 1))
+
+            if not (CYCLE_DURATION_RANGE_MS[0] <= duration <= CYCLE_DURATION_RANGE_MS[1] and
+                    PULSE_WIDTH_RANGE_MS[0] <= avg_width <= PULSE_WIDTH_RANGE_MS[1] and
+                    sp_min >= PULSE_SPACING_RANGE_MS[0] and sp_max <= PULSE_SPACING_RANGE_MS[1]):
+                qualities[k] = -1.0
+                continue
+
+            duration_error = abs(duration - EXPECTED_CYCLE_DURATION_MS) / EXPECTED_CYCLE_DURATION_MS
+            width_error = abs(avg_width - EXPECTED_PULSE_WIDTH_MS) / EXPECTED_PULSE_WIDTH_MS
+            consistency = 1.0 - spacing_std / avg_spacing if avg_spacing > 0 else 0.0
+            consistency = max(0.0, consistency)
+            qualities[k] = max(0.0, 1 - (duration_error + width_error + (1 - consistency)) / 3)
+        return qualities
+
+    find_pulses = _find_pulses_numba
+    score_cycles = _score_cycles_numba
+    cycle_stats = _cycle_stats_numba
+else:
+    find_pulses = _find_pulses_numpy
+    score_cycles = _score_cycles_numpy
+    cycle_stats = _cycle_stats_numpy
+
+
+def warm_up():
+    """
+    Compile the kernels for the types PulseSeer uses (int16 codes, float32 volts)
+    so the first scan batch does not pay the JIT cost. Without Numba this just
+    runs the NumPy versions once.
+    """
+    codes = np.zeros(64, dtype=np.int16)
+    codes[::8] = 1000
+    starts, ends, _ = find_pulses(codes, 500)
+    score_cycles(starts, ends, 10000.0)
+    cycle_stats(codes.astype(np.float32), np.empty(4, dtype=np.float32))